@@ -0,0 +1 @@
+"""Shared tooling to run, time and analyse the Python Advent of Code solutions."""
@@ -0,0 +1,283 @@
+"""Assembunny virtual machine, shared by the 2016 days 12, 23 and 25.
+
+Instructions are decoded once into integer opcodes and register indices. `run`
+compiles straight-line blocks into generated Python functions, keyed by the
+program and their entry address, so that machines running the same program
+share them, and fuses the addition and multiplication loops found in the
+puzzle inputs. `step` interprets a single instruction, without any fusing.
+"""
+
+import functools
+import re
+from collections.abc import Sequence
+from typing import NamedTuple
+
+REGISTERS = "abcd"
+
+CPY = 0
+INC = 1
+DEC = 2
+JNZ = 3
+TGL = 4
+OUT = 5
+
+OPCODES = {"cpy": CPY, "inc": INC, "dec": DEC, "jnz": JNZ, "tgl": TGL, "out": OUT}
+TOGGLED = {CPY: JNZ, JNZ: CPY, INC: DEC, DEC: INC, TGL: INC, OUT: INC}
+
+INSTRUCTION_PATTERN = re.compile(r"(cpy|inc|dec|jnz|tgl|out) (\S+)(?: (\S+))?")
+
+
+class Operand(NamedTuple):
+    register: int | None  # Index in the register file, None for an immediate
+    value: int = 0
+
+    def source(self) -> str:
+        if self.register is None:
+            return str(self.value)
+        return REGISTERS[self.register]
+
+
+class Instruction(NamedTuple):
+    opcode: int
+    x: Operand
+    y: Operand | None = None
+
+
+def parse_operand(raw: str) -> Operand:
+    if raw in REGISTERS:
+        return Operand(REGISTERS.index(raw))
+    return Operand(None, int(raw))
+
+
+def parse_program(source: str) -> list[Instruction]:
+    instructions = []
+    for raw_line in source.splitlines():
+        line = raw_line.strip()
+        if not line:
+            continue
+        match = INSTRUCTION_PATTERN.fullmatch(line)
+        if match is None:
+            raise ValueError(f"Invalid instruction: {line}")
+        opcode, x, y = match.groups()
+        instructions.append(
+            Instruction(
+                OPCODES[opcode], parse_operand(x), parse_operand(y) if y else None
+            )
+        )
+    return instructions
+
+
+def match_add(program: Sequence[Instruction], idx: int) -> tuple[str, str] | None:
+    """`inc X, dec Y, jnz Y -2`, in any order of the first two: X += Y, Y = 0."""
+    window = program[idx : idx + 3]
+    if len(window) < 3 or {window[0].opcode, window[1].opcode} != {INC, DEC}:
+        return None
+    inc, dec = window[:2] if window[0].opcode == INC else window[1::-1]
+    jnz = window[2]
+    if (
+        jnz.opcode != JNZ
+        or jnz.y != Operand(None, -2)
+        or inc.x.register is None
+        or dec.x.register is None
+        or jnz.x != dec.x
+        or inc.x == dec.x
+    ):
+        return None
+    return inc.x.source(), dec.x.source()
+
+
+def match_mul(program: Sequence[Instruction], idx: int) -> tuple[str, ...] | None:
+    """`cpy F B, <add loop into P draining B>, dec G, jnz G -5`: P += F * G."""
+    window = program[idx : idx + 6]
+    if len(window) < 6 or window[0].opcode != CPY:
+        return None
+    add = match_add(program, idx + 1)
+    if add is None:
+        return None
+    product, buffer = add
+    cpy, dec, jnz = window[0], window[4], window[5]
+    factor = dec.x.source()
+    if (
+        cpy.y.register is None
+        or cpy.y.source() != buffer
+        or dec.opcode != DEC
+        or dec.x.register is None
+        or jnz.opcode != JNZ
+        or jnz.x != dec.x
+        or jnz.y != Operand(None, -5)
+        or factor in (product, buffer)
+        or cpy.x.source() in (product, factor)
+    ):
+        return None
+    return product, buffer, cpy.x.source(), factor
+
+
+STORE = "    r[0], r[1], r[2], r[3] = a, b, c, d"
+
+
+def get_add_loop(target: str, source: str) -> list[str]:
+    """The add loop as written, which only ends once `source` wraps to 0 when it
+    does not start positive."""
+    return [
+        "    while True:",
+        f"        {target} += 1",
+        f"        {source} -= 1",
+        f"        if not {source}:",
+        "            break",
+    ]
+
+
+def indent(lines: list[str], width: int) -> list[str]:
+    return [" " * width + line for line in lines]
+
+
+def compile_block(program: tuple[Instruction, ...], entry: int):
+    """Generate a function running the instructions from `entry` until a jump
+    is taken, a `tgl` or `out` is reached, or the program ends.
+
+    The function takes the register file and returns the next address.
+    """
+    lines = ["def block(r):", "    a, b, c, d = r"]
+    idx = entry
+    jumped = False
+    while idx < len(program):
+        if mul := match_mul(program, idx):
+            product, buffer, factor_a, factor_b = mul
+            lines += [
+                f"    if {factor_a} > 0 and {factor_b} > 0:",
+                f"        {product} += {factor_a} * {factor_b}",
+                f"        {buffer} = 0",
+                f"        {factor_b} = 0",
+                "    else:",
+                "        while True:",
+                f"            {buffer} = {factor_a}",
+                *indent(get_add_loop(product, buffer), 8),
+                f"            {factor_b} -= 1",
+                f"            if not {factor_b}:",
+                "                break",
+            ]
+            idx += 6
+            continue
+        if add := match_add(program, idx):
+            target, source = add
+            lines += [
+                f"    if {source} > 0:",
+                f"        {target} += {source}",
+                f"        {source} = 0",
+                "    else:",
+                *indent(get_add_loop(target, source), 4),
+            ]
+            idx += 3
+            continue
+
+        opcode, x, y = program[idx]
+        if opcode in (TGL, OUT):
+            break
+        if opcode == CPY and y.register is not None:
+            lines.append(f"    {y.source()} = {x.source()}")
+        elif opcode == INC and x.register is not None:
+            lines.append(f"    {x.source()} += 1")
+        elif opcode == DEC and x.register is not None:
+            lines.append(f"    {x.source()} -= 1")
+        elif opcode == JNZ:
+            target = f"{idx} + {y.source()}"
+            if x.register is None and x.value != 0:
+                lines += [STORE, f"    return {target}"]
+                jumped = True
+                break
+            if x.register is not None:
+                lines += [
+                    f"    if {x.source()}:",
+                    f"    {STORE}",
+                    f"        return {target}",
+                ]
+        idx += 1
+    if not jumped:
+        lines += [STORE, f"    return {idx}"]
+
+    namespace = {}
+    exec(compile("\n".join(lines), f"<assembunny block {entry}>", "exec"), namespace)
+    return namespace["block"]
+
+
+@functools.lru_cache(maxsize=64)
+def get_blocks(program: tuple[Instruction, ...]) -> list:
+    """The compiled blocks of a program by entry address, filled in as they are
+    reached, and shared by every machine running the same program."""
+    return [None] * len(program)
+
+
+class Machine:
+    def __init__(self, program: list[Instruction]):
+        self.program = list(program)
+        self.registers = [0, 0, 0, 0]
+        self.ip = 0
+        self.last_output: int | None = None
+        self._blocks = get_blocks(tuple(self.program))
+
+    def __getitem__(self, register: str) -> int:
+        return self.registers[REGISTERS.index(register)]
+
+    def __setitem__(self, register: str, value: int) -> None:
+        self.registers[REGISTERS.index(register)] = value
+
+    def get_state(self) -> tuple[int, ...]:
+        return self.ip, *self.registers
+
+    def value(self, operand: Operand) -> int:
+        if operand.register is None:
+            return operand.value
+        return self.registers[operand.register]
+
+    def is_halted(self) -> bool:
+        return not 0 <= self.ip < len(self.program)
+
+    def toggle(self, idx: int) -> None:
+        if 0 <= idx < len(self.program):
+            opcode, x, y = self.program[idx]
+            self.program[idx] = Instruction(TOGGLED[opcode], x, y)
+            self._blocks = get_blocks(tuple(self.program))
+
+    def step(self) -> bool:
+        """Execute a single instruction; return False if halted"""
+        if self.is_halted():
+            return False
+        opcode, x, y = self.program[self.ip]
+        registers = self.registers
+        if opcode == CPY and y.register is not None:
+            registers[y.register] = self.value(x)
+        elif opcode == INC and x.register is not None:
+            registers[x.register] += 1
+        elif opcode == DEC and x.register is not None:
+            registers[x.register] -= 1
+        elif opcode == JNZ and self.value(x) != 0:
+            self.ip += self.value(y)
+            return True
+        elif opcode == TGL:
+            self.toggle(self.ip + self.value(x))
+        elif opcode == OUT:
+            self.last_output = self.value(x)
+        self.ip += 1
+        return True
+
+    def run(self) -> int | None:
+        """Run until the next `out`, returning its value, or None once halted."""
+        registers = self.registers
+        ip = self.ip
+        while 0 <= ip < len(self.program):
+            opcode, x, _ = self.program[ip]
+            if opcode == OUT:
+                self.ip = ip + 1
+                self.last_output = self.value(x)
+                return self.last_output
+            if opcode == TGL:
+                self.toggle(ip + self.value(x))
+                ip += 1
+                continue
+            block = self._blocks[ip]
+            if block is None:
+                program = tuple(self.program)
+                block = self._blocks[ip] = compile_block(program, ip)
+            ip = block(registers)
+        self.ip = ip
+        return None
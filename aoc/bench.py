@@ -0,0 +1,148 @@
+import json
+import math
+import platform
+import statistics
+import subprocess
+import time
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+
+from aoc.days import (
+    PARTS,
+    ROOT,
+    STATE_DIR,
+    Day,
+    get_parser,
+    get_solver,
+    load_module,
+    solve,
+)
+
+BASELINE_FILE = STATE_DIR / "baseline.json"
+
+# Two-sided 95% confidence
+Z_SCORE = 1.96
+
+
+@dataclass
+class Summary:
+    median: float
+    ci_low: float
+    ci_high: float
+    samples: int
+
+    @classmethod
+    def from_samples(cls, samples: list[float]) -> "Summary":
+        """Distribution-free confidence interval of the median, from ranks."""
+        ordered = sorted(samples)
+        n = len(ordered)
+        spread = Z_SCORE * math.sqrt(n) / 2
+        low = max(math.floor(n / 2 - spread), 0)
+        high = min(math.ceil(n / 2 + spread), n - 1)
+        return cls(statistics.median(ordered), ordered[low], ordered[high], n)
+
+
+@dataclass
+class Regression:
+    key: str
+    baseline: Summary
+    current: Summary
+
+    @property
+    def ratio(self) -> float:
+        return self.current.median / self.baseline.median
+
+
+def get_key(day: Day, part: int) -> str:
+    return f"{day.name}/part_{part}"
+
+
+def sample_part(day: Day, part: int, warmup: int, samples: int) -> list[float] | None:
+    """Time `samples` runs of a part's solver, each on a freshly parsed input."""
+    module = load_module(day)
+    solver = get_solver(module, part)
+    if solver is None:
+        return None
+    parser = get_parser(module, part)
+    input_path = str(day.input_path(part))
+
+    timings = []
+    for iteration in range(warmup + samples):
+        data = parser(input_path)
+        start = time.perf_counter()
+        solve(solver, data)
+        elapsed = time.perf_counter() - start
+        if iteration >= warmup:
+            timings.append(elapsed)
+    return timings
+
+
+def benchmark(
+    days: Iterable[Day], warmup: int, samples: int
+) -> tuple[dict[str, Summary], dict[str, str]]:
+    results = {}
+    errors = {}
+    for day in days:
+        for part in PARTS:
+            key = get_key(day, part)
+            try:
+                timings = sample_part(day, part, warmup, samples)
+            except Exception as e:
+                errors[key] = f"{type(e).__name__}: {e}"
+                continue
+            if timings is not None:
+                results[key] = Summary.from_samples(timings)
+    return results, errors
+
+
+def get_revision() -> str | None:
+    try:
+        output = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return output.stdout.strip()
+
+
+def load_results(path: Path) -> dict[str, Summary]:
+    try:
+        content = json.loads(path.read_text())
+    except FileNotFoundError:
+        return {}
+    return {key: Summary(**value) for key, value in content["results"].items()}
+
+
+def save_results(path: Path, results: dict[str, Summary]) -> None:
+    """Merge `results` into the file, keeping entries of days not benchmarked."""
+    merged = load_results(path) | results
+    content = {
+        "revision": get_revision(),
+        "timestamp": datetime.now(UTC).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "results": {key: asdict(merged[key]) for key in sorted(merged)},
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(content, indent=2))
+
+
+def find_regressions(
+    baseline: dict[str, Summary], current: dict[str, Summary], threshold: float
+) -> list[Regression]:
+    """A part regresses when its median grew by more than `threshold`, and the
+    confidence intervals do not overlap, so that noisy parts are not flagged."""
+    regressions = []
+    for key, summary in current.items():
+        reference = baseline.get(key)
+        if reference is None or reference.median == 0:
+            continue
+        regression = Regression(key, reference, summary)
+        if regression.ratio > 1 + threshold and summary.ci_low > reference.ci_high:
+            regressions.append(regression)
+    return regressions
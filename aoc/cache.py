@@ -0,0 +1,133 @@
+import hashlib
+import os
+import pickle
+import sys
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+from aoc.days import STATE_DIR
+
+CACHE_DIR = STATE_DIR / "parse_cache"
+ANSWERS_DIR = STATE_DIR / "answers"
+DEFAULT_MAX_SIZE = 256 * 1024 * 1024
+
+
+def get_shared_modules(module: ModuleType) -> list[ModuleType]:
+    """The `aoc` package modules a day module uses, directly or not."""
+    found = {}
+    pending = [module]
+    while pending:
+        current = pending.pop()
+        for value in vars(current).values():
+            name = value.__name__ if isinstance(value, ModuleType) else None
+            name = name or getattr(value, "__module__", None)
+            if (
+                isinstance(name, str)
+                and name.startswith("aoc.")
+                and name not in found
+                and (shared := sys.modules.get(name)) is not None
+            ):
+                found[name] = shared
+                pending.append(shared)
+    return [found[name] for name in sorted(found)]
+
+
+def get_source_digest(module: ModuleType) -> bytes:
+    """Hash of the source of a day module, and of the shared code it uses."""
+    digest = hashlib.sha256(Path(module.__file__).read_bytes())
+    for shared in get_shared_modules(module):
+        digest.update(Path(shared.__file__).read_bytes())
+    return digest.digest()
+
+
+def write_atomically(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_suffix(f".{os.getpid()}.tmp")
+    temporary.write_bytes(data)
+    temporary.replace(path)
+
+
+@dataclass(frozen=True)
+class ParseCache:
+    """Pickled `parse_input` results, keyed by the input bytes and the module source.
+
+    Hashing the whole module rather than only the parser also invalidates entries
+    when a class the parser builds is modified, and so does a change to the shared
+    `aoc` modules it uses. Entries are evicted in least recently used order once
+    the directory grows over `max_size` bytes.
+    """
+
+    directory: Path = CACHE_DIR
+    max_size: int = DEFAULT_MAX_SIZE
+
+    def get_key(self, parser: Callable[[str], Any], input_path: str) -> str:
+        digest = hashlib.sha256()
+        digest.update(f"{sys.version_info[:2]}:{parser.__qualname__}".encode())
+        digest.update(get_source_digest(sys.modules[parser.__module__]))
+        digest.update(Path(input_path).read_bytes())
+        return digest.hexdigest()
+
+    def parse(self, parser: Callable[[str], Any], input_path: str) -> Any:
+        entry = self.directory / f"{self.get_key(parser, input_path)}.pickle"
+        try:
+            data = pickle.loads(entry.read_bytes())
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+            pass
+        else:
+            # Refresh the modification time, which is the LRU order
+            entry.touch()
+            return data
+
+        data = parser(input_path)
+        try:
+            # Pickle right away, before a solver gets a chance to mutate `data`
+            serialized = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, AttributeError, TypeError):
+            # Not picklable, such as a defaultdict with a lambda factory
+            return data
+        write_atomically(entry, serialized)
+        self.evict()
+        return data
+
+    def evict(self) -> None:
+        entries = []
+        for entry in self.directory.glob("*.pickle"):
+            try:
+                entries.append((entry.stat(), entry))
+            except FileNotFoundError:
+                continue
+        total_size = sum(stat.st_size for stat, _ in entries)
+        for stat, entry in sorted(entries, key=lambda e: e[0].st_mtime):
+            if total_size <= self.max_size:
+                break
+            entry.unlink(missing_ok=True)
+            total_size -= stat.st_size
+
+
+@dataclass(frozen=True)
+class AnswerStore:
+    """Answers of the parts, keyed by the module source, the input and the part.
+
+    Any edit to a day module, or to the shared code it uses, changes the key, so
+    stale answers are never returned.
+    """
+
+    directory: Path = ANSWERS_DIR
+
+    def get_path(self, module: ModuleType, input_path: Path, part: int) -> Path:
+        digest = hashlib.sha256(get_source_digest(module))
+        digest.update(input_path.read_bytes())
+        digest.update(str(part).encode())
+        return self.directory / f"{digest.hexdigest()}.txt"
+
+    def get(self, module: ModuleType, input_path: Path, part: int) -> str | None:
+        try:
+            return self.get_path(module, input_path, part).read_text()
+        except FileNotFoundError:
+            return None
+
+    def put(self, module: ModuleType, input_path: Path, part: int, answer: str) -> None:
+        write_atomically(self.get_path(module, input_path, part), answer.encode())
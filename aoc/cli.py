@@ -0,0 +1,608 @@
+import argparse
+import sys
+import time
+from collections import Counter
+from collections.abc import Iterator
+from pathlib import Path
+
+from aoc import bench, manifest, report, sandbox, scaling, service, warm, watch
+from aoc.cache import CACHE_DIR, DEFAULT_MAX_SIZE, AnswerStore, ParseCache
+from aoc.days import ROOT, Day, discover
+from aoc.profiling import PHASES, PROFILE_DIR, get_hotspots, get_profile_path
+from aoc.resources import Resources
+from aoc.runner import (
+    BACKENDS,
+    DayResult,
+    PartResult,
+    RunOptions,
+    resolve_backend,
+    run_days,
+    save_timings,
+)
+from aoc.sandbox import Limits
+
+
+def select_days(years: list[int], days: list[int] | None) -> list[Day]:
+    selected = []
+    for year in years:
+        available = discover(year)
+        if not available:
+            sys.exit(f"No Python solutions found for year {year}")
+        if days is None:
+            selected += available
+            continue
+        for day in days:
+            if Day(year, day) not in available:
+                sys.exit(f"No solution found for {year} day {day:02d}")
+            selected.append(Day(year, day))
+    return selected
+
+
+def format_size(size: int) -> str:
+    if size < 1024 * 1024:
+        return f"{size / 1024:.1f} KiB"
+    return f"{size / (1024 * 1024):.1f} MiB"
+
+
+def format_resources(resources: Resources) -> str:
+    line = (
+        f"cpu user {resources.user:.2f} s, sys {resources.system:.2f} s, "
+        f"peak rss +{format_size(resources.peak_rss)}"
+    )
+    if resources.traced_peak is not None:
+        line += f", traced peak {format_size(resources.traced_peak)}"
+    return line
+
+
+def format_part(result: PartResult, show_resources: bool = False) -> str:
+    timings = (
+        f"parse {result.parse.wall * 1000:9.2f} ms, "
+        f"solve {result.solve.wall * 1000:9.2f} ms wall "
+        f"/ {result.solve.cpu * 1000:9.2f} ms cpu"
+    )
+    if result.memoized:
+        timings = "memoized".ljust(len(timings))
+    answer = f"ERROR {result.error}" if result.error else result.answer
+    resources = ""
+    if show_resources:
+        resources = f"\n          {format_resources(result.resources)}"
+    if "\n" in answer:
+        return f"  part {result.part}  {timings}{resources}\n{answer.strip()}"
+    return f"  part {result.part}  {timings}  {answer}{resources}"
+
+
+def print_day(result: DayResult, show_resources: bool = False) -> None:
+    print(f"{result.day.name}  ({result.wall * 1000:.2f} ms)")
+    for part in result.parts:
+        print(format_part(part, show_resources))
+
+
+def print_hotspots(result: DayResult, top: int) -> None:
+    for part in result.parts:
+        for phase in PHASES:
+            path = get_profile_path(PROFILE_DIR / result.day.name, part.part, phase)
+            if not path.exists():
+                continue
+            print(f"    part {part.part} {phase} hotspots ({path.relative_to(ROOT)})")
+            for hotspot in get_hotspots(path, top):
+                print(
+                    f"      {hotspot.own_time * 1000:9.2f} ms own "
+                    f"{hotspot.total_time * 1000:9.2f} ms total "
+                    f"{hotspot.calls:>9} calls  {hotspot.function}"
+                )
+
+
+def format_delta(previous: PartResult, current: PartResult) -> str:
+    before = previous.parse.wall + previous.solve.wall
+    after = current.parse.wall + current.solve.wall
+    line = (
+        f"  part {current.part}  "
+        f"parse {(current.parse.wall - previous.parse.wall) * 1000:+9.2f} ms, "
+        f"solve {(current.solve.wall - previous.solve.wall) * 1000:+9.2f} ms"
+    )
+    if before > 0:
+        line += f"  x{after / before:.2f}"
+    if current.answer != previous.answer:
+        line += f"  answer was {previous.answer}"
+    return line
+
+
+def get_limits(args: argparse.Namespace) -> Limits | None:
+    if args.timeout is None and args.memory_limit is None:
+        return None
+    memory = None if args.memory_limit is None else args.memory_limit * 1024 * 1024
+    return Limits(args.timeout, memory)
+
+
+def start_days(
+    days: list[Day], args: argparse.Namespace, options: RunOptions | None = None
+) -> Iterator[DayResult]:
+    options = options or RunOptions()
+    limits = get_limits(args)
+    if args.warm:
+        return warm.run_days(days, args.jobs, options, limits)
+    if limits is not None:
+        return sandbox.run_days(days, args.jobs, options, limits)
+    return run_days(days, args.jobs, options, args.backend)
+
+
+def run(args: argparse.Namespace) -> int:
+    days = select_days(args.year, None if args.all else args.day)
+    parse_cache = None
+    if args.parse_cache:
+        parse_cache = ParseCache(CACHE_DIR, args.parse_cache_size * 1024 * 1024)
+    options = RunOptions(
+        parse_cache=parse_cache,
+        answers=AnswerStore() if args.memoize else None,
+        profile_dir=PROFILE_DIR if args.profile else None,
+        trace_memory=args.resources,
+        day_jobs=args.day_jobs,
+    )
+    start = time.perf_counter()
+    results = []
+    for result in start_days(days, args, options):
+        print_day(result, args.resources)
+        if args.profile:
+            print_hotspots(result, args.top)
+        results.append(result)
+    elapsed = time.perf_counter() - start
+    save_timings(results)
+    if not args.profile and not args.resources:  # Both slow the solvers down
+        report.append_history(results)
+
+    cpu = sum(p.parse.cpu + p.solve.cpu for r in results for p in r.parts)
+    failed = [r.day.name for r in results if r.failed]
+    print(f"\n{len(results)} days in {elapsed:.2f} s wall, {cpu:.2f} s cpu", end="")
+    if args.warm:
+        print(", forked from a warm server", end="")
+    elif get_limits(args) is not None:
+        print(", sandboxed process workers", end="")
+    elif args.jobs != 1:
+        print(f", {resolve_backend(args.backend, options, days)} workers", end="")
+    print()
+    if failed:
+        print(f"Failed: {', '.join(sorted(failed))}")
+        return 1
+    return 0
+
+
+def run_watch(args: argparse.Namespace) -> int:
+    days = select_days(args.year, None if args.all else args.day)
+    worker = watch.Worker(days)
+    # Last successful run of every part, by day
+    previous: dict[Day, dict[int, PartResult]] = {day: {} for day in days}
+
+    def run_and_compare(day: Day, reload: bool) -> None:
+        result = worker.run(day, reload)
+        print_day(result)
+        parts = [part for part in result.parts if not part.error]
+        deltas = [
+            format_delta(previous[day][part.part], part)
+            for part in parts
+            if part.part in previous[day]
+        ]
+        if deltas:
+            print("  since the previous run", *deltas, sep="\n")
+        previous[day].update((part.part, part) for part in parts)
+
+    snapshot = watch.take_snapshot(days)
+    try:
+        for day in days:  # Warms the parse cache up, and sets the reference
+            run_and_compare(day, reload=False)
+        print(f"\nWatching {len(days)} days every {args.interval:g} s")
+        while True:
+            time.sleep(args.interval)
+            current = watch.take_snapshot(days)
+            if watch.has_shared_changes(snapshot, current):
+                print("\nThe aoc package changed, restarting the worker")
+                worker.restart()
+                changes = dict.fromkeys(days, False)
+            else:
+                changes = watch.get_changes(days, snapshot, current)
+            for day, reload in changes.items():
+                print()
+                run_and_compare(day, reload)
+            snapshot = current
+    except KeyboardInterrupt:
+        pass
+    finally:
+        worker.close()
+    return 0
+
+
+def run_verify(args: argparse.Namespace) -> int:
+    days = select_days(args.year, None if args.all else args.day)
+    manifests = {year: manifest.load_manifest(year) for year in args.year}
+    results = []
+    checks = []
+    for result in start_days(days, args):
+        results.append(result)
+        for day_check in manifest.check(result, manifests[result.day.year]):
+            checks.append(day_check)
+            print(
+                f"{day_check.day}  part {day_check.part}  "
+                f"{day_check.status.value:<14}  {day_check.message}".rstrip()
+            )
+    save_timings(results)
+
+    counts = Counter(c.status for c in checks)
+    print("\n" + ", ".join(f"{n} {status.value}" for status, n in counts.items()))
+    if args.record:
+        years = manifest.record(results, args.budget_factor)
+        print(f"Manifests written for {', '.join(map(str, years))}")
+        return 0
+    if unchecked := counts[manifest.Status.UNCHECKED]:
+        print(
+            f"Warning: {unchecked} parts have no expectation, store them with --record",
+            file=sys.stderr,
+        )
+    failures = {manifest.Status.WRONG, manifest.Status.SLOW, manifest.Status.ERROR}
+    return 1 if failures & counts.keys() else 0
+
+
+def run_report(args: argparse.Namespace) -> int:
+    try:
+        content = report.build_report(
+            report.load_history(), args.base, args.head, args.threshold
+        )
+    except ValueError as e:
+        sys.exit(str(e))
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(content)
+    print(f"Report written to {args.output}")
+    return 0
+
+
+def run_bench(args: argparse.Namespace) -> int:
+    days = select_days(args.year, None if args.all else args.day)
+    baseline = bench.load_results(args.baseline)
+    results, errors = bench.benchmark(days, args.warmup, args.samples)
+
+    for key, summary in results.items():
+        line = (
+            f"{key:<22} median {summary.median * 1000:10.3f} ms  "
+            f"[{summary.ci_low * 1000:.3f}, {summary.ci_high * 1000:.3f}]"
+        )
+        if (reference := baseline.get(key)) and reference.median:
+            line += f"  x{summary.median / reference.median:.2f} vs baseline"
+        print(line)
+    for key, error in errors.items():
+        print(f"{key:<22} ERROR {error}")
+
+    if args.save and errors:
+        print("\nBaseline not written, as some parts failed")
+    elif args.save:
+        bench.save_results(args.baseline, results)
+        print(f"\nBaseline written to {args.baseline}")
+
+    regressions = bench.find_regressions(baseline, results, args.threshold)
+    if regressions:
+        print(f"\nRegressions above {args.threshold:.0%}:")
+        for regression in regressions:
+            print(f"  {regression.key}: x{regression.ratio:.2f}")
+    return 1 if errors or regressions else 0
+
+
+def run_startup(args: argparse.Namespace) -> int:
+    days = select_days(args.year, None if args.all else args.day)
+    with warm.WarmPool(days) as pool:
+        preload = pool.preload
+        print(
+            f"Loaded {preload.days} days and compiled {preload.patterns} patterns "
+            f"in {preload.elapsed * 1000:.2f} ms"
+        )
+        startups = []
+        for day in days:
+            startup = warm.measure_startup(pool, day, args.repeat)
+            startups.append(startup)
+            print(
+                f"{day.name:<12}  work {startup.work * 1000:8.2f} ms, "
+                f"overhead warm {startup.warm_overhead * 1000:8.2f} ms, "
+                f"cold {startup.cold_overhead * 1000:8.2f} ms"
+            )
+    warm_total = sum(s.warm_overhead for s in startups)
+    cold_total = sum(s.cold_overhead for s in startups)
+    print(
+        f"\nOverhead of {len(startups)} days: warm {warm_total:.2f} s, "
+        f"cold {cold_total:.2f} s"
+    )
+    return 0
+
+
+def run_serve(args: argparse.Namespace) -> int:
+    solver = service.SolverService(args.jobs, get_limits(args), args.cache_size)
+    server = service.SolverServer(("127.0.0.1", args.port), solver)
+    host, port = server.server_address[:2]
+    print(f"Serving on http://{host}:{port}/solve with sandboxed process workers")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        solver.close()
+    return 0
+
+
+def run_scale(args: argparse.Namespace) -> int:
+    days = select_days(args.year, None if args.all else args.day)
+    if args.all:
+        skipped = [day.name for day in days if not scaling.get_generator(day)]
+        if skipped:
+            print(f"No generate_input, skipped: {', '.join(skipped)}\n")
+        days = [day for day in days if scaling.get_generator(day)]
+    settings = scaling.Settings(
+        args.min_size, args.steps, args.budget, args.repeat, args.seed
+    )
+    superlinear = []
+    for day in days:
+        try:
+            sweeps = scaling.sweep(day, settings)
+        except ValueError as e:
+            sys.exit(str(e))
+        print(day.name)
+        for sweep in sweeps:
+            exponent = sweep.exponent
+            fit = "k =  n/a" if exponent is None else f"k = {exponent:5.2f}"
+            if exponent is not None and exponent > args.max_exponent:
+                fit += " (superlinear)"
+                superlinear.append(f"{day.name} part {sweep.part}")
+            print(f"  part {sweep.part}  {fit}")
+            for size, elapsed in sweep.points:
+                print(f"    {size:>9}  {elapsed * 1000:10.2f} ms")
+            if sweep.error:
+                print(f"    ERROR {sweep.error}")
+
+    if superlinear:
+        print(f"\nExponent above {args.max_exponent}: {', '.join(superlinear)}")
+        return 1
+    return 0
+
+
+def add_selection_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--year", type=int, action="append", required=True, help="Repeatable"
+    )
+    selection = parser.add_mutually_exclusive_group(required=True)
+    selection.add_argument("--all", action="store_true", help="Select every day")
+    selection.add_argument("--day", type=int, action="append", help="Repeatable")
+
+
+def add_worker_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--jobs", type=int, default=None, help="Workers (default: CPUs)"
+    )
+    parser.add_argument(
+        "--backend",
+        choices=BACKENDS,
+        default="auto",
+        help="Workers: subinterpreters or free-threaded threads when available, "
+        "processes otherwise (default: auto)",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=None,
+        help="Kill days running for longer, in seconds; runs every day in its own "
+        "process",
+    )
+    parser.add_argument(
+        "--memory-limit",
+        type=int,
+        default=None,
+        help="Address space limit of every day, in MiB; runs every day in its own "
+        "process",
+    )
+    parser.add_argument(
+        "--warm",
+        action="store_true",
+        help="Fork every day from a server that has imported all of them",
+    )
+
+
+def add_run_parser(subparsers: argparse._SubParsersAction) -> None:
+    run_parser = subparsers.add_parser("run", help="Run solutions and time each part")
+    add_selection_arguments(run_parser)
+    add_worker_arguments(run_parser)
+    # Not offered by verify, whose CPU time budgets would miss these processes
+    run_parser.add_argument(
+        "--day-jobs",
+        type=int,
+        default=1,
+        help="Processes a day may start itself, such as the 2016 MD5 miners; "
+        "their CPU time is not counted",
+    )
+    run_parser.add_argument(
+        "--parse-cache",
+        action="store_true",
+        help="Reuse parse_input results stored by previous runs",
+    )
+    run_parser.add_argument(
+        "--parse-cache-size",
+        type=int,
+        default=DEFAULT_MAX_SIZE // (1024 * 1024),
+        help="Parse cache size limit in MiB",
+    )
+    run_parser.add_argument(
+        "--memoize",
+        action="store_true",
+        help="Return the stored answer of parts whose module and input are unchanged",
+    )
+    run_parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Write cProfile stats and collapsed stacks of each phase to .aoc/profiles",
+    )
+    run_parser.add_argument(
+        "--top", type=int, default=5, help="Hotspots printed per profiled phase"
+    )
+    run_parser.add_argument(
+        "--resources",
+        action="store_true",
+        help="Report the CPU times, peak RSS and tracemalloc peak of each part",
+    )
+    run_parser.set_defaults(handler=run)
+
+
+def add_bench_parser(subparsers: argparse._SubParsersAction) -> None:
+    bench_parser = subparsers.add_parser(
+        "bench", help="Benchmark solvers and compare them against a baseline"
+    )
+    add_selection_arguments(bench_parser)
+    bench_parser.add_argument("--warmup", type=int, default=1)
+    bench_parser.add_argument("--samples", type=int, default=5)
+    bench_parser.add_argument("--baseline", type=Path, default=bench.BASELINE_FILE)
+    bench_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="Relative slowdown of the median tolerated before failing",
+    )
+    bench_parser.add_argument(
+        "--save", action="store_true", help="Store the results as the new baseline"
+    )
+    bench_parser.set_defaults(handler=run_bench)
+
+
+def add_verify_parser(subparsers: argparse._SubParsersAction) -> None:
+    verify_parser = subparsers.add_parser(
+        "verify",
+        help="Check answers and CPU time budgets against the yearly manifests",
+    )
+    add_selection_arguments(verify_parser)
+    add_worker_arguments(verify_parser)
+    verify_parser.add_argument(
+        "--record",
+        action="store_true",
+        help="Store the current answers, and budgets, in the manifests",
+    )
+    verify_parser.add_argument(
+        "--budget-factor",
+        type=float,
+        default=manifest.DEFAULT_BUDGET_FACTOR,
+        help="Recorded budgets are this many times the measured CPU time",
+    )
+    verify_parser.set_defaults(handler=run_verify)
+
+
+def add_serve_parser(subparsers: argparse._SubParsersAction) -> None:
+    serve_parser = subparsers.add_parser(
+        "serve", help="Answer parts for posted inputs over HTTP, on localhost"
+    )
+    serve_parser.add_argument("--port", type=int, default=service.DEFAULT_PORT)
+    serve_parser.add_argument(
+        "--jobs", type=int, default=None, help="Workers (default: CPUs)"
+    )
+    serve_parser.add_argument(
+        "--timeout",
+        type=float,
+        default=service.DEFAULT_TIMEOUT,
+        help="Kill parts running for longer, in seconds "
+        f"(default: {service.DEFAULT_TIMEOUT:g})",
+    )
+    serve_parser.add_argument(
+        "--memory-limit",
+        type=int,
+        default=None,
+        help="Address space limit of every part, in MiB",
+    )
+    serve_parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=service.DEFAULT_CACHE_SIZE,
+        help="Results of recent requests kept",
+    )
+    serve_parser.set_defaults(handler=run_serve)
+
+
+def add_startup_parser(subparsers: argparse._SubParsersAction) -> None:
+    startup_parser = subparsers.add_parser(
+        "startup",
+        help="Compare the startup overhead of warm forks and cold script runs",
+    )
+    add_selection_arguments(startup_parser)
+    startup_parser.add_argument(
+        "--repeat", type=int, default=3, help="Runs of each kind, the best is kept"
+    )
+    startup_parser.set_defaults(handler=run_startup)
+
+
+def add_watch_parser(subparsers: argparse._SubParsersAction) -> None:
+    watch_parser = subparsers.add_parser(
+        "watch",
+        help="Run days again whenever their source or input changes",
+    )
+    add_selection_arguments(watch_parser)
+    watch_parser.add_argument(
+        "--interval",
+        type=float,
+        default=watch.DEFAULT_INTERVAL,
+        help="Seconds between two scans of the watched files",
+    )
+    watch_parser.set_defaults(handler=run_watch)
+
+
+def add_report_parser(subparsers: argparse._SubParsersAction) -> None:
+    report_parser = subparsers.add_parser(
+        "report", help="Write an HTML report of the timings of previous runs"
+    )
+    report_parser.add_argument("--output", type=Path, default=report.REPORT_FILE)
+    report_parser.add_argument(
+        "--base", help="Revision to compare from (default: the previous one)"
+    )
+    report_parser.add_argument(
+        "--head", help="Revision to compare to (default: the latest one)"
+    )
+    report_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=report.DEFAULT_THRESHOLD,
+        help="Relative change of the wall time reported",
+    )
+    report_parser.set_defaults(handler=run_report)
+
+
+def add_scale_parser(subparsers: argparse._SubParsersAction) -> None:
+    scale_parser = subparsers.add_parser(
+        "scale",
+        help="Fit the complexity exponent of solvers on generated inputs",
+    )
+    add_selection_arguments(scale_parser)
+    scale_parser.add_argument("--min-size", type=int, default=100)
+    scale_parser.add_argument(
+        "--steps", type=int, default=8, help="Maximum number of size doublings"
+    )
+    scale_parser.add_argument(
+        "--budget",
+        type=float,
+        default=1.0,
+        help="Stop growing a part once a run takes more seconds than this",
+    )
+    scale_parser.add_argument("--repeat", type=int, default=3)
+    scale_parser.add_argument("--seed", type=int, default=0)
+    scale_parser.add_argument(
+        "--max-exponent",
+        type=float,
+        default=1.5,
+        help="Fail when a fitted exponent is above this",
+    )
+    scale_parser.set_defaults(handler=run_scale)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="aoc", description="Advent of Code tooling")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    add_run_parser(subparsers)
+    add_bench_parser(subparsers)
+    add_verify_parser(subparsers)
+    add_serve_parser(subparsers)
+    add_startup_parser(subparsers)
+    add_watch_parser(subparsers)
+    add_report_parser(subparsers)
+    add_scale_parser(subparsers)
+    return parser
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    sys.exit(args.handler(args))
@@ -0,0 +1,87 @@
+"""Cycle detection in the sequence of states `initial, step(initial), ...`.
+
+A cycle is described by the index of its first state and its length, so that
+solvers jump to a far away step with `Cycle.reduce` instead of simulating it.
+`brent` only compares states, in constant memory, but runs the steps about
+three times. `find_cycle` runs every step once, and keeps every state: it
+suits states that are cheap to hash, and steps that are not.
+"""
+
+from collections.abc import Callable, Hashable, Sequence
+from dataclasses import dataclass
+from typing import TypeVar
+
+State = TypeVar("State")
+Key = TypeVar("Key", bound=Hashable)
+
+
+@dataclass(frozen=True)
+class Cycle:
+    start: int  # Index of the first state of the cycle
+    length: int
+
+    def reduce(self, index: int) -> int:
+        """The index of the same state as `index`, within the first cycle."""
+        if index < self.start:
+            return index
+        return self.start + (index - self.start) % self.length
+
+
+def brent(initial: State, step: Callable[[State], State]) -> Cycle:
+    # Find the length, by teleporting the tortoise to the hare every power of 2
+    power = length = 1
+    tortoise, hare = initial, step(initial)
+    while tortoise != hare:
+        if power == length:
+            tortoise = hare
+            power *= 2
+            length = 0
+        hare = step(hare)
+        length += 1
+
+    # With the hare a cycle ahead, they meet at the start of the cycle
+    tortoise = hare = initial
+    for _ in range(length):
+        hare = step(hare)
+    start = 0
+    while tortoise != hare:
+        tortoise = step(tortoise)
+        hare = step(hare)
+        start += 1
+    return Cycle(start, length)
+
+
+def find_cycle(
+    initial: State,
+    step: Callable[[State], State],
+    limit: int | None = None,
+    key: Callable[[State], Key] | None = None,
+) -> tuple[Cycle | None, list[State]]:
+    """Return the cycle and the states up to its end, or None and the `limit`
+    first states when they are all different.
+
+    `step` is called once per state, in order, so it may advance a mutable
+    simulation. `key` reduces a state to the hashable snapshot to compare.
+    """
+    seen: dict[Key, int] = {}
+    states = []
+    state = initial
+    while limit is None or len(states) < limit:
+        snapshot = state if key is None else key(state)
+        if (index := seen.get(snapshot)) is not None:
+            return Cycle(index, len(states) - index), states
+        seen[snapshot] = len(states)
+        states.append(state)
+        state = step(state)
+    return None, states
+
+
+def sum_cycling(values: Sequence[int], cycle: Cycle | None, count: int) -> int:
+    """Sum of the `count` first values of a sequence, from its values up to the
+    end of its first cycle."""
+    if cycle is None or count <= len(values):
+        return sum(values[:count])
+    head = sum(values[: cycle.start])
+    loop = values[cycle.start : cycle.start + cycle.length]
+    loops, rest = divmod(count - cycle.start, cycle.length)
+    return head + loops * sum(loop) + sum(loop[:rest])
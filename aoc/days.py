@@ -0,0 +1,105 @@
+import functools
+import importlib.util
+import re
+import sys
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+ROOT = Path(__file__).resolve().parent.parent
+STATE_DIR = ROOT / ".aoc"
+
+PARTS = (1, 2)
+PART_FUNCTIONS = {1: "part_one", 2: "part_two"}
+
+DAY_PATTERN = re.compile(r"day_(\d{2})")
+
+
+@dataclass(frozen=True, order=True)
+class Day:
+    year: int
+    day: int
+
+    @property
+    def name(self) -> str:
+        return f"{self.year}/day_{self.day:02d}"
+
+    @property
+    def module_name(self) -> str:
+        return f"aoc_{self.year}_day_{self.day:02d}"
+
+    @property
+    def directory(self) -> Path:
+        return ROOT / f"aoc_{self.year}" / f"day_{self.day:02d}"
+
+    @property
+    def source(self) -> Path:
+        return self.directory / f"day_{self.day:02d}.py"
+
+    def input_path(self, part: int) -> Path:
+        """Days shipping a single input file use it for both parts."""
+        path = self.directory / f"input_part_{part}.txt"
+        if not path.exists():
+            return self.directory / "input_part_1.txt"
+        return path
+
+
+def discover(year: int) -> list[Day]:
+    """Return every day of `year` that has a Python solution, in order."""
+    year_dir = ROOT / f"aoc_{year}"
+    days = []
+    for directory in sorted(year_dir.glob("day_*")):
+        match = DAY_PATTERN.fullmatch(directory.name)
+        if match and (directory / f"{directory.name}.py").is_file():
+            days.append(Day(year, int(match.group(1))))
+    return days
+
+
+def load_module(day: Day) -> ModuleType:
+    """Import a day module by path, without changing the working directory."""
+    if day.module_name in sys.modules:
+        return sys.modules[day.module_name]
+    spec = importlib.util.spec_from_file_location(day.module_name, day.source)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[day.module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[day.module_name]
+        raise
+    return module
+
+
+def get_parser(module: ModuleType, part: int) -> Callable[[str], Any]:
+    """Days with a different input format per part define `parse_input_part_N`.
+
+    Days parsing the input bytes define `parse(data)` instead of `parse_input`.
+    """
+    parser = getattr(module, f"parse_input_part_{part}", None)
+    parser = parser or getattr(module, "parse_input", None)
+    return parser or read_with(module.parse)
+
+
+def read_with(parse: Callable[[bytes], Any]) -> Callable[[str], Any]:
+    """A parser of input paths, keeping the name and module of `parse` for the
+    keys of the parse caches."""
+
+    @functools.wraps(parse)
+    def parser(filename: str) -> Any:
+        with open(filename, "rb") as f:
+            return parse(f.read())
+
+    return parser
+
+
+def get_solver(module: ModuleType, part: int) -> Callable[..., Any] | None:
+    return getattr(module, PART_FUNCTIONS[part], None)
+
+
+def solve(solver: Callable[..., Any], data: Any) -> Any:
+    """Parsers returning a tuple have it unpacked into the solver arguments."""
+    if isinstance(data, tuple):
+        return solver(*data)
+    return solver(data)
@@ -0,0 +1,49 @@
+"""Directions and points on plain ints, complexes and tuples.
+
+Directions are the ints 0 to 3, clockwise from up, so turning and reflecting
+are lookups in the tables below instead of Enum method calls. Coordinates are
+screen ones, with y growing downwards. Positions on an unbounded plane are
+complex numbers `x + y * 1j`, moved by adding a step; positions on a bounded
+grid are packed ints `y * width + x`, as in `aoc.search`. Coordinates read
+from an input are named tuples, hashed and compared in C.
+"""
+
+from typing import NamedTuple
+
+UP, RIGHT, DOWN, LEFT = range(4)
+
+DIRECTIONS = {
+    **{char: direction for direction, char in enumerate("URDL")},
+    **{char: direction for direction, char in enumerate("^>v<")},
+}
+
+TURN_LEFT = (LEFT, UP, RIGHT, DOWN)
+TURN_RIGHT = (RIGHT, DOWN, LEFT, UP)
+STRAIGHT = (UP, RIGHT, DOWN, LEFT)
+REVERSE = (DOWN, LEFT, UP, RIGHT)
+# Reflections on the mirrors `/` and `\`
+SLASH = (RIGHT, UP, LEFT, DOWN)
+BACKSLASH = (LEFT, DOWN, RIGHT, UP)
+
+DELTAS = ((0, -1), (1, 0), (0, 1), (-1, 0))
+STEPS = (-1j, 1 + 0j, 1j, -1 + 0j)
+
+
+def get_steps(width: int) -> tuple[int, int, int, int]:
+    """Steps in every direction between packed `y * width + x` positions."""
+    return (-width, 1, width, -1)
+
+
+def manhattan(position: complex) -> int:
+    return int(abs(position.real) + abs(position.imag))
+
+
+class Point(NamedTuple):
+    x: int
+    y: int
+
+
+class Point3D(NamedTuple):
+    x: int
+    y: int
+    z: int
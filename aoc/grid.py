@@ -0,0 +1,156 @@
+"""Rectangular grid of small integers, stored row-major in a bytearray.
+
+Each cell takes one byte, so whole-grid operations run at C speed: counting
+with `bytearray.count`, mapping values with `bytes.translate`, and counting
+neighbours by adding shifted copies of the grid packed in a single integer.
+"""
+
+from collections.abc import Iterator
+
+NONZERO = bytes([0] + [1] * 255)
+
+NEIGHBOURS_4 = ((0, -1), (1, 0), (0, 1), (-1, 0))
+NEIGHBOURS_8 = (*NEIGHBOURS_4, (-1, -1), (1, -1), (1, 1), (-1, 1))
+
+
+def make_table(values: dict[int, int]) -> bytes:
+    """Translation table mapping each byte in `values`, other bytes to 0."""
+    table = bytearray(256)
+    for key, value in values.items():
+        table[key] = value
+    return bytes(table)
+
+
+class Grid:
+    __slots__ = ("cells", "height", "width")
+
+    def __init__(self, width: int, height: int, cells: bytes | None = None):
+        if cells is None:
+            cells = bytes(width * height)
+        elif len(cells) != width * height:
+            raise ValueError(f"Expected {width * height} cells, got {len(cells)}")
+        self.width = width
+        self.height = height
+        self.cells = bytearray(cells)
+
+    @classmethod
+    def from_bytes(cls, data: bytes, symbols: dict[str, int] | None = None) -> "Grid":
+        """Parse lines of equal length, mapping characters through `symbols`.
+
+        Without `symbols`, cells hold the raw character codes.
+        """
+        lines = data.rstrip(b"\r\n").splitlines()
+        width = len(lines[0])
+        if any(len(line) != width for line in lines):
+            raise ValueError("All the lines of a grid must have the same length")
+        cells = b"".join(lines)
+        if symbols is not None:
+            table = make_table({ord(char): value for char, value in symbols.items()})
+            cells = cells.translate(table)
+        return cls(width, len(lines), cells)
+
+    def copy(self) -> "Grid":
+        return Grid(self.width, self.height, self.cells)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Grid):
+            return NotImplemented
+        return self.width == other.width and self.cells == other.cells
+
+    # Cells are mutable, so equal grids may not stay equal
+    __hash__ = None
+
+    def in_bounds(self, x: int, y: int) -> bool:
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def __getitem__(self, position: tuple[int, int]) -> int:
+        x, y = position
+        return self.cells[y * self.width + x]
+
+    def __setitem__(self, position: tuple[int, int], value: int) -> None:
+        x, y = position
+        self.cells[y * self.width + x] = value
+
+    def position(self, idx: int) -> tuple[int, int]:
+        y, x = divmod(idx, self.width)
+        return x, y
+
+    def count(self, value: int) -> int:
+        return self.cells.count(value)
+
+    def row(self, y: int) -> bytearray:
+        return self.cells[y * self.width : (y + 1) * self.width]
+
+    def column(self, x: int) -> bytearray:
+        return self.cells[x :: self.width]
+
+    def get_row_starts(self, x: int, y: int, height: int) -> range:
+        return range(y * self.width + x, (y + height) * self.width, self.width)
+
+    def fill(self, x: int, y: int, width: int, height: int, value: int) -> None:
+        run = bytes([value]) * width
+        for row_start in self.get_row_starts(x, y, height):
+            self.cells[row_start : row_start + width] = run
+
+    def translate(self, x: int, y: int, width: int, height: int, table: bytes) -> None:
+        """Map the values of a rectangle through a 256 bytes translation table."""
+        cells = self.cells
+        for row_start in self.get_row_starts(x, y, height):
+            row_end = row_start + width
+            cells[row_start:row_end] = cells[row_start:row_end].translate(table)
+
+    def rotate_row(self, y: int, by: int) -> None:
+        """Rotate a row right by `by` cells."""
+        row = self.row(y)
+        by %= self.width
+        self.cells[y * self.width : (y + 1) * self.width] = row[-by:] + row[:-by]
+
+    def rotate_column(self, x: int, by: int) -> None:
+        """Rotate a column down by `by` cells."""
+        column = self.column(x)
+        by %= self.height
+        self.cells[x :: self.width] = column[-by:] + column[:-by]
+
+    def neighbours(
+        self, x: int, y: int, diagonals: bool = False
+    ) -> Iterator[tuple[int, int]]:
+        for dx, dy in NEIGHBOURS_8 if diagonals else NEIGHBOURS_4:
+            if 0 <= x + dx < self.width and 0 <= y + dy < self.height:
+                yield x + dx, y + dy
+
+    def neighbour_counts(self) -> "Grid":
+        """Count the non-zero cells among the 8 neighbours of every cell.
+
+        The grid is padded with a border of zeros and packed in one integer
+        with a cell per byte: adding the 8 shifted copies counts every cell at
+        once, and a count never exceeds 8, so no carry crosses into the next
+        byte.
+        """
+        padded_width = self.width + 2
+        border = bytes(padded_width)
+        bits = self.cells.translate(NONZERO)
+        rows = (
+            b"\0" + bits[y * self.width : (y + 1) * self.width] + b"\0"
+            for y in range(self.height)
+        )
+        padded = border + b"".join(rows) + border
+        packed = int.from_bytes(padded, "little")
+
+        total = 0
+        for dx, dy in NEIGHBOURS_8:
+            offset = dy * padded_width + dx
+            total += packed >> (8 * offset) if offset > 0 else packed << (-8 * offset)
+        counts = total.to_bytes(len(padded) + padded_width + 1, "little")
+
+        end = (self.height + 1) * padded_width
+        row_starts = range(padded_width + 1, end, padded_width)
+        return Grid(
+            self.width,
+            self.height,
+            b"".join(counts[start : start + self.width] for start in row_starts),
+        )
+
+    def render(self, symbols: dict[int, str]) -> str:
+        return "\n".join(
+            "".join(symbols[value] for value in self.row(y)) for y in range(self.height)
+        )
@@ -0,0 +1,150 @@
+"""MD5 mining over `prefix + str(index)` across a process pool.
+
+`mine` hands out ranges of indices to the workers, and yields their matches in
+index order, however the workers finish. Workers hash `prefix + str(block)`
+once per block of 1000 indices and `.copy()` that state for the last 3 digits,
+and compare raw digests rather than hex strings.
+
+A day run by `python day_XX.py` mines on every CPU. The runner already spreads
+days over the CPUs, so it sets `worker_processes` to its `--day-jobs`, 1 by
+default, for the days it runs.
+"""
+
+import os
+import re
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import partial
+from hashlib import md5
+from itertools import count
+from typing import Any
+
+BLOCK_SIZE = 1000
+SUFFIXES = [b"%03d" % i for i in range(BLOCK_SIZE)]
+
+# Chunks submitted ahead of the one being consumed, per worker
+CHUNKS_AHEAD = 2
+
+TRIPLE_PATTERN = re.compile(rb"(.)\1\1")
+QUINTUPLE_PATTERN = re.compile(rb"(.)\1{4}")
+
+Search = Callable[[bytes, int, int], list[tuple[int, Any]]]
+
+# Worker processes of `mine` when not given, None for every CPU
+JOBS: ContextVar[int | None] = ContextVar("jobs", default=None)
+
+
+@contextmanager
+def worker_processes(jobs: int | None) -> Iterator[None]:
+    """Set the worker processes of the mining done in the block."""
+    token = JOBS.set(jobs)
+    try:
+        yield
+    finally:
+        JOBS.reset(token)
+
+
+def iter_digests(prefix: bytes, start: int, stop: int) -> Iterator[tuple[int, bytes]]:
+    """Yield the raw MD5 digest of `prefix + str(index)` for every index."""
+    prefix_hash = md5(prefix)
+    index = start
+    while index < stop:
+        block, offset = divmod(index, BLOCK_SIZE)
+        block_stop = min(stop, (block + 1) * BLOCK_SIZE)
+        if block == 0:
+            # Numbers under 1000 do not have 3 digits
+            for small in range(index, block_stop):
+                yield small, md5(prefix + b"%d" % small).digest()
+        else:
+            block_hash = prefix_hash.copy()
+            block_hash.update(b"%d" % block)
+            copy = block_hash.copy
+            for suffix in SUFFIXES[offset : block_stop - block * BLOCK_SIZE]:
+                digest_hash = copy()
+                digest_hash.update(suffix)
+                yield index, digest_hash.digest()
+                index += 1
+        index = block_stop
+
+
+def find_zero_prefix(
+    prefix: bytes, start: int, stop: int, zeros: int
+) -> list[tuple[int, bytes]]:
+    """Digests starting with `zeros` zero hexadecimal digits.
+
+    Those are exactly the digests lower than 16 ** (32 - zeros).
+    """
+    threshold = (1 << (128 - 4 * zeros)).to_bytes(16, "big")
+    return [
+        (index, digest)
+        for index, digest in iter_digests(prefix, start, stop)
+        if digest < threshold
+    ]
+
+
+def find_repeats(
+    prefix: bytes, start: int, stop: int, stretch: int = 0
+) -> list[tuple[int, tuple[bytes, set[bytes]]]]:
+    """Hexadecimal digests, hashed again `stretch` times, with a triple.
+
+    Matches hold the character of the first triple, and the characters of all
+    the quintuples; every quintuple is also a triple, so none is missed.
+    """
+    matches = []
+    for index, digest in iter_digests(prefix, start, stop):
+        hexdigest = digest.hex().encode()
+        for _ in range(stretch):
+            hexdigest = md5(hexdigest).hexdigest().encode()
+        if triple := TRIPLE_PATTERN.search(hexdigest):
+            quintuples = set(QUINTUPLE_PATTERN.findall(hexdigest))
+            matches.append((index, (triple.group(1), quintuples)))
+    return matches
+
+
+def mine(
+    prefix: bytes,
+    search: Search,
+    chunk_size: int = 100 * BLOCK_SIZE,
+    jobs: int | None = None,
+) -> Iterator[tuple[int, Any]]:
+    """Yield `search` matches from index 0 onwards, in index order, forever.
+
+    `search` must be picklable, such as a module level function or a
+    `functools.partial` of one, as it runs in the worker processes.
+    """
+    jobs = jobs or JOBS.get() or os.cpu_count() or 1
+    starts = count(0, chunk_size)
+    if jobs == 1:
+        for start in starts:
+            yield from search(prefix, start, start + chunk_size)
+        return
+
+    executor = ProcessPoolExecutor(max_workers=jobs)
+    pending: deque[Future] = deque()
+    try:
+        while True:
+            while len(pending) < jobs * CHUNKS_AHEAD:
+                start = next(starts)
+                pending.append(
+                    executor.submit(search, prefix, start, start + chunk_size)
+                )
+            yield from pending.popleft().result()
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+def mine_zero_prefix(
+    prefix: bytes, zeros: int, jobs: int | None = None
+) -> Iterator[tuple[int, bytes]]:
+    return mine(prefix, partial(find_zero_prefix, zeros=zeros), jobs=jobs)
+
+
+def mine_repeats(
+    prefix: bytes, stretch: int = 0, jobs: int | None = None
+) -> Iterator[tuple[int, tuple[bytes, set[bytes]]]]:
+    # Stretched hashes are 2017 times slower, so chunks are made smaller
+    chunk_size = BLOCK_SIZE if stretch else 10 * BLOCK_SIZE
+    return mine(prefix, partial(find_repeats, stretch=stretch), chunk_size, jobs)
@@ -0,0 +1,69 @@
+"""Parsed inputs shared between the parts of a day.
+
+Both parts of most days read byte-identical files, so parsed inputs are keyed
+by parser and input digest, and every distinct input is parsed once per day.
+Part one may mutate its input, so a later part gets:
+- the same object, when nothing in it can be mutated,
+- `clone_input(data)` when the day module defines it, as a copy of the state
+  the parts mutate, or the input itself when the parts only read it,
+- a fresh parse otherwise.
+"""
+
+import dataclasses
+import enum
+import hashlib
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+SCALARS = frozenset({int, float, complex, bool, str, bytes, type(None), range})
+
+
+def is_immutable(value: Any) -> bool:
+    """Whether `value` is made of tuples, frozensets, frozen dataclasses, enums
+    and scalars only."""
+    pending = [value]
+    while pending:
+        value = pending.pop()
+        kind = type(value)
+        if kind in SCALARS or isinstance(value, enum.Enum):
+            continue
+        if isinstance(value, tuple | frozenset):
+            # Checking the types in bulk keeps large grids of scalars cheap
+            if not set(map(type, value)) <= SCALARS:
+                pending.extend(value)
+        elif dataclasses.is_dataclass(value) and kind.__dataclass_params__.frozen:
+            pending.extend(getattr(value, f.name) for f in dataclasses.fields(value))
+        else:
+            return False
+    return True
+
+
+@dataclass
+class InputStore:
+    # Pristine parsed inputs, keyed by parser name and input digest
+    entries: dict[tuple[str, bytes], Any] = field(default_factory=dict)
+
+    def parse(
+        self,
+        module: ModuleType,
+        parser: Callable[[str], Any],
+        input_path: Path,
+        parse: Callable[[], Any],
+    ) -> Any:
+        """Return the parsed input, calling `parse` unless it can be shared."""
+        key = (parser.__qualname__, hashlib.sha256(input_path.read_bytes()).digest())
+        clone = getattr(module, "clone_input", None)
+        if key in self.entries:
+            data = self.entries[key]
+            return data if clone is None else clone(data)
+
+        data = parse()
+        if is_immutable(data):
+            self.entries[key] = data
+        elif clone is not None:
+            # Kept aside before the part gets a chance to mutate it
+            self.entries[key] = clone(data)
+        return data
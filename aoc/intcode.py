@@ -0,0 +1,168 @@
+"""Intcode virtual machine, shared by the 2019 days.
+
+Instruction values are decoded into an opcode and parameter modes once, and
+cached by value, which stays valid for self-modifying programs. Inputs and
+outputs are deques, so machines are chained by sharing them, and `iter_outputs`
+wraps a machine as a generator. Memory grows on demand, as required from 2019
+day 09 onwards.
+"""
+
+import operator
+from array import array
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+
+from aoc.tokens import parse_ints
+
+ADD = 1
+MUL = 2
+INPUT = 3
+OUTPUT = 4
+JUMP_IF_TRUE = 5
+JUMP_IF_FALSE = 6
+LESS_THAN = 7
+EQUALS = 8
+ADJUST_BASE = 9
+HALT = 99
+
+# Opcodes storing a function of their 2 parameters in the third one
+OPERATIONS: dict[int, Callable[[int, int], int]] = {
+    ADD: operator.add,
+    MUL: operator.mul,
+    LESS_THAN: lambda a, b: int(a < b),
+    EQUALS: lambda a, b: int(a == b),
+}
+# Jump opcodes, and whether they jump on a nonzero parameter
+JUMPS = {JUMP_IF_TRUE: True, JUMP_IF_FALSE: False}
+
+POSITION_MODE = 0
+IMMEDIATE_MODE = 1
+RELATIVE_MODE = 2
+
+_decoded: dict[int, tuple[int, int, int, int]] = {}
+
+
+def decode(value: int) -> tuple[int, int, int, int]:
+    """Split an instruction into its opcode and the modes of its 3 parameters."""
+    if (decoded := _decoded.get(value)) is None:
+        decoded = _decoded[value] = (
+            value % 100,
+            value // 100 % 10,
+            value // 1000 % 10,
+            value // 10000 % 10,
+        )
+    return decoded
+
+
+def parse_program(source: bytes) -> array:
+    """The comma separated program, as 8 bytes per value rather than an int object."""
+    return array("q", parse_ints(source))
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    memory: tuple[int, ...]
+    ip: int
+    relative_base: int
+    inputs: tuple[int, ...]
+    halted: bool
+
+
+class Machine:
+    def __init__(
+        self,
+        program: Iterable[int],
+        inputs: Iterable[int] = (),
+        outputs: deque[int] | None = None,
+    ):
+        self.memory = list(program)
+        self.ip = 0
+        self.relative_base = 0
+        self.inputs = inputs if isinstance(inputs, deque) else deque(inputs)
+        self.outputs = deque() if outputs is None else outputs
+        self.halted = False
+
+    def send(self, *values: int) -> None:
+        self.inputs.extend(values)
+
+    def snapshot(self) -> Snapshot:
+        return Snapshot(
+            tuple(self.memory),
+            self.ip,
+            self.relative_base,
+            tuple(self.inputs),
+            self.halted,
+        )
+
+    def restore(self, snapshot: Snapshot) -> None:
+        """Restore in place, keeping the inputs and outputs deque objects."""
+        self.memory[:] = snapshot.memory
+        self.ip = snapshot.ip
+        self.relative_base = snapshot.relative_base
+        self.inputs.clear()
+        self.inputs.extend(snapshot.inputs)
+        self.outputs.clear()
+        self.halted = snapshot.halted
+
+    def address(self, parameter: int, mode: int) -> int:
+        """Resolve the address a parameter reads from or writes to."""
+        memory = self.memory
+        if mode == POSITION_MODE:
+            address = memory[self.ip + parameter]
+        elif mode == IMMEDIATE_MODE:
+            address = self.ip + parameter
+        elif mode == RELATIVE_MODE:
+            address = self.relative_base + memory[self.ip + parameter]
+        else:
+            raise ValueError(f"Invalid parameter mode: {mode}")
+        if address < 0:
+            raise IndexError(f"Negative address: {address}")
+        if address >= len(memory):
+            memory.extend([0] * (address + 1 - len(memory)))
+        return address
+
+    def run(self) -> bool:
+        """Run until the program halts, returning True, or until it waits for an
+        input that is not available yet, returning False."""
+        memory = self.memory
+        inputs = self.inputs
+        outputs = self.outputs
+        address = self.address
+        while not self.halted:
+            opcode, mode_a, mode_b, mode_c = decode(memory[self.ip])
+            if (operation := OPERATIONS.get(opcode)) is not None:
+                a, b = memory[address(1, mode_a)], memory[address(2, mode_b)]
+                memory[address(3, mode_c)] = operation(a, b)
+                self.ip += 4
+            elif opcode == INPUT:
+                if not inputs:
+                    return False
+                destination = address(1, mode_a)
+                memory[destination] = inputs.popleft()
+                self.ip += 2
+            elif opcode == OUTPUT:
+                outputs.append(memory[address(1, mode_a)])
+                self.ip += 2
+            elif (jump_if := JUMPS.get(opcode)) is not None:
+                if (memory[address(1, mode_a)] != 0) == jump_if:
+                    self.ip = memory[address(2, mode_b)]
+                else:
+                    self.ip += 3
+            elif opcode == ADJUST_BASE:
+                self.relative_base += memory[address(1, mode_a)]
+                self.ip += 2
+            elif opcode == HALT:
+                self.halted = True
+            else:
+                raise ValueError(f"Invalid opcode: {opcode}")
+        return True
+
+    def iter_outputs(self) -> Iterator[int]:
+        """Yield outputs until halted, or waiting for an input nobody sent."""
+        while True:
+            halted = self.run()
+            while self.outputs:
+                yield self.outputs.popleft()
+            if halted or not self.inputs:
+                return
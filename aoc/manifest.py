@@ -0,0 +1,117 @@
+"""Expected answers and CPU time budgets of every part, one manifest per year.
+
+Manifests are checked in next to the days, as `aoc_<year>/manifest.json`, so a
+performance change that breaks an answer, or a slowdown past the budget of a
+part, fails `aoc verify`. Budgets are in CPU rather than wall seconds, which
+do not grow when the days run in parallel and share the CPUs.
+"""
+
+import json
+import math
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass
+from enum import Enum
+
+from aoc.days import ROOT
+from aoc.runner import DayResult
+
+MANIFEST_NAME = "manifest.json"
+DEFAULT_BUDGET_FACTOR = 3.0
+MIN_BUDGET = 0.5
+
+
+@dataclass
+class Expectation:
+    answer: str
+    budget: float  # CPU seconds for parsing and solving the part
+
+
+# Keyed by day directory name, then by part
+Manifest = dict[str, dict[int, Expectation]]
+
+
+class Status(Enum):
+    OK = "ok"
+    WRONG = "wrong answer"
+    SLOW = "over budget"
+    ERROR = "error"
+    UNCHECKED = "no expectation"
+
+
+@dataclass
+class Check:
+    day: str
+    part: int
+    status: Status
+    message: str = ""
+
+
+def load_manifest(year: int) -> Manifest:
+    try:
+        raw = json.loads((ROOT / f"aoc_{year}" / MANIFEST_NAME).read_text())
+    except FileNotFoundError:
+        return {}
+    return {
+        day: {
+            int(part.removeprefix("part_")): Expectation(**expectation)
+            for part, expectation in parts.items()
+        }
+        for day, parts in raw.items()
+    }
+
+
+def save_manifest(year: int, manifest: Manifest) -> None:
+    raw = {
+        day: {f"part_{part}": asdict(manifest[day][part]) for part in sorted(parts)}
+        for day, parts in sorted(manifest.items())
+    }
+    path = ROOT / f"aoc_{year}" / MANIFEST_NAME
+    path.write_text(json.dumps(raw, indent=2, ensure_ascii=False) + "\n")
+
+
+def get_budget(cpu: float, factor: float) -> float:
+    """`factor` times the CPU time, rounded up to 2 significant digits."""
+    budget = max(MIN_BUDGET, cpu * factor)
+    scale = 10.0 ** (math.floor(math.log10(budget)) - 1)
+    # The epsilon keeps float noise, as in 0.5 / 0.01, from rounding up
+    return round(math.ceil(budget / scale - 1e-9) * scale, 10)
+
+
+def check(result: DayResult, manifest: Manifest) -> list[Check]:
+    checks = []
+    day_name = result.day.directory.name
+    for part in result.parts:
+        cpu = part.parse.cpu + part.solve.cpu
+        expectation = manifest.get(day_name, {}).get(part.part)
+        if part.error:
+            status, message = Status.ERROR, part.error
+        elif expectation is None:
+            status, message = Status.UNCHECKED, ""
+        elif part.answer != expectation.answer:
+            status = Status.WRONG
+            message = f"expected {expectation.answer!r}, got {part.answer!r}"
+        elif cpu > expectation.budget:
+            status = Status.SLOW
+            message = f"{cpu:.2f} s for a budget of {expectation.budget:g} s"
+        else:
+            status, message = Status.OK, ""
+        checks.append(Check(result.day.name, part.part, status, message))
+    return checks
+
+
+def record(results: Iterable[DayResult], factor: float) -> list[int]:
+    """Store the answers and budgets of the successful parts; return the years."""
+    manifests: dict[int, Manifest] = {}
+    for result in results:
+        year = result.day.year
+        manifest = manifests.setdefault(year, load_manifest(year))
+        for part in result.parts:
+            # Parts returning nothing are not solved yet
+            if part.error or part.answer == "None":
+                continue
+            cpu = part.parse.cpu + part.solve.cpu
+            parts = manifest.setdefault(result.day.directory.name, {})
+            parts[part.part] = Expectation(part.answer, get_budget(cpu, factor))
+    for year, manifest in manifests.items():
+        save_manifest(year, manifest)
+    return sorted(manifests)
@@ -0,0 +1,108 @@
+"""cProfile stats of the parse and solve phases of every part.
+
+Each phase writes a `.pstats` file, for `python -m pstats` or snakeviz, and a
+`.collapsed` file of folded stacks, for flamegraph.pl or speedscope. cProfile
+only records caller and callee pairs, not whole stacks, so the stacks split
+the time of a function among its callers in proportion to their calls.
+"""
+
+import cProfile
+import pstats
+from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+from aoc.days import STATE_DIR
+
+PROFILE_DIR = STATE_DIR / "profiles"
+PHASES = ("parse", "solve")
+
+# Stacks taking less than this share of the total time are left out
+MIN_STACK_SHARE = 0.0001
+
+Function = tuple[str, int, str]  # As keyed by pstats: file name, line, name
+
+
+@dataclass
+class Hotspot:
+    function: str
+    calls: int
+    own_time: float
+    total_time: float
+
+
+def get_profile_path(directory: Path, part: int, phase: str) -> Path:
+    return directory / f"part_{part}_{phase}.pstats"
+
+
+def get_label(function: Function) -> str:
+    filename, line, name = function
+    if filename == "~":
+        return name  # Built-in
+    return f"{Path(filename).name}:{line}({name})"
+
+
+@contextmanager
+def profiled(path: Path | None) -> Iterator[None]:
+    """Profile the block into `path` and the matching `.collapsed` file."""
+    if path is None:
+        yield
+        return
+    profile = cProfile.Profile()
+    profile.enable()
+    try:
+        yield
+    finally:
+        profile.disable()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        profile.dump_stats(path)
+        write_collapsed(pstats.Stats(profile), path.with_suffix(".collapsed"))
+
+
+def get_collapsed_stacks(stats: pstats.Stats) -> dict[str, float]:
+    """Return the own time of every stack, as `root;caller;function` strings."""
+    functions = stats.stats
+    callees = defaultdict(dict)
+    for function, (*_, callers) in functions.items():
+        for caller, edge in callers.items():
+            callees[caller][function] = edge[-1]  # Its cumulative time
+
+    roots = [function for function, (*_, callers) in functions.items() if not callers]
+    min_time = MIN_STACK_SHARE * sum(functions[root][3] for root in roots)
+    stacks = defaultdict(float)
+    # Pending (stack, time spent in its last function through that stack)
+    pending = [((root,), functions[root][3]) for root in roots]
+    while pending:
+        stack, time = pending.pop()
+        _, _, own_time, total_time, _ = functions[stack[-1]]
+        if total_time <= 0:
+            continue
+        share = time / total_time
+        stacks[";".join(map(get_label, stack))] += own_time * share
+        for callee, edge_time in callees[stack[-1]].items():
+            if callee not in stack and edge_time * share >= min_time:
+                pending.append(((*stack, callee), edge_time * share))
+    return stacks
+
+
+def write_collapsed(stats: pstats.Stats, path: Path) -> None:
+    """Write folded stacks weighted in microseconds."""
+    lines = [
+        f"{stack} {round(time * 1_000_000)}"
+        for stack, time in sorted(get_collapsed_stacks(stats).items())
+        if time * 1_000_000 >= 1
+    ]
+    path.write_text("".join(f"{line}\n" for line in lines))
+
+
+def get_hotspots(path: Path, top: int) -> list[Hotspot]:
+    """The `top` functions with the most time spent in their own code."""
+    functions = pstats.Stats(str(path)).stats
+    hotspots = [
+        Hotspot(get_label(function), calls, own_time, total_time)
+        for function, (_, calls, own_time, total_time, _) in functions.items()
+    ]
+    hotspots.sort(key=lambda h: h.own_time, reverse=True)
+    return hotspots[:top]
@@ -0,0 +1,242 @@
+"""Timing history of `aoc run`, and a static HTML report built from it.
+
+Every run appends the wall time of its parts to `.aoc/history.jsonl`, tagged
+with the git revision, suffixed with `-dirty` when the tree has uncommitted
+changes. The report needs no network nor JavaScript: sparklines are inline
+SVG, years, days and parts are listed slowest first, and two revisions are
+compared to list the parts that got slower or faster.
+"""
+
+import html
+import json
+import subprocess
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+from aoc.bench import get_key, get_revision
+from aoc.days import ROOT, STATE_DIR
+from aoc.runner import DayResult
+
+HISTORY_FILE = STATE_DIR / "history.jsonl"
+REPORT_FILE = STATE_DIR / "report.html"
+DEFAULT_THRESHOLD = 0.1
+
+SPARKLINE_WIDTH = 120
+SPARKLINE_HEIGHT = 24
+
+STYLE = """
+body { font-family: sans-serif; margin: 2em; color: #222; }
+table { border-collapse: collapse; margin-bottom: 2em; }
+th, td { padding: 0.2em 0.8em; text-align: right; }
+th:first-child, td:first-child { text-align: left; }
+tr:nth-child(even) { background: #f4f4f4; }
+.slower { color: #b00020; }
+.faster { color: #1b7f3b; }
+polyline { fill: none; stroke: #3465a4; stroke-width: 1.5; }
+"""
+
+
+@dataclass
+class Change:
+    key: str
+    base: float
+    head: float
+
+    @property
+    def ratio(self) -> float:
+        return self.head / self.base
+
+
+def get_history_revision() -> str | None:
+    """The revision, with `-dirty` if the timings may not be those of its code."""
+    revision = get_revision()
+    if revision is None:
+        return None
+    try:
+        status = subprocess.run(
+            ["git", "status", "--porcelain"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return revision
+    return f"{revision}-dirty" if status.stdout.strip() else revision
+
+
+def append_history(results: Iterable[DayResult]) -> None:
+    timings = {
+        get_key(result.day, part.part): part.parse.wall + part.solve.wall
+        for result in results
+        for part in result.parts
+        if not part.error and not part.memoized
+    }
+    if not timings:
+        return
+    entry = {
+        "revision": get_history_revision(),
+        "timestamp": datetime.now(UTC).isoformat(timespec="seconds"),
+        "timings": timings,
+    }
+    HISTORY_FILE.parent.mkdir(exist_ok=True)
+    with HISTORY_FILE.open("a") as f:
+        f.write(json.dumps(entry) + "\n")
+
+
+def load_history() -> dict[str, dict[str, float]]:
+    """Best wall time of every part, per revision, in order of first run."""
+    history: dict[str, dict[str, float]] = {}
+    try:
+        lines = HISTORY_FILE.read_text().splitlines()
+    except FileNotFoundError:
+        return history
+    for line in lines:
+        entry = json.loads(line)
+        timings = history.setdefault(entry["revision"] or "unknown", {})
+        for key, wall in entry["timings"].items():
+            timings[key] = min(wall, timings.get(key, wall))
+    return history
+
+
+def compare(
+    base: dict[str, float], head: dict[str, float], threshold: float
+) -> tuple[list[Change], list[Change]]:
+    """Return the regressions and the improvements, largest first."""
+    changes = [Change(key, base[key], head[key]) for key in head if base.get(key)]
+    regressions = [c for c in changes if c.ratio > 1 + threshold]
+    improvements = [c for c in changes if c.ratio < 1 / (1 + threshold)]
+    regressions.sort(key=lambda c: c.ratio, reverse=True)
+    improvements.sort(key=lambda c: c.ratio)
+    return regressions, improvements
+
+
+def format_time(seconds: float) -> str:
+    if seconds >= 1:
+        return f"{seconds:.2f} s"
+    return f"{seconds * 1000:.2f} ms"
+
+
+def render_sparkline(values: list[float]) -> str:
+    if len(values) < 2:
+        return ""
+    low, high = min(values), max(values)
+    spread = (high - low) or 1
+    step = SPARKLINE_WIDTH / (len(values) - 1)
+    # A pixel of margin, and the y axis pointing down
+    scale = (SPARKLINE_HEIGHT - 2) / spread
+    points = " ".join(
+        f"{idx * step:.1f},{SPARKLINE_HEIGHT - 1 - (value - low) * scale:.1f}"
+        for idx, value in enumerate(values)
+    )
+    return (
+        f'<svg width="{SPARKLINE_WIDTH}" height="{SPARKLINE_HEIGHT}">'
+        f'<polyline points="{points}"/></svg>'
+    )
+
+
+def get_day(key: str) -> str:
+    return key.rpartition("/")[0]
+
+
+def get_year(key: str) -> str:
+    return key.partition("/")[0]
+
+
+def aggregate(
+    history: dict[str, dict[str, float]], group: Callable[[str], str]
+) -> dict[str, list[float]]:
+    """Total time of the parts of every group, such as a day, per revision.
+
+    A group is made of the parts its latest revision timed, and only the
+    revisions that timed all of them are summed, so the totals stay comparable.
+    """
+    members: dict[str, set[str]] = {}
+    for timings in history.values():
+        latest: dict[str, set[str]] = {}
+        for key in timings:
+            latest.setdefault(group(key), set()).add(key)
+        members |= latest
+    return {
+        name: [
+            sum(timings[key] for key in keys)
+            for timings in history.values()
+            if keys <= timings.keys()
+        ]
+        for name, keys in members.items()
+    }
+
+
+def render_trends(title: str, label: str, series: dict[str, list[float]]) -> str:
+    """A row per entry, slowest first at its latest revision."""
+    rows = "".join(
+        f"<tr><td>{html.escape(name)}</td><td>{format_time(values[-1])}</td>"
+        f"<td>{render_sparkline(values)}</td><td>{len(values)}</td></tr>"
+        for name, values in sorted(
+            series.items(), key=lambda item: item[1][-1], reverse=True
+        )
+    )
+    return (
+        f"<h2>{title}</h2><table><tr><th>{label}</th><th>Latest</th>"
+        f"<th>History</th><th>Revisions</th></tr>{rows}</table>"
+    )
+
+
+def render_changes(title: str, changes: list[Change], css_class: str) -> str:
+    if not changes:
+        return f"<h2>{title}</h2><p>None.</p>"
+    rows = "".join(
+        f"<tr><td>{html.escape(c.key)}</td><td>{format_time(c.base)}</td>"
+        f"<td>{format_time(c.head)}</td>"
+        f'<td class="{css_class}">x{c.ratio:.2f}</td></tr>'
+        for c in changes
+    )
+    return (
+        f"<h2>{title}</h2><table><tr><th>Part</th><th>Base</th><th>Head</th>"
+        f"<th>Ratio</th></tr>{rows}</table>"
+    )
+
+
+def build_report(
+    history: dict[str, dict[str, float]],
+    base: str | None = None,
+    head: str | None = None,
+    threshold: float = DEFAULT_THRESHOLD,
+) -> str:
+    """`base` and `head` default to the last two revisions of the history."""
+    revisions = list(history)
+    if not revisions:
+        raise ValueError("No history yet, run `aoc run` first")
+    head = head or revisions[-1]
+    base = base or (revisions[-2] if len(revisions) > 1 else head)
+    for revision in (base, head):
+        if revision not in history:
+            raise ValueError(f"No timings recorded for revision {revision}")
+
+    parts = {
+        key: [history[r][key] for r in revisions if key in history[r]]
+        for timings in history.values()
+        for key in timings
+    }
+
+    regressions, improvements = compare(history[base], history[head], threshold)
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>Advent of Code timings</title>
+<style>{STYLE}</style>
+</head>
+<body>
+<h1>Advent of Code timings</h1>
+<p>{len(revisions)} revisions, changes above {threshold:.0%} between
+{html.escape(base)} (base) and {html.escape(head)} (head).</p>
+{render_changes("Regressions", regressions, "slower")}
+{render_changes("Improvements", improvements, "faster")}
+{render_trends("Years", "Year", aggregate(history, get_year))}
+{render_trends("Days, slowest first", "Day", aggregate(history, get_day))}
+{render_trends("Parts, slowest first", "Part", parts)}
+</body>
+</html>
+"""
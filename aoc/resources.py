@@ -0,0 +1,76 @@
+"""Memory and CPU accounting of a block of code.
+
+CPU times come from `getrusage`. The peak RSS is the growth of the high-water
+mark of the process over the block. On Linux, the mark is first reset to the
+current RSS through `/proc/self/clear_refs`; elsewhere, it is 0 when an earlier
+block of the same process already peaked higher.
+All of it is process-wide, and `tracemalloc` slows allocations down, so
+nothing is measured unless asked for, which the runner only does for days
+running in processes of their own.
+"""
+
+import contextlib
+import re
+import resource
+import sys
+import tracemalloc
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+CLEAR_REFS = Path("/proc/self/clear_refs")
+STATUS = Path("/proc/self/status")
+RESET_PEAK_RSS = "5"
+PEAK_RSS_PATTERN = re.compile(r"VmHWM:\s+(\d+) kB")
+
+# ru_maxrss is in bytes on macOS, and in KiB elsewhere
+MAXRSS_UNIT = 1 if sys.platform == "darwin" else 1024
+
+
+@dataclass
+class Resources:
+    user: float = 0.0
+    system: float = 0.0
+    peak_rss: int = 0
+    traced_peak: int | None = None
+
+
+def reset_peak_rss() -> None:
+    with contextlib.suppress(OSError):
+        CLEAR_REFS.write_text(RESET_PEAK_RSS)
+
+
+def get_peak_rss() -> int:
+    try:
+        if match := PEAK_RSS_PATTERN.search(STATUS.read_text()):
+            return int(match.group(1)) * 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * MAXRSS_UNIT
+
+
+@contextmanager
+def accounted(trace_memory: bool = False) -> Iterator[Resources]:
+    """Measure the block when `trace_memory` is set, else yield zeros."""
+    resources = Resources()
+    if not trace_memory:
+        yield resources
+        return
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    reset_peak_rss()
+    peak_rss_before = get_peak_rss()
+    usage_before = resource.getrusage(resource.RUSAGE_SELF)
+    try:
+        yield resources
+    finally:
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        resources.user = usage.ru_utime - usage_before.ru_utime
+        resources.system = usage.ru_stime - usage_before.ru_stime
+        resources.peak_rss = max(0, get_peak_rss() - peak_rss_before)
+        resources.traced_peak = tracemalloc.get_traced_memory()[1]
+        if not was_tracing:
+            tracemalloc.stop()
@@ -0,0 +1,275 @@
+import concurrent.futures
+import json
+import shutil
+import sys
+import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import partial
+from pathlib import Path
+
+from aoc import hashing
+from aoc.cache import AnswerStore, ParseCache, get_shared_modules
+from aoc.days import PARTS, STATE_DIR, Day, get_parser, get_solver, load_module, solve
+from aoc.inputs import InputStore
+from aoc.profiling import get_profile_path, profiled
+from aoc.resources import Resources, accounted
+
+TIMINGS_FILE = STATE_DIR / "timings.json"
+
+BACKENDS = ("auto", "process", "interpreter", "thread")
+
+
+@dataclass
+class Timing:
+    wall: float = 0.0
+    cpu: float = 0.0
+
+
+@contextmanager
+def timed() -> Iterator[Timing]:
+    timing = Timing()
+    wall_start = time.perf_counter()
+    # Per thread, as the in-process backends run several days at once
+    cpu_start = time.thread_time()
+    try:
+        yield timing
+    finally:
+        timing.wall = time.perf_counter() - wall_start
+        timing.cpu = time.thread_time() - cpu_start
+
+
+@dataclass(frozen=True)
+class RunOptions:
+    parse_cache: ParseCache | None = None
+    answers: AnswerStore | None = None
+    # Directory to write the cProfile stats of every phase to
+    profile_dir: Path | None = None
+    trace_memory: bool = False
+    # Processes a day may start itself, such as the 2016 MD5 miners
+    day_jobs: int = 1
+
+
+@dataclass
+class PartResult:
+    part: int
+    answer: str | None = None
+    error: str | None = None
+    parse: Timing = field(default_factory=Timing)
+    solve: Timing = field(default_factory=Timing)
+    resources: Resources = field(default_factory=Resources)
+    memoized: bool = False
+
+
+@dataclass
+class DayResult:
+    day: Day
+    parts: list[PartResult]
+
+    @property
+    def wall(self) -> float:
+        return sum(p.parse.wall + p.solve.wall for p in self.parts)
+
+    @property
+    def failed(self) -> bool:
+        return any(p.error for p in self.parts)
+
+    @property
+    def memoized(self) -> bool:
+        return any(p.memoized for p in self.parts)
+
+
+def get_profile_paths(
+    day: Day, part: int, options: RunOptions
+) -> tuple[Path | None, Path | None]:
+    """Where to write the profiles of the parse and solve phases, if profiling."""
+    if options.profile_dir is None:
+        return None, None
+    directory = options.profile_dir / day.name
+    return (
+        get_profile_path(directory, part, "parse"),
+        get_profile_path(directory, part, "solve"),
+    )
+
+
+def run_part(
+    day: Day,
+    part: int,
+    options: RunOptions | None = None,
+    inputs: InputStore | None = None,
+    *,
+    on_phase: Callable[[int, str], None] | None = None,
+    input_path: Path | None = None,
+) -> PartResult | None:
+    """Run a part, on the input of the day unless given `input_path`, calling
+    `on_phase(part, phase)` as each phase starts."""
+    options = options or RunOptions()
+    module = load_module(day)
+    solver = get_solver(module, part)
+    if solver is None:
+        return None
+
+    input_path = input_path or day.input_path(part)
+    if options.answers is not None:
+        answer = options.answers.get(module, input_path, part)
+        if answer is not None:
+            return PartResult(part, answer, memoized=True)
+
+    result = PartResult(part)
+    parser = get_parser(module, part)
+    parse_profile, solve_profile = get_profile_paths(day, part, options)
+    try:
+        with (
+            accounted(options.trace_memory) as result.resources,
+            hashing.worker_processes(options.day_jobs),
+        ):
+            if on_phase is not None:
+                on_phase(part, "parse")
+            with timed() as result.parse, profiled(parse_profile):
+                if options.parse_cache is None:
+                    parse = partial(parser, str(input_path))
+                else:
+                    parse = partial(options.parse_cache.parse, parser, str(input_path))
+                if inputs is None:
+                    data = parse()
+                else:
+                    data = inputs.parse(module, parser, input_path, parse)
+            if on_phase is not None:
+                on_phase(part, "solve")
+            with timed() as result.solve, profiled(solve_profile):
+                answer = solve(solver, data)
+        result.answer = str(answer)
+    except Exception as e:
+        result.error = f"{type(e).__name__}: {e}"
+    else:
+        if options.answers is not None:
+            options.answers.put(module, input_path, part, result.answer)
+    return result
+
+
+def clear_profiles(day: Day, options: RunOptions) -> None:
+    if options.profile_dir is not None:
+        # Do not leave the profiles of a phase that did not run this time
+        shutil.rmtree(options.profile_dir / day.name, ignore_errors=True)
+
+
+def get_load_error(day: Day) -> str | None:
+    """The error importing the day module raised, so that it fails the day
+    rather than the whole run."""
+    try:
+        load_module(day)
+    except Exception as e:
+        return f"{type(e).__name__}: {e}"
+    return None
+
+
+def run_day(day: Day, options: RunOptions | None = None) -> DayResult:
+    options = options or RunOptions()
+    clear_profiles(day, options)
+    if (error := get_load_error(day)) is not None:
+        return DayResult(day, [PartResult(PARTS[0], error=error)])
+    inputs = InputStore()
+    parts = [run_part(day, part, options, inputs) for part in PARTS]
+    return DayResult(day, [p for p in parts if p is not None])
+
+
+def load_timings() -> dict[str, float]:
+    try:
+        return json.loads(TIMINGS_FILE.read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_timings(results: Iterable[DayResult]) -> None:
+    timings = load_timings()
+    for result in results:
+        if not result.memoized:  # Not a runtime
+            timings[result.day.name] = result.wall
+    TIMINGS_FILE.parent.mkdir(exist_ok=True)
+    TIMINGS_FILE.write_text(json.dumps(timings, indent=2, sort_keys=True))
+
+
+def schedule(days: Iterable[Day], timings: dict[str, float]) -> list[Day]:
+    """Longest days first, so the slow ones do not end up as stragglers.
+
+    Days without a previous runtime go first, since they might be slow too.
+    """
+    return sorted(days, key=lambda d: -timings.get(d.name, float("inf")))
+
+
+def is_free_threaded() -> bool:
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+def uses_hashing(day: Day) -> bool:
+    try:
+        module = load_module(day)
+    except Exception:
+        return False  # Reported when the day runs
+    return hashing in get_shared_modules(module)
+
+
+def resolve_backend(
+    backend: str, options: RunOptions | None = None, days: Iterable[Day] = ()
+) -> str:
+    """The backend `run_days` uses for `backend`, falling back to processes.
+
+    Subinterpreters (Python 3.14+) and free-threaded threads skip the process
+    startup and the pickling of every task. The memory figures of
+    `--resources` are per process though, the profiler is one per
+    interpreter, and the miners of `aoc.hashing` start processes of their own,
+    so these need processes.
+    """
+    options = options or RunOptions()
+    interpreters = hasattr(concurrent.futures, "InterpreterPoolExecutor")
+    if (
+        options.trace_memory
+        or options.profile_dir is not None
+        or any(uses_hashing(day) for day in days)
+    ):
+        return "process"
+    if backend == "auto":
+        if interpreters:
+            return "interpreter"
+        return "thread" if is_free_threaded() else "process"
+    if backend == "interpreter" and not interpreters:
+        return "process"
+    if backend == "thread" and not is_free_threaded():
+        return "process"  # Threads would take turns holding the GIL
+    return backend
+
+
+def get_executor(backend: str, jobs: int | None) -> Executor:
+    if backend == "interpreter":
+        return concurrent.futures.InterpreterPoolExecutor(max_workers=jobs)
+    if backend == "thread":
+        return ThreadPoolExecutor(max_workers=jobs)
+    return ProcessPoolExecutor(max_workers=jobs)
+
+
+def run_days(
+    days: Iterable[Day],
+    jobs: int | None = None,
+    options: RunOptions | None = None,
+    backend: str = "auto",
+) -> Iterator[DayResult]:
+    """Run `days` across a pool of workers, yielding results as they complete."""
+    options = options or RunOptions()
+    ordered = schedule(days, load_timings())
+    if jobs == 1:
+        yield from (run_day(day, options) for day in ordered)
+        return
+
+    # The executor starts tasks in submission order
+    with get_executor(resolve_backend(backend, options, ordered), jobs) as executor:
+        futures = [executor.submit(run_day, day, options) for day in ordered]
+        for future in as_completed(futures):
+            yield future.result()
@@ -0,0 +1,177 @@
+"""Days run in a process of their own, killed past a wall time limit.
+
+The worker also caps its address space with `setrlimit`, so that a runaway
+allocation raises MemoryError in the part instead of taking the machine down.
+It reports every phase as it starts and every part as it ends: a killed day
+keeps its finished parts, and the wall time of the phase it was killed in.
+The worker leads a process group of its own, so that the processes a day
+starts, such as the `aoc.hashing` miners, are killed along with it.
+"""
+
+import multiprocessing
+import os
+import resource
+import signal
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from multiprocessing.connection import Connection
+from multiprocessing.process import BaseProcess
+from pathlib import Path
+
+from aoc.days import PARTS, Day
+from aoc.inputs import InputStore
+from aoc.runner import (
+    DayResult,
+    PartResult,
+    RunOptions,
+    Timing,
+    clear_profiles,
+    get_load_error,
+    load_timings,
+    run_part,
+    schedule,
+)
+
+# Workers are forked from a server process rather than from the threads
+# waiting on them, which is unsafe
+CONTEXT = multiprocessing.get_context("forkserver")
+
+
+@dataclass(frozen=True)
+class Limits:
+    timeout: float | None = None  # Wall seconds per day
+    memory: int | None = None  # Bytes of address space per worker
+
+
+def limit_memory(memory: int) -> None:
+    _, hard = resource.getrlimit(resource.RLIMIT_AS)
+    if hard != resource.RLIM_INFINITY:
+        memory = min(memory, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (memory, hard))
+
+
+@dataclass(frozen=True)
+class Task:
+    day: Day
+    parts: tuple[int, ...] = PARTS
+    input_path: Path | None = None  # The inputs of the day when None
+
+
+def work(task: Task, options: RunOptions, memory: int | None, sender: Connection):
+    os.setpgrp()
+    if memory is not None:
+        limit_memory(memory)
+    clear_profiles(task.day, options)
+    if (error := get_load_error(task.day)) is not None:
+        sender.send(PartResult(task.parts[0], error=error))
+        sender.close()
+        return
+    inputs = InputStore()
+    for part in task.parts:
+        result = run_part(
+            task.day,
+            part,
+            options,
+            inputs,
+            on_phase=lambda *p: sender.send(p),
+            input_path=task.input_path,
+        )
+        if result is not None:
+            sender.send(result)
+    sender.close()
+
+
+def run_sandboxed(
+    day: Day,
+    options: RunOptions,
+    limits: Limits,
+    parts: tuple[int, ...] = PARTS,
+    input_path: Path | None = None,
+) -> DayResult:
+    """Run the `parts` of a day in a worker, on the inputs of the day unless
+    given `input_path`."""
+    receiver, sender = CONTEXT.Pipe(duplex=False)
+    task = Task(day, parts, input_path)
+    # Not a daemon, which could not start the processes of `--day-jobs`
+    process = CONTEXT.Process(target=work, args=(task, options, limits.memory, sender))
+    start = time.perf_counter()
+    deadline = None if limits.timeout is None else start + limits.timeout
+    process.start()
+    sender.close()  # So that the receiver sees the end of the worker
+
+    results: list[PartResult] = []
+    # Phases of the part being run, as (part, phase, start)
+    phases: list[tuple[int, str, float]] = []
+    error = None
+    while True:
+        timeout = None if deadline is None else max(0, deadline - time.perf_counter())
+        if not receiver.poll(timeout):
+            error = f"Killed after the {limits.timeout:g} s timeout"
+            break
+        try:
+            message = receiver.recv()
+        except EOFError:
+            break
+        if isinstance(message, PartResult):
+            results.append(message)
+            phases.clear()
+        else:
+            phases.append((*message, time.perf_counter()))
+    end = time.perf_counter()
+    if error is not None:
+        kill(process)
+    process.join()
+
+    if error is None and process.exitcode != 0:
+        error = f"Worker died with exit code {process.exitcode}"
+    if error is not None:
+        done = {result.part for result in results}
+        part = next((p for p in task.parts if p not in done), task.parts[-1])
+        results.append(get_partial_result(part, phases, end, error))
+    return DayResult(day, results)
+
+
+def kill(process: BaseProcess) -> None:
+    """Kill the worker with the processes it started, or only the worker while
+    it has no process group of its own yet."""
+    try:
+        os.killpg(process.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        process.kill()
+
+
+def get_partial_result(
+    part: int, phases: list[tuple[int, str, float]], end: float, error: str
+) -> PartResult:
+    """A part stopped at `end`, with the wall times of the phases it went through.
+
+    CPU times stay at 0, as only the worker measures them.
+    """
+    if not phases:  # Stopped before or between parts
+        return PartResult(part, error=error)
+    result = PartResult(phases[0][0], error=error)
+    ends = [start for _, _, start in phases[1:]] + [end]
+    for (_, phase, start), phase_end in zip(phases, ends, strict=True):
+        setattr(result, phase, Timing(wall=phase_end - start))
+    return result
+
+
+def run_days(
+    days: Iterable[Day],
+    jobs: int | None = None,
+    options: RunOptions | None = None,
+    limits: Limits | None = None,
+) -> Iterator[DayResult]:
+    """Like `runner.run_days`, with every day in a fresh process under `limits`."""
+    options = options or RunOptions()
+    limits = limits or Limits()
+    ordered = schedule(days, load_timings())
+    # The threads only wait on the worker processes
+    with ThreadPoolExecutor(max_workers=jobs or os.cpu_count()) as executor:
+        futures = [
+            executor.submit(run_sandboxed, day, options, limits) for day in ordered
+        ]
+        for future in as_completed(futures):
+            yield future.result()
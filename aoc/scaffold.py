@@ -0,0 +1,70 @@
+"""Skeleton of a new day, ready for the runner, the benchmarks and `aoc scale`.
+
+The module parses the input bytes in `parse(data)`, so the runner reads the
+input and times the parse itself, and it finds its inputs next to its source
+rather than in the working directory. The input files start as the fixture of
+the example from the puzzle statement.
+"""
+
+from pathlib import Path
+
+from aoc.days import Day
+
+TEMPLATE = '''\
+import random
+import time
+from pathlib import Path
+
+DIRECTORY = Path(__file__).parent
+
+
+def part_one(lines: list[str]):
+    pass
+
+
+def part_two(lines: list[str]):
+    pass
+
+
+def parse(data: bytes) -> list[str]:
+    return data.decode().splitlines()
+
+
+def generate_input(size: int, rng: random.Random) -> str:
+    """`size` lines drawn from the example, until a real generator is written."""
+    lines = (DIRECTORY / "input_part_1.txt").read_text().splitlines(keepends=True)
+    if not lines:
+        raise ValueError("No generator yet, and the example input is empty")
+    return "".join(rng.choices(lines, k=size))
+
+
+def main():
+    for part, solver in enumerate((part_one, part_two), start=1):
+        path = DIRECTORY / f"input_part_{part}.txt"
+        if not path.exists():
+            path = DIRECTORY / "input_part_1.txt"
+        start = time.perf_counter()
+        result = solver(parse(path.read_bytes()))
+        elapsed = time.perf_counter() - start
+        print(f"Result part {part}: {result} ({elapsed * 1000:.2f} ms)")
+
+
+if __name__ == "__main__":
+    main()
+'''
+
+
+def generate_day(day: Day) -> list[Path]:
+    """Write the files of a new day, leaving existing ones untouched."""
+    files = {
+        day.source: TEMPLATE,
+        # Shared by both parts, until part two needs an example of its own
+        day.directory / "input_part_1.txt": "",
+    }
+    day.directory.mkdir(parents=True, exist_ok=True)
+    created = []
+    for path, content in files.items():
+        if not path.exists():
+            path.write_text(content)
+            created.append(path)
+    return created
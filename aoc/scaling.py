@@ -0,0 +1,112 @@
+"""Empirical complexity of the solvers, on generated inputs of growing size.
+
+A day opts in by exposing `generate_input(size, rng)`, returning the text of
+a valid input whose size grows linearly with `size`. The sweep doubles the
+size until a run exceeds its time budget, and fits `time = c * size ** k` by
+least squares on the log-log points: `k` is the empirical exponent.
+"""
+
+import math
+import random
+import tempfile
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+from aoc.days import PARTS, Day, get_parser, get_solver, load_module, solve
+
+# Runs shorter than this are mostly noise, and left out of the fit
+MIN_FIT_TIME = 0.001
+
+Generator = Callable[[int, random.Random], str]
+
+
+@dataclass
+class Sweep:
+    part: int
+    points: list[tuple[int, float]]  # (size, best time in seconds)
+    error: str | None = None
+
+    @property
+    def exponent(self) -> float | None:
+        return fit_exponent([p for p in self.points if p[1] >= MIN_FIT_TIME])
+
+    def is_done(self, budget: float) -> bool:
+        return self.error is not None or (
+            bool(self.points) and self.points[-1][1] > budget
+        )
+
+
+def get_generator(day: Day) -> Generator | None:
+    return getattr(load_module(day), "generate_input", None)
+
+
+def fit_exponent(points: list[tuple[int, float]]) -> float | None:
+    """Slope of the least squares line through the (log size, log time) points."""
+    if len(points) < 2:
+        return None
+    xs = [math.log(size) for size, _ in points]
+    ys = [math.log(elapsed) for _, elapsed in points]
+    x_mean = sum(xs) / len(xs)
+    y_mean = sum(ys) / len(ys)
+    variance = sum((x - x_mean) ** 2 for x in xs)
+    covariance = sum((x - x_mean) * (y - y_mean) for x, y in zip(xs, ys, strict=True))
+    return covariance / variance
+
+
+def time_part(day: Day, part: int, input_path: Path, repeat: int) -> float:
+    """Best parse and solve time over `repeat` runs, parsing afresh each time."""
+    module = load_module(day)
+    parser = get_parser(module, part)
+    solver = get_solver(module, part)
+    best = math.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        solve(solver, parser(str(input_path)))
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+@dataclass(frozen=True)
+class Settings:
+    min_size: int = 100
+    max_steps: int = 8  # Size doublings
+    budget: float = 1.0  # Seconds a run may take before the size stops growing
+    repeat: int = 3
+    seed: int = 0
+
+
+def sweep(day: Day, settings: Settings) -> list[Sweep]:
+    generator = get_generator(day)
+    if generator is None:
+        raise ValueError(f"{day.name} has no generate_input function")
+    module = load_module(day)
+    sweeps = [Sweep(part, []) for part in PARTS if get_solver(module, part)]
+
+    with tempfile.TemporaryDirectory() as directory:
+        input_path = Path(directory) / "input.txt"
+        for step in range(settings.max_steps):
+            size = settings.min_size * 2**step
+            try:
+                input_path.write_text(generator(size, random.Random(settings.seed)))
+            except Exception as e:
+                error = f"size {size}: generate_input: {type(e).__name__}: {e}"
+                for part_sweep in sweeps:
+                    if not part_sweep.is_done(settings.budget):
+                        part_sweep.error = error
+                break
+            for part_sweep in sweeps:
+                if part_sweep.is_done(settings.budget):
+                    continue
+                try:
+                    elapsed = time_part(
+                        day, part_sweep.part, input_path, settings.repeat
+                    )
+                except Exception as e:
+                    part_sweep.error = f"size {size}: {type(e).__name__}: {e}"
+                    continue
+                part_sweep.points.append((size, elapsed))
+            if all(s.is_done(settings.budget) for s in sweeps):
+                break
+    return sweeps
@@ -0,0 +1,189 @@
+"""Graph searches over hashable states, shared by the path finding days.
+
+States are meant to be packed into plain ints, such as `y * width + x` for a
+grid position, so that visiting a state costs an int hash instead of a
+dataclass `__hash__`. When the states are the ints `0 <= state < size`, passing
+`size` switches the visited set to a bytearray and the parents to an array,
+which are indexed directly rather than hashed.
+
+Searches explore the frontier one layer at a time, so the depth is tracked per
+layer instead of being stored with every state.
+"""
+
+import heapq
+from array import array
+from collections import defaultdict
+from collections.abc import Callable, Hashable, Iterable, MutableMapping
+from itertools import count
+from typing import TypeVar
+
+State = TypeVar("State", bound=Hashable)
+
+Neighbours = Callable[[State], Iterable[State]]
+WeightedNeighbours = Callable[[State], Iterable[tuple[State, int]]]
+
+NO_PARENT = -1
+
+
+def make_visited(size: int | None = None) -> MutableMapping[State, int]:
+    """A mapping of states to 0 for unvisited states, and 1 once visited."""
+    if size is None:
+        return defaultdict(int)
+    return bytearray(size)
+
+
+def make_parents(size: int | None = None) -> MutableMapping[State, State]:
+    if size is None:
+        return {}
+    return array("q", [NO_PARENT]) * size
+
+
+def reconstruct_path(
+    parents: MutableMapping[State, State], start: State, goal: State
+) -> list[State]:
+    path = [goal]
+    while path[-1] != start:
+        path.append(parents[path[-1]])
+    path.reverse()
+    return path
+
+
+def bfs(
+    start: State,
+    get_neighbours: Neighbours,
+    is_goal: Callable[[State], bool],
+    size: int | None = None,
+) -> tuple[State, int]:
+    """Return the closest goal state, and its distance from `start`."""
+    visited = make_visited(size)
+    visited[start] = 1
+    frontier = [start]
+    depth = 0
+    while frontier:
+        next_frontier = []
+        for state in frontier:
+            if is_goal(state):
+                return state, depth
+            for neighbour in get_neighbours(state):
+                if not visited[neighbour]:
+                    visited[neighbour] = 1
+                    next_frontier.append(neighbour)
+        frontier = next_frontier
+        depth += 1
+    raise ValueError(f"No path found from {start}")
+
+
+def bfs_path(
+    start: State,
+    get_neighbours: Neighbours,
+    is_goal: Callable[[State], bool],
+    size: int | None = None,
+) -> list[State]:
+    """Return the states of a shortest path to a goal, `start` included."""
+    parents = make_parents(size)
+    visited = make_visited(size)
+    visited[start] = 1
+    frontier = [start]
+    while frontier:
+        next_frontier = []
+        for state in frontier:
+            if is_goal(state):
+                return reconstruct_path(parents, start, state)
+            for neighbour in get_neighbours(state):
+                if not visited[neighbour]:
+                    visited[neighbour] = 1
+                    parents[neighbour] = state
+                    next_frontier.append(neighbour)
+        frontier = next_frontier
+    raise ValueError(f"No path found from {start}")
+
+
+def bfs_distances(
+    start: State, get_neighbours: Neighbours, max_depth: int | None = None
+) -> dict[State, int]:
+    """Return the distance of every state reachable in at most `max_depth` steps."""
+    distances = {start: 0}
+    frontier = [start]
+    depth = 0
+    while frontier and depth != max_depth:
+        depth += 1
+        next_frontier = []
+        for state in frontier:
+            for neighbour in get_neighbours(state):
+                if neighbour not in distances:
+                    distances[neighbour] = depth
+                    next_frontier.append(neighbour)
+        frontier = next_frontier
+    return distances
+
+
+def bidirectional_bfs(start: State, goal: State, get_neighbours: Neighbours) -> int:
+    """Return the distance from `start` to `goal` in an undirected graph.
+
+    Both searches advance one full layer at a time, always on the smaller
+    frontier, and stop at the layer where they meet.
+    """
+    if start == goal:
+        return 0
+    forward, backward = {start: 0}, {goal: 0}
+    forward_frontier, backward_frontier = [start], [goal]
+    while forward_frontier and backward_frontier:
+        if len(backward_frontier) < len(forward_frontier):
+            forward, backward = backward, forward
+            forward_frontier, backward_frontier = backward_frontier, forward_frontier
+
+        shortest = None
+        next_frontier = []
+        for state in forward_frontier:
+            depth = forward[state] + 1
+            for neighbour in get_neighbours(state):
+                if neighbour in backward:
+                    distance = depth + backward[neighbour]
+                    if shortest is None or distance < shortest:
+                        shortest = distance
+                elif neighbour not in forward:
+                    forward[neighbour] = depth
+                    next_frontier.append(neighbour)
+        if shortest is not None:
+            return shortest
+        forward_frontier = next_frontier
+    raise ValueError(f"No path found from {start} to {goal}")
+
+
+def a_star(
+    start: State,
+    get_neighbours: WeightedNeighbours,
+    is_goal: Callable[[State], bool],
+    heuristic: Callable[[State], int],
+) -> tuple[State, int]:
+    """Return the closest goal state, and its cost from `start`.
+
+    `heuristic` must never overestimate the cost left to reach a goal.
+    """
+    costs = {start: 0}
+    # The counter breaks ties, so states themselves are never compared
+    tie_breaker = count()
+    queue = [(heuristic(start), next(tie_breaker), 0, start)]
+    while queue:
+        _, _, cost, state = heapq.heappop(queue)
+        if cost > costs[state]:
+            continue  # Already reached by a cheaper path
+        if is_goal(state):
+            return state, cost
+        for neighbour, step_cost in get_neighbours(state):
+            new_cost = cost + step_cost
+            if new_cost < costs.get(neighbour, new_cost + 1):
+                costs[neighbour] = new_cost
+                priority = new_cost + heuristic(neighbour)
+                entry = (priority, next(tie_breaker), new_cost, neighbour)
+                heapq.heappush(queue, entry)
+    raise ValueError(f"No path found from {start}")
+
+
+def dijkstra(
+    start: State,
+    get_neighbours: WeightedNeighbours,
+    is_goal: Callable[[State], bool],
+) -> tuple[State, int]:
+    """Return the closest goal state, and its cost from `start`."""
+    return a_star(start, get_neighbours, is_goal, lambda _: 0)
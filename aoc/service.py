@@ -0,0 +1,199 @@
+"""A local HTTP service answering parts for inputs posted as JSON.
+
+`POST /solve` takes `{"year": 2019, "day": 1, "part": 1, "input": "..."}`
+and returns the answer, or the error, with the parse and solve times. Every
+part runs in a fresh sandboxed process, under the time and memory limits of
+the service, at most `jobs` at once; a fresh process also runs the current
+source of the day. A request for the same part, source and input as a
+running one waits for its result instead of running again, and the results
+of recent requests are kept in an LRU cache. The service binds to the
+loopback interface only, and never needs the network.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+from aoc.cache import get_source_digest
+from aoc.days import PARTS, Day, load_module
+from aoc.runner import PartResult, RunOptions
+from aoc.sandbox import Limits, run_sandboxed
+
+DEFAULT_PORT = 8025
+DEFAULT_CACHE_SIZE = 256
+DEFAULT_TIMEOUT = 60.0
+
+FIELDS = {"year": int, "day": int, "part": int, "input": str}
+
+# Day, part and digest of the source and of the input
+Key = tuple[Day, int, str]
+
+
+@dataclass(frozen=True)
+class Request:
+    day: Day
+    part: int
+    input: str
+
+    @classmethod
+    def from_payload(cls, payload: Any) -> "Request":
+        if not isinstance(payload, dict):
+            raise ValueError("Expected a JSON object")
+        for name, kind in FIELDS.items():
+            if not isinstance(payload.get(name), kind):
+                raise ValueError(f"Expected {name} to be a {kind.__name__}")
+        day = Day(payload["year"], payload["day"])
+        if not day.source.is_file():
+            raise ValueError(f"No solution found for {day.name}")
+        if payload["part"] not in PARTS:
+            raise ValueError(f"No part {payload['part']}")
+        return cls(day, payload["part"], payload["input"])
+
+    @property
+    def key(self) -> Key:
+        digest = hashlib.sha256(get_day_digest(self.day))
+        digest.update(self.input.encode())
+        return (self.day, self.part, digest.hexdigest())
+
+
+def get_day_digest(day: Day) -> bytes:
+    """Hash of the source of the day and of the shared code it uses, as the
+    workers load it afresh."""
+    try:
+        module = load_module(day)
+    except Exception:  # Fails again in the worker, which reports it
+        return hashlib.sha256(day.source.read_bytes()).digest()
+    return get_source_digest(module)
+
+
+def solve_part(day: Day, part: int, input_path: Path, limits: Limits) -> PartResult:
+    result = run_sandboxed(day, RunOptions(), limits, (part,), input_path)
+    if not result.parts:
+        return PartResult(part, error=f"{day.name} has no part {part}")
+    return result.parts[0]
+
+
+class SolverService:
+    def __init__(
+        self,
+        jobs: int | None = None,
+        limits: Limits | None = None,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ):
+        # The threads only wait on the sandboxed processes
+        self.executor = ThreadPoolExecutor(max_workers=jobs or os.cpu_count())
+        self.limits = limits or Limits(DEFAULT_TIMEOUT)
+        self.cache_size = cache_size
+        self.results: OrderedDict[Key, PartResult] = OrderedDict()
+        self.running: dict[Key, Future[PartResult]] = {}
+        # Reentrant, as a future done at once runs its callback in `submit`
+        self.lock = threading.RLock()
+        self.directory = tempfile.TemporaryDirectory(prefix="aoc-service-")
+
+    def solve(self, request: Request) -> tuple[PartResult, str]:
+        """Return the result, and whether it was `solved`, `coalesced` with a
+        running request or `cached`."""
+        key = request.key
+        with self.lock:
+            if (result := self.results.get(key)) is not None:
+                self.results.move_to_end(key)
+                return result, "cached"
+            future = self.running.get(key)
+            status = "coalesced"
+            if future is None:
+                future = self.submit(key, request)
+                status = "solved"
+        # A worker killed by the day is reported in the result, so anything
+        # raised here is an error of the service
+        return future.result(), status
+
+    def submit(self, key: Key, request: Request) -> Future[PartResult]:
+        """Start solving a request, the lock being held."""
+        # One file per running key, as the other part may run on the same input
+        _, part, digest = key
+        input_path = Path(self.directory.name) / f"{digest}_part_{part}.txt"
+        input_path.write_text(request.input)
+        try:
+            future = self.executor.submit(
+                solve_part, request.day, request.part, input_path, self.limits
+            )
+        except BaseException:
+            input_path.unlink(missing_ok=True)
+            raise
+        self.running[key] = future
+        future.add_done_callback(lambda f: self.finish(key, f, input_path))
+        return future
+
+    def finish(self, key: Key, future: Future[PartResult], input_path: Path) -> None:
+        with self.lock:
+            del self.running[key]
+            input_path.unlink(missing_ok=True)
+            if future.exception() is not None or future.result().error:
+                return  # Possibly transient, such as a memory error
+            self.results[key] = future.result()
+            while len(self.results) > self.cache_size:
+                self.results.popitem(last=False)
+
+    def close(self) -> None:
+        self.executor.shutdown(cancel_futures=True)
+        self.directory.cleanup()
+
+
+def format_result(request: Request, result: PartResult, status: str) -> dict:
+    return {
+        "year": request.day.year,
+        "day": request.day.day,
+        "part": request.part,
+        "answer": result.answer,
+        "error": result.error,
+        "parse": {"wall": result.parse.wall, "cpu": result.parse.cpu},
+        "solve": {"wall": result.solve.wall, "cpu": result.solve.cpu},
+        "status": status,
+    }
+
+
+class SolverHandler(BaseHTTPRequestHandler):
+    server: "SolverServer"
+
+    def send_json(self, status: HTTPStatus, body: dict) -> None:
+        content = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def do_POST(self) -> None:
+        if self.path != "/solve":
+            self.send_json(HTTPStatus.NOT_FOUND, {"error": f"No route {self.path}"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            request = Request.from_payload(json.loads(self.rfile.read(length)))
+        except ValueError as e:
+            self.send_json(HTTPStatus.BAD_REQUEST, {"error": str(e)})
+            return
+        try:
+            result, status = self.server.service.solve(request)
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            self.send_json(HTTPStatus.INTERNAL_SERVER_ERROR, {"error": error})
+            return
+        self.send_json(HTTPStatus.OK, format_result(request, result, status))
+
+
+class SolverServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], service: SolverService):
+        super().__init__(address, SolverHandler)
+        self.service = service
@@ -0,0 +1,44 @@
+"""Integers parsed straight from the bytes of an input.
+
+Decoding an input, then splitting it into str tokens, allocates two objects
+per number before `int` parses them in Python. Here, every byte that cannot
+be part of a number is translated to a comma in one pass, and the result is
+parsed as a JSON array by the C decoder of the `json` module.
+"""
+
+import json
+import re
+from pathlib import Path
+
+SIGNED_INTEGER = re.compile(rb"-?\d+")
+UNSIGNED_INTEGER = re.compile(rb"\d+")
+
+
+def make_separators(kept: bytes) -> bytes:
+    """A translation table turning every byte but `kept` into a comma."""
+    return bytes(byte if byte in kept else ord(",") for byte in range(256))
+
+
+SIGNED_SEPARATORS = make_separators(b"-0123456789")
+UNSIGNED_SEPARATORS = make_separators(b"0123456789")
+
+
+def parse_ints(data: bytes, signed: bool = True) -> list[int]:
+    """Every integer in `data`, whatever separates them.
+
+    Unless `signed`, a `-` separates numbers, as in the `5-8` ranges.
+    """
+    text = data.translate(SIGNED_SEPARATORS if signed else UNSIGNED_SEPARATORS)
+    while b",," in text:
+        text = text.replace(b",,", b",")
+    try:
+        return json.loads(b"[" + text.strip(b",") + b"]")
+    except json.JSONDecodeError:
+        # Leading zeros and minus signs between numbers are not valid JSON
+        pattern = SIGNED_INTEGER if signed else UNSIGNED_INTEGER
+        return list(map(int, pattern.findall(data)))
+
+
+def read_ints(path: str | Path, signed: bool = True) -> list[int]:
+    with open(path, "rb") as f:
+        return parse_ints(f.read(), signed)
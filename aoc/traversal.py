@@ -0,0 +1,84 @@
+"""Tree and DAG traversals with an explicit stack instead of recursion.
+
+Recursive solvers pay a frame per node and stop at the recursion limit, a few
+thousand levels deep. These helpers keep the pending nodes, with an iterator
+over their remaining children, on a list, so the depth is only bounded by
+memory.
+"""
+
+from collections.abc import Callable, Hashable, Iterable, Iterator
+from typing import TypeVar
+
+Node = TypeVar("Node")
+Key = TypeVar("Key", bound=Hashable)
+Value = TypeVar("Value")
+
+
+def post_order(
+    root: Node, get_children: Callable[[Node], Iterable[Node]]
+) -> Iterator[Node]:
+    """Nodes of the tree under `root`, each one after all of its children."""
+    stack = [(root, iter(get_children(root)))]
+    while stack:
+        node, children = stack[-1]
+        for child in children:
+            stack.append((child, iter(get_children(child))))
+            break
+        else:
+            stack.pop()
+            yield node
+
+
+def fold_tree(
+    root: Node,
+    get_children: Callable[[Node], Iterable[Node]],
+    combine: Callable[[Node, list[Value]], Value],
+) -> Value:
+    """Combine every node with the values of its children, bottom up.
+
+    Nodes do not need to be hashable, but a node reached twice is evaluated
+    twice: use `evaluate_dag` when subtrees are shared.
+    """
+    stack = [(root, iter(get_children(root)), [])]
+    while True:
+        node, children, values = stack[-1]
+        for child in children:
+            stack.append((child, iter(get_children(child)), []))
+            break
+        else:
+            stack.pop()
+            value = combine(node, values)
+            if not stack:
+                return value
+            stack[-1][2].append(value)
+
+
+def evaluate_dag(
+    root: Key,
+    get_children: Callable[[Key], Iterable[Key]],
+    combine: Callable[[Key, list[Value]], Value],
+) -> Value:
+    """Like `fold_tree`, but every node is evaluated once, however many parents
+    it has. Raise ValueError on a cycle.
+    """
+    values: dict[Key, Value] = {}
+    # Children of the nodes being evaluated, which are the nodes on the path
+    children_of: dict[Key, list[Key]] = {}
+    stack = [root]
+    while stack:
+        node = stack[-1]
+        if node in values:
+            stack.pop()
+            continue
+        if node not in children_of:
+            children = children_of[node] = list(get_children(node))
+            for child in children:
+                if child in values:
+                    continue
+                if child in children_of:
+                    raise ValueError(f"Cycle through {child!r}")
+                stack.append(child)
+            continue
+        stack.pop()
+        values[node] = combine(node, [values[c] for c in children_of.pop(node)])
+    return values[root]
@@ -0,0 +1,252 @@
+"""A server forking every day from a process that has already imported them.
+
+Running `python day_XX.py` pays the interpreter startup, the imports of the
+day and of the modules it uses, and the compilation of the regular
+expressions it builds, which dominates the cheap days. The server pays them
+once: it loads every day module, compiles the constant patterns their
+functions pass to `re`, and then forks a child per request, which inherits
+all of it and only parses and solves. The children run under the sandbox
+limits: they cap their own address space, and lead a process group that the
+client kills past the timeout.
+"""
+
+import ast
+import contextlib
+import os
+import re
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from multiprocessing.connection import Client, Connection, Listener
+from pathlib import Path
+from types import ModuleType
+
+from aoc.days import PARTS, ROOT, Day, load_module
+from aoc.runner import (
+    DayResult,
+    PartResult,
+    RunOptions,
+    load_timings,
+    run_day,
+    schedule,
+)
+from aoc.sandbox import CONTEXT, Limits, limit_memory
+
+# Index of the positional `flags` argument of the `re` functions
+FLAGS_POSITIONS = {
+    "compile": 1,
+    "search": 2,
+    "match": 2,
+    "fullmatch": 2,
+    "findall": 2,
+    "finditer": 2,
+    "split": 3,
+    "sub": 4,
+    "subn": 4,
+}
+
+
+def get_flags(node: ast.expr) -> int | None:
+    """The value of flags such as `re.I | re.M`, or None if not constant."""
+    if isinstance(node, ast.Constant) and isinstance(node.value, int):
+        return node.value
+    if (
+        isinstance(node, ast.Attribute)
+        and isinstance(node.value, ast.Name)
+        and node.value.id == "re"
+    ):
+        return getattr(re, node.attr, None)
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.BitOr):
+        left, right = get_flags(node.left), get_flags(node.right)
+        if left is not None and right is not None:
+            return left | right
+    return None
+
+
+def precompile_patterns(module: ModuleType) -> int:
+    """Compile the constant patterns that the module passes to `re`, so that
+    they are in its cache, and return how many there are."""
+    tree = ast.parse(Path(module.__file__).read_bytes())
+    count = 0
+    for node in ast.walk(tree):
+        if not (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Attribute)
+            and isinstance(node.func.value, ast.Name)
+            and node.func.value.id == "re"
+            and node.func.attr in FLAGS_POSITIONS
+            and node.args
+            and isinstance(node.args[0], ast.Constant)
+            and isinstance(node.args[0].value, str | bytes)
+        ):
+            continue
+        flags = 0
+        flags_position = FLAGS_POSITIONS[node.func.attr]
+        flags_nodes = [k.value for k in node.keywords if k.arg == "flags"]
+        flags_nodes += node.args[flags_position : flags_position + 1]
+        if flags_nodes and (flags := get_flags(flags_nodes[0])) is None:
+            continue
+        try:
+            re.compile(node.args[0].value, flags)
+        except re.error:
+            continue
+        count += 1
+    return count
+
+
+@dataclass(frozen=True)
+class Preload:
+    days: int
+    patterns: int
+    elapsed: float  # Wall seconds
+
+
+def preload(days: Iterable[Day]) -> Preload:
+    start = time.perf_counter()
+    loaded = patterns = 0
+    for day in days:
+        try:
+            module = load_module(day)
+        except Exception:
+            continue  # Reported when the day runs
+        loaded += 1
+        patterns += precompile_patterns(module)
+    return Preload(loaded, patterns, time.perf_counter() - start)
+
+
+def serve(days: list[Day], address: str, authkey: bytes, ready: Connection) -> None:
+    with Listener(address, authkey=authkey) as listener:
+        ready.send(preload(days))
+        ready.close()
+        # Let the kernel reap the children
+        signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+        while True:
+            connection = listener.accept()
+            if os.fork() == 0:
+                signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+                listener.close()
+                try:
+                    os.setpgrp()
+                    day, options, memory = connection.recv()
+                    if memory is not None:
+                        limit_memory(memory)
+                    connection.send(os.getpid())
+                    connection.send(run_day(day, options))
+                finally:
+                    os._exit(0)
+            connection.close()
+
+
+class WarmPool:
+    """The fork server, with the days loaded, and a client for every request."""
+
+    def __init__(self, days: list[Day]):
+        self.directory = tempfile.TemporaryDirectory(prefix="aoc-warm-")
+        self.address = str(Path(self.directory.name) / "server.sock")
+        self.authkey = os.urandom(16)
+        receiver, sender = CONTEXT.Pipe(duplex=False)
+        # Not a daemon, whose children could not start the processes of
+        # `--day-jobs`
+        self.process = CONTEXT.Process(
+            target=serve, args=(days, self.address, self.authkey, sender)
+        )
+        self.process.start()
+        sender.close()
+        self.preload: Preload = receiver.recv()
+
+    def run(
+        self, day: Day, options: RunOptions | None = None, limits: Limits | None = None
+    ) -> DayResult:
+        options = options or RunOptions()
+        limits = limits or Limits()
+        with Client(self.address, authkey=self.authkey) as connection:
+            connection.send((day, options, limits.memory))
+            try:
+                pid = connection.recv()
+                if not connection.poll(limits.timeout):
+                    with contextlib.suppress(ProcessLookupError):
+                        os.killpg(pid, signal.SIGKILL)
+                    error = f"Killed after the {limits.timeout:g} s timeout"
+                    return DayResult(day, [PartResult(PARTS[0], error=error)])
+                return connection.recv()
+            except EOFError:
+                error = "Worker died before reporting"
+                return DayResult(day, [PartResult(PARTS[0], error=error)])
+
+    def close(self) -> None:
+        self.process.terminate()
+        self.process.join()
+        self.directory.cleanup()
+
+    def __enter__(self) -> "WarmPool":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+
+def run_days(
+    days: Iterable[Day],
+    jobs: int | None = None,
+    options: RunOptions | None = None,
+    limits: Limits | None = None,
+) -> Iterator[DayResult]:
+    """Like `runner.run_days`, with every day forked from a warm server and run
+    under `limits`."""
+    ordered = schedule(days, load_timings())
+    with (
+        WarmPool(ordered) as pool,
+        # The threads only wait on the forked children
+        ThreadPoolExecutor(max_workers=jobs or os.cpu_count()) as executor,
+    ):
+        futures = [executor.submit(pool.run, day, options, limits) for day in ordered]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+@dataclass
+class Startup:
+    day: Day
+    work: float  # Wall seconds parsing and solving, as measured by the runner
+    warm: float  # Wall seconds of a request to the warm server
+    cold: float  # Wall seconds of `python day_XX.py`
+
+    @property
+    def warm_overhead(self) -> float:
+        return self.warm - self.work
+
+    @property
+    def cold_overhead(self) -> float:
+        return self.cold - self.work
+
+
+def run_cold(day: Day) -> float:
+    """Wall time of running the day as a script, from its directory."""
+    environment = {**os.environ, "PYTHONPATH": str(ROOT)}
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, day.source.name],
+        cwd=day.directory,
+        env=environment,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        check=False,
+    )
+    return time.perf_counter() - start
+
+
+def measure_startup(pool: WarmPool, day: Day, repeat: int) -> Startup:
+    """Best of `repeat` warm and cold runs of a day."""
+    work = warm = cold = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = pool.run(day)
+        warm = min(warm, time.perf_counter() - start)
+        work = min(work, result.wall)
+        cold = min(cold, run_cold(day))
+    return Startup(day, work, warm, cold)
@@ -0,0 +1,176 @@
+"""Days run again as soon as their source or one of their inputs is saved.
+
+The files of the watched days are polled, which needs nothing beyond the
+standard library, unlike inotify. Days run in a long-lived worker process,
+which keeps the day modules and the shared code they use imported between
+runs; only an edited module is executed again. An edit to the `aoc` package
+starts a fresh worker instead, as the day modules hold on to the shared code
+they imported. Parsed inputs are cached by the source of the parser and of
+what it calls, rather than of the whole module, so editing a solver skips
+the parse.
+"""
+
+import ast
+import contextlib
+import hashlib
+import sys
+from collections.abc import Callable, Iterable
+from multiprocessing.connection import Connection
+from pathlib import Path
+from typing import Any
+
+from aoc.cache import ParseCache, get_shared_modules
+from aoc.days import PARTS, Day, load_module
+from aoc.runner import DayResult, PartResult, RunOptions, run_day
+from aoc.sandbox import CONTEXT
+
+DEFAULT_INTERVAL = 0.5
+
+PACKAGE_DIRECTORY = Path(__file__).parent
+
+# Modification time and size of every watched file
+Snapshot = dict[Path, tuple[int, int]]
+
+
+def is_main_guard(node: ast.stmt) -> bool:
+    return isinstance(node, ast.If) and "__name__" in ast.unparse(node.test)
+
+
+def get_parser_source(source: str, name: str) -> str:
+    """The source of a module, without comments, the `__main__` block and the
+    functions that the parser `name` does not call.
+
+    Classes and module level statements are kept whole, as the parsed data may
+    depend on any of them.
+    """
+    tree = ast.parse(source)
+    functions = {
+        node.name: node for node in tree.body if isinstance(node, ast.FunctionDef)
+    }
+    kept = [
+        node
+        for node in tree.body
+        if not isinstance(node, ast.FunctionDef) and not is_main_guard(node)
+    ]
+    pending = [*kept, *([functions[name]] if name in functions else [])]
+    called = {name}
+    while pending:
+        for node in ast.walk(pending.pop()):
+            if (
+                isinstance(node, ast.Name)
+                and node.id in functions
+                and node.id not in called
+            ):
+                called.add(node.id)
+                pending.append(functions[node.id])
+    kept += [node for node in functions.values() if node.name in called]
+    return "\n".join(map(ast.unparse, kept))
+
+
+class ParserCache(ParseCache):
+    """A parse cache surviving the edits of a module outside of its parser."""
+
+    def get_key(self, parser: Callable[[str], Any], input_path: str) -> str:
+        module = sys.modules[parser.__module__]
+        source = Path(module.__file__).read_text()
+        digest = hashlib.sha256()
+        digest.update(f"{sys.version_info[:2]}:{parser.__qualname__}".encode())
+        digest.update(get_parser_source(source, parser.__name__).encode())
+        for shared in get_shared_modules(module):
+            digest.update(Path(shared.__file__).read_bytes())
+        digest.update(Path(input_path).read_bytes())
+        return digest.hexdigest()
+
+
+def serve(days: list[Day], connection: Connection) -> None:
+    """Run the days received as `(day, reload)`, sending back their results."""
+    for day in days:
+        with contextlib.suppress(Exception):  # Reported when the day runs
+            load_module(day)
+    options = RunOptions(parse_cache=ParserCache())
+    while True:
+        try:
+            day, reload = connection.recv()
+        except EOFError:
+            return
+        if reload:
+            sys.modules.pop(day.module_name, None)
+        connection.send(run_day(day, options))
+
+
+class Worker:
+    """The worker process, started again whenever a day kills it, or the shared
+    code changes."""
+
+    def __init__(self, days: list[Day]):
+        self.days = days
+        self.start()
+
+    def start(self) -> None:
+        self.connection, child = CONTEXT.Pipe()
+        self.process = CONTEXT.Process(
+            target=serve, args=(self.days, child), daemon=True
+        )
+        self.process.start()
+        child.close()
+
+    def run(self, day: Day, reload: bool) -> DayResult:
+        try:
+            self.connection.send((day, reload))
+            return self.connection.recv()
+        except (EOFError, BrokenPipeError):
+            self.process.join()
+            error = f"Worker died with exit code {self.process.exitcode}"
+            self.start()
+            return DayResult(day, [PartResult(PARTS[0], error=error)])
+
+    def restart(self) -> None:
+        self.close()
+        self.start()
+
+    def close(self) -> None:
+        self.connection.close()
+        self.process.join()
+
+
+def get_watched_files(day: Day) -> list[Path]:
+    return [day.source, *day.directory.glob("input_part_*.txt")]
+
+
+def take_snapshot(days: Iterable[Day]) -> Snapshot:
+    """The state of the files of the days, and of the `aoc` package."""
+    snapshot = {}
+    paths = [path for day in days for path in get_watched_files(day)]
+    for path in [*paths, *PACKAGE_DIRECTORY.glob("*.py")]:
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+    return snapshot
+
+
+def get_changed_paths(before: Snapshot, after: Snapshot) -> set[Path]:
+    return {
+        path
+        for path in before.keys() | after.keys()
+        if before.get(path) != after.get(path)
+    }
+
+
+def has_shared_changes(before: Snapshot, after: Snapshot) -> bool:
+    changed = get_changed_paths(before, after)
+    return any(path.parent == PACKAGE_DIRECTORY for path in changed)
+
+
+def get_changes(
+    days: Iterable[Day], before: Snapshot, after: Snapshot
+) -> dict[Day, bool]:
+    """The days with a changed file, and whether their source is among them."""
+    changed = get_changed_paths(before, after)
+    changes = {}
+    for day in days:
+        paths = [path for path in changed if path.parent == day.directory]
+        if paths:
+            changes[day] = day.source in paths
+    return changes
@@ -1,76 +1,35 @@
-from enum import Enum
+from aoc.geometry import STEPS, TURN_LEFT, TURN_RIGHT, UP, manhattan
 
+TURNS = {"L": TURN_LEFT, "R": TURN_RIGHT}
 
-class Direction(Enum):
-    UP = 1
-    RIGHT = 2
-    DOWN = 3
-    LEFT = 4
-
-    def rotate(self, rotation: str):
-        if rotation == "L":
-            return Direction((self.value - 1) % 4 or 4)
-        elif rotation == "R":
-            return Direction((self.value + 1) % 4 or 4)
-        return None
-
-    def advance(self, steps: int):
-        if self == Direction.UP:
-            return 0, steps
-        elif self == Direction.DOWN:
-            return 0, -steps
-        elif self == Direction.LEFT:
-            return -steps, 0
-        elif self == Direction.RIGHT:
-            return steps, 0
-
-    def advance_one_step(self):
-        if self == Direction.UP:
-            return 0, 1
-        elif self == Direction.DOWN:
-            return 0, -1
-        elif self == Direction.LEFT:
-            return -1, 0
-        elif self == Direction.RIGHT:
-            return 1, 0
-
-
-class Rotation(Enum):
-    LEFT = "L"
-    RIGHT = "R"
-
-
-def part_one(instructions: list[tuple[Rotation, int]]) -> int:
-    y, x = 0, 0
-    direction = Direction.UP
 
+def part_one(instructions: list[tuple[str, int]]) -> int:
+    position, direction = 0j, UP
     for rotation, steps in instructions:
-        direction = direction.rotate(rotation.value)
-        delta_x, delta_y = direction.advance(steps)
-        y, x = y + delta_y, x + delta_x
-    return y + x
+        direction = TURNS[rotation][direction]
+        position += STEPS[direction] * steps
+    return manhattan(position)
 
 
-def part_two(instructions: list[tuple[Rotation, int]]) -> int:
-    y, x = 0, 0
-    direction = Direction.UP
-    history = {(y, x)}
+def part_two(instructions: list[tuple[str, int]]) -> int:
+    position, direction = 0j, UP
+    history = {position}
 
     for rotation, steps in instructions:
-        direction = direction.rotate(rotation.value)
-        delta_x, delta_y = direction.advance_one_step()
+        direction = TURNS[rotation][direction]
+        step = STEPS[direction]
         for _ in range(steps):
-            y, x = y + delta_y, x + delta_x
-            if (y, x) in history:
-                return y + x
-            history.add((y, x))
+            position += step
+            if position in history:
+                return manhattan(position)
+            history.add(position)
     raise ValueError("No solution found")
 
 
-def parse_input(filename: str) -> list[tuple[Rotation, int]]:
+def parse_input(filename: str) -> list[tuple[str, int]]:
     with open(filename) as f:
         raw_instructions = f.read().split(", ")
-        return [(Rotation(line[0]), int(line[1:])) for line in raw_instructions]
+        return [(line[0], int(line[1:])) for line in raw_instructions]
 
 
 def main():
@@ -53,16 +53,19 @@ def part_two(instructions: list[str]) -> str:
     return get_code(KEYPAD_2, instructions, 2, 0)
 
 
+def parse_input(file_path: str) -> list[str]:
+    with open(file_path) as f:
+        return f.readlines()
+
+
 def main():
-    with open("input_part_1.txt") as f:
-        instructions = f.readlines()
-        result_1 = part_one(instructions)
-        print(f"Result part 1: {result_1}")
-
-    with open("input_part_2.txt") as f:
-        instructions = f.readlines()
-        result_2 = part_two(instructions)
-        print(f"Result part 2: {result_2}")
+    instructions = parse_input("input_part_1.txt")
+    result_1 = part_one(instructions)
+    print(f"Result part 1: {result_1}")
+
+    instructions = parse_input("input_part_2.txt")
+    result_2 = part_two(instructions)
+    print(f"Result part 2: {result_2}")
 
 
 if __name__ == "__main__":
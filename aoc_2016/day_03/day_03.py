@@ -25,18 +25,20 @@ def part_two(triangles: list[Triangle]) -> int:
     return valid_triangles
 
 
-def main():
-    with open("input_part_1.txt") as f:
+def parse_input(file_path: str) -> list[Triangle]:
+    with open(file_path) as f:
         triangles = [s.split() for s in f.readlines()]
-        triangles = [(int(x[0]), int(x[1]), int(x[2])) for x in triangles]
-        result_1 = part_one(triangles)
-        print(f"Result part 1: {result_1}")
+    return [(int(x[0]), int(x[1]), int(x[2])) for x in triangles]
 
-    with open("input_part_2.txt") as f:
-        triangles = [s.split() for s in f.readlines()]
-        triangles = [(int(x[0]), int(x[1]), int(x[2])) for x in triangles]
-        result_2 = part_two(triangles)
-        print(f"Result part 2: {result_2}")
+
+def main():
+    triangles = parse_input("input_part_1.txt")
+    result_1 = part_one(triangles)
+    print(f"Result part 1: {result_1}")
+
+    triangles = parse_input("input_part_2.txt")
+    result_2 = part_two(triangles)
+    print(f"Result part 2: {result_2}")
 
 
 if __name__ == "__main__":
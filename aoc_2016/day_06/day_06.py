@@ -19,16 +19,19 @@ def part_two(message: list[str]) -> str:
     return corrected_message
 
 
+def parse_input(file_path: str) -> list[str]:
+    with open(file_path) as f:
+        return [line.strip() for line in f.readlines()]
+
+
 def main():
-    with open("input_part_1.txt") as f:
-        message = [line.strip() for line in f.readlines()]
-        result_1 = part_one(message)
-        print(f"Result part 1: {result_1}")
-
-    with open("input_part_2.txt") as f:
-        message = [line.strip() for line in f.readlines()]
-        result_2 = part_two(message)
-        print(f"Result part 2: {result_2}")
+    message = parse_input("input_part_1.txt")
+    result_1 = part_one(message)
+    print(f"Result part 1: {result_1}")
+
+    message = parse_input("input_part_2.txt")
+    result_2 = part_two(message)
+    print(f"Result part 2: {result_2}")
 
 
 if __name__ == "__main__":
@@ -2,13 +2,15 @@ import re
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 
+from aoc.grid import Grid
+
 SCREEN_WIDTH: int = 50
 SCREEN_HEIGHT: int = 6
 
 
 class Instruction(ABC):
     @abstractmethod
-    def apply(self, screen: list[list[bool]]) -> None:
+    def apply(self, screen: Grid) -> None:
         raise NotImplementedError()
 
 
@@ -17,10 +19,8 @@ class Rect(Instruction):
     width: int
     height: int
 
-    def apply(self, screen: list[list[bool]]) -> None:
-        for y in range(self.height):
-            for x in range(self.width):
-                screen[y][x] = True
+    def apply(self, screen: Grid) -> None:
+        screen.fill(0, 0, self.width, self.height, 1)
 
 
 @dataclass
@@ -28,8 +28,8 @@ class RotateRow(Instruction):
     y: int
     value: int
 
-    def apply(self, screen: list[list[bool]]) -> None:
-        screen[self.y] = screen[self.y][-self.value :] + screen[self.y][: -self.value]
+    def apply(self, screen: Grid) -> None:
+        screen.rotate_row(self.y, self.value)
 
 
 @dataclass
@@ -37,15 +37,12 @@ class RotateColumn(Instruction):
     x: int
     value: int
 
-    def apply(self, screen: list[list[bool]]) -> None:
-        column = [screen[y][self.x] for y in range(SCREEN_HEIGHT)]
-        column = column[-self.value :] + column[: -self.value]
-        for y in range(SCREEN_HEIGHT):
-            screen[y][self.x] = column[y]
+    def apply(self, screen: Grid) -> None:
+        screen.rotate_column(self.x, self.value)
 
 
-def play_instructions(instructions: list[Instruction]) -> list[list[bool]]:
-    screen = [[False] * SCREEN_WIDTH for _ in range(SCREEN_HEIGHT)]
+def play_instructions(instructions: list[Instruction]) -> Grid:
+    screen = Grid(SCREEN_WIDTH, SCREEN_HEIGHT)
     for instruction in instructions:
         instruction.apply(screen)
     return screen
@@ -53,15 +50,12 @@ def play_instructions(instructions: list[Instruction]) -> list[list[bool]]:
 
 def part_one(instructions: list[Instruction]) -> int:
     screen = play_instructions(instructions)
-    return sum(sum(row) for row in screen)
+    return screen.count(1)
 
 
 def part_two(instructions: list[Instruction]) -> str:
     screen = play_instructions(instructions)
-    output = []
-    for row in screen:
-        output.append("".join("▓" if pixel else " " for pixel in row))
-    return "\n".join(output)
+    return screen.render({0: " ", 1: "▓"})
 
 
 def parse_input(file_path: str) -> list[Instruction]:
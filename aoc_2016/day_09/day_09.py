@@ -23,20 +23,22 @@ def part_one(compressed_file: str) -> int:
 
 def part_two(compressed_file: str) -> int:
     output_len = 0
-    first_parenthesis = compressed_file.find("(")
-    output_len += first_parenthesis
-    idx = first_parenthesis
+    # Markers whose data is being read, as (end of their data, combined repeats),
+    # innermost last. Nested data is weighted instead of decompressed again.
+    scopes = [(len(compressed_file), 1)]
+    idx = 0
 
     while idx < len(compressed_file):
+        while scopes[-1][0] <= idx:
+            scopes.pop()
+        repeats = scopes[-1][1]
         if match := MARKER_PATTERN.match(compressed_file, idx):
             char_nbr = int(match.group(1))
             to_repeat = int(match.group(2))
-            segment = compressed_file[match.end() : match.end() + char_nbr]
-            segment_size = part_two(segment) * to_repeat
-            output_len += segment_size
-            idx = match.end() + char_nbr
+            scopes.append((match.end() + char_nbr, repeats * to_repeat))
+            idx = match.end()
         else:
-            output_len += 1
+            output_len += repeats
             idx += 1
     return output_len
 
@@ -8,6 +8,7 @@ class BotType(enum.Enum):
     BOT = "bot"
     OUTPUT = "output"
 
+
 @dataclass
 class Behavior:
     lower_to: str
@@ -22,7 +23,13 @@ class Bot:
     type: BotType | None = BotType.OUTPUT
 
 
-def part_one(bots: defaultdict[str, Bot], values_to_compare: list[int] | None) -> int | None:
+VALUES_TO_COMPARE = (17, 61)
+
+
+def part_one(
+    bots: defaultdict[str, Bot],
+    values_to_compare: tuple[int, int] | None = VALUES_TO_COMPARE,
+) -> int | None:
     bots_to_process = deque()
     for bot in bots.values():
         if bot.type != BotType.BOT:
@@ -32,7 +39,7 @@ def part_one(bots: defaultdict[str, Bot], values_to_compare: list[int] | None) -
 
     while bots_to_process:
         bot = bots_to_process.popleft()
-        if values_to_compare and sorted(bot.values) == values_to_compare:
+        if values_to_compare and tuple(sorted(bot.values)) == values_to_compare:
             return int(bot.id.split(" ")[1])
         low_value, high_value = sorted(bot.values)
         bot.values.clear()
@@ -49,12 +56,27 @@ def part_one(bots: defaultdict[str, Bot], values_to_compare: list[int] | None) -
 
 def part_two(bots: defaultdict[str, Bot]) -> int:
     part_one(bots, None)
-    return bots["output 0"].values[0] * bots["output 1"].values[0] * bots["output 2"].values[0]
+    return (
+        bots["output 0"].values[0]
+        * bots["output 1"].values[0]
+        * bots["output 2"].values[0]
+    )
+
+
+def clone_input(bots: defaultdict[str, Bot]) -> defaultdict[str, Bot]:
+    """The parts move the values between bots, the behaviors are only read."""
+    clone = defaultdict(bots.default_factory)
+    for bot_id, bot in bots.items():
+        clone[bot_id] = Bot(list(bot.values), bot.id, bot.behavior, bot.type)
+    return clone
 
 
 def parse_input(file_path: str) -> defaultdict[str, Bot]:
     initialization_pattern = re.compile(r"value (\d+) goes to ((?:bot|output) \d+)")
-    behavior_pattern = re.compile(r"((?:bot|output) \d+) gives low to ((?:bot|output) \d+) and high to ((?:bot|output) \d+)")
+    behavior_pattern = re.compile(
+        r"((?:bot|output) \d+) gives low to ((?:bot|output) \d+)"
+        r" and high to ((?:bot|output) \d+)"
+    )
     with open(file_path) as f:
         lines = f.readlines()
 
@@ -74,7 +96,7 @@ def parse_input(file_path: str) -> defaultdict[str, Bot]:
 
 def main():
     instructions = parse_input("input_part_1.txt")
-    result_1 = part_one(instructions, [17, 61])
+    result_1 = part_one(instructions)
     print(f"Result part 1: {result_1}")
 
     instructions = parse_input("input_part_2.txt")
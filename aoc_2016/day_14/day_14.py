@@ -1,62 +1,42 @@
-from dataclasses import dataclass
-from hashlib import md5
+from collections import deque
+from contextlib import closing
 
+from aoc.hashing import mine_repeats
 
-@dataclass(frozen=True)
-class CachedHash:
-    digest: str
-    repeated_char: str | None
+KEY_COUNT = 64
+LOOKAHEAD = 1000
+STRETCH = 2016
 
 
-def get_triple_repeat(digest: str) -> str | None:
-    for idx, char in enumerate(digest[:-2]):
-        if char == digest[idx + 1] == digest[idx + 2]:
-            return char
-    return None
+def compute_key(salt: str, stretch: int) -> int:
+    """Return the index of the last key.
 
+    Only the hashes with a triple are streamed, in index order, and the ones
+    within the next 1000 indices of a candidate are kept for its quintuple.
+    """
+    keys = 0
+    with closing(mine_repeats(salt.encode(), stretch)) as matches:
+        upcoming = deque([next(matches)])
+        while True:
+            index, (triple, _) = upcoming.popleft()
+            while not upcoming or upcoming[-1][0] <= index + LOOKAHEAD:
+                upcoming.append(next(matches))
+            if any(
+                triple in quintuples
+                for other_index, (_, quintuples) in upcoming
+                if other_index <= index + LOOKAHEAD
+            ):
+                keys += 1
+                if keys == KEY_COUNT:
+                    return index
 
-def get_or_compute_hash(
-    cache: dict[int, CachedHash], salt: str, index: int, stretch: bool = False
-) -> CachedHash:
-    if index in cache:
-        return cache[index]
 
-    to_eval = f"{salt}{index}"
-    to_eval_hash = md5(to_eval.encode()).hexdigest()
-    if stretch:
-        for _ in range(2016):
-            to_eval_hash = md5(to_eval_hash.encode()).hexdigest()
-    repeated_char = get_triple_repeat(to_eval_hash)
+def part_one(salt: str) -> int:
+    return compute_key(salt, 0)
 
-    cached_hash = CachedHash(digest=to_eval_hash, repeated_char=repeated_char)
-    cache[index] = cached_hash
-    return cached_hash
 
-
-def is_valid_key(
-    cache: dict[int, CachedHash], salt: str, current_index: int, stretch: bool
-) -> bool:
-    cached_hash = get_or_compute_hash(cache, salt, current_index, stretch)
-    if not cached_hash.repeated_char:
-        return False
-    repeated_char = cached_hash.repeated_char * 5
-    for i in range(current_index + 1, current_index + 1001):
-        other_hash = get_or_compute_hash(cache, salt, i, stretch)
-        if repeated_char in other_hash.digest:
-            return True
-    return False
-
-
-def compute_key(salt: str, stretch: bool) -> int:
-    keys = []
-    cache = dict()
-
-    for i in range(1_000_000_000):  # Arbitrary large number
-        if is_valid_key(cache, salt, i, stretch):
-            keys.append(i)
-            if len(keys) == 64:
-                return i
-    raise ValueError("No valid keys found")
+def part_two(salt: str) -> int:
+    return compute_key(salt, STRETCH)
 
 
 def parse_input(file_path: str) -> str:
@@ -66,11 +46,11 @@ def parse_input(file_path: str) -> str:
 
 def main():
     salt = parse_input("input_part_1.txt")
-    result_1 = compute_key(salt, False)
+    result_1 = part_one(salt)
     print(f"Result part 1: {result_1}")
 
     salt = parse_input("input_part_2.txt")
-    result_2 = compute_key(salt, True)
+    result_2 = part_two(salt)
     print(f"Result part 2: {result_2}")
 
 
@@ -1,5 +1,5 @@
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 
 
 REGEX_DISC = re.compile(
@@ -27,6 +27,20 @@ def solve_day(discs: list[Disc]) -> int:
     raise ValueError("No solution found")
 
 
+def part_one(discs: list[Disc]) -> int:
+    return solve_day(discs)
+
+
+def part_two(discs: list[Disc]) -> int:
+    discs.append(Disc(disc_id=len(discs) + 1, positions=11, current_position=0))
+    return solve_day(discs)
+
+
+def clone_input(discs: list[Disc]) -> list[Disc]:
+    """Both parts move the discs, and part two adds one."""
+    return [replace(disc) for disc in discs]
+
+
 def parse_input(file_path: str) -> list[Disc]:
     with open(file_path) as f:
         lines = f.readlines()
@@ -47,12 +61,11 @@ def parse_input(file_path: str) -> list[Disc]:
 
 def main():
     discs = parse_input("input_part_1.txt")
-    result_1 = solve_day(discs)
+    result_1 = part_one(discs)
     print(f"Result part 1: {result_1}")
 
     discs = parse_input("input_part_2.txt")
-    discs.append(Disc(disc_id=len(discs) + 1, positions=11, current_position=0))
-    result_2 = solve_day(discs)
+    result_2 = part_two(discs)
     print(f"Result part 2: {result_2}")
 
 
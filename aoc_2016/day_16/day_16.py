@@ -53,7 +53,7 @@ def get_checksum(initial_state: int, length: int) -> int:
     return int(checksum, 2)
 
 
-def part_one(initial_state: int, targeted_length: int) -> str:
+def get_disk_checksum(initial_state: int, targeted_length: int) -> str:
     state = initial_state
     state_length = state.bit_length()
 
@@ -75,6 +75,14 @@ def part_one(initial_state: int, targeted_length: int) -> str:
     return bin(checksum)[2:].rjust(int(state_length), "0")
 
 
+def part_one(initial_state: int) -> str:
+    return get_disk_checksum(initial_state, 272)
+
+
+def part_two(initial_state: int) -> str:
+    return get_disk_checksum(initial_state, 35651584)
+
+
 def parse_input(file_path: str) -> int:
     with open(file_path) as f:
         return int(f.readline(), 2)
@@ -82,11 +90,11 @@ def parse_input(file_path: str) -> int:
 
 def main():
     initial_state = parse_input("input_part_1.txt")
-    result_1 = part_one(initial_state, 272)
+    result_1 = part_one(initial_state)
     print(f"Result part 1: {result_1}")
 
     initial_state = parse_input("input_part_2.txt")
-    result_2 = part_one(initial_state, 35651584)
+    result_2 = part_two(initial_state)
     print(f"Result part 2: {result_2}")
 
 
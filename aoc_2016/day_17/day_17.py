@@ -1,81 +1,51 @@
-from collections import deque
-from dataclasses import dataclass
 from hashlib import md5
 
+from aoc.search import bfs, bfs_distances
 
-@dataclass(frozen=True)
-class Node:
-    x: int
-    y: int
-
-
-def get_neighbours(node: Node, history: str):
-    digest = md5(history.encode()).hexdigest().lower()
-    # print(f"D: digest={digest}, history={history}")
-    # print(f"  {digest[0]=}, {digest[1]=}, {digest[2]=}, {digest[3]=}")
-    if digest[0] in "bcdef" and node.y > 0:  # UP
-        yield history + "U", Node(x=node.x, y=node.y - 1)
-    if digest[1] in "bcdef" and node.y < 3:  # DOWN
-        yield history + "D", Node(x=node.x, y=node.y + 1)
-    if digest[2] in "bcdef" and node.x > 0:  # LEFT
-        yield history + "L", Node(x=node.x - 1, y=node.y)
-    if digest[3] in "bcdef" and node.x < 3:  # RIGHT
-        yield history + "R", Node(x=node.x + 1, y=node.y)
-
-
-def reconstruct_path(
-    came_from: dict[Node, Node | None], start: Node, goal: Node
-) -> list[Node]:
-    current = goal
-    path = []
-    while current != start:
-        path.append(current)
-        current = came_from[current]
-    path.append(start)
-    path.reverse()
-    return path
+SIZE = 4
+# Doors are open for the hexadecimal digits b to f
+CLOSED_MAX = 0xA
 
 
-def bfs(start: Node, passcode: str) -> str:
-    frontier = deque()
-    frontier.append((passcode, start))
-    end = Node(x=3, y=3)
+def get_position(path: str) -> tuple[int, int]:
+    return path.count("R") - path.count("L"), path.count("D") - path.count("U")
 
-    while frontier:
-        history, current = frontier.popleft()
-        for neighbour_history, neighbour in get_neighbours(current, history):
-            frontier.append((neighbour_history, neighbour))
-            if neighbour == end:
-                return neighbour_history
-    raise ValueError(f"No path found from {start} to {end}")
 
+def is_vault(path: str) -> bool:
+    return get_position(path) == (SIZE - 1, SIZE - 1)
 
-def bfs_all_path(start: Node, passcode: str) -> int:
-    frontier = deque()
-    frontier.append((passcode, start))
-    end = Node(x=3, y=3)
-    longest_path_length = 0
 
-    while frontier:
-        history, current = frontier.popleft()
+def get_neighbours(path: str, passcode_hash):
+    """States are the paths themselves, since the doors depend on the path.
 
-        for neighbour_history, neighbour in get_neighbours(current, history):
-            if neighbour == end:
-                path_length = len(neighbour_history)
-                if path_length > longest_path_length:
-                    longest_path_length = path_length
-            else:
-                frontier.append((neighbour_history, neighbour))
-    return longest_path_length - len(passcode)
+    Reaching the vault ends a path, so it has no neighbours.
+    """
+    x, y = get_position(path)
+    if (x, y) == (SIZE - 1, SIZE - 1):
+        return
+    path_hash = passcode_hash.copy()
+    path_hash.update(path.encode())
+    digest = path_hash.digest()
+    if digest[0] >> 4 > CLOSED_MAX and y > 0:
+        yield path + "U"
+    if digest[0] & 0xF > CLOSED_MAX and y < SIZE - 1:
+        yield path + "D"
+    if digest[1] >> 4 > CLOSED_MAX and x > 0:
+        yield path + "L"
+    if digest[1] & 0xF > CLOSED_MAX and x < SIZE - 1:
+        yield path + "R"
 
 
 def part_one(passcode: str) -> str:
-    path = bfs(Node(x=0, y=0), passcode)
-    return path[len(passcode) :]
+    passcode_hash = md5(passcode.encode())
+    path, _ = bfs("", lambda p: get_neighbours(p, passcode_hash), is_vault)
+    return path
 
 
 def part_two(passcode: str) -> int:
-    return bfs_all_path(Node(x=0, y=0), passcode)
+    passcode_hash = md5(passcode.encode())
+    paths = bfs_distances("", lambda p: get_neighbours(p, passcode_hash))
+    return max(length for path, length in paths.items() if is_vault(path))
 
 
 def parse_input(file_path: str) -> str:
@@ -1,44 +1,40 @@
-from collections import deque
-from itertools import islice
-
 from typing_extensions import TypeAlias
 
+from aoc.cycles import find_cycle, sum_cycling
+
 SAFE: bool = False
 TRAP: bool = True
 Tile: TypeAlias = bool
 
-
-# From https://docs.python.org/3/library/itertools.html#itertools-recipes
-def sliding_window(iterable, n):
-    """Collect data into overlapping fixed-length chunks or blocks."""
-    # sliding_window('ABCDEFG', 4) → ABCD BCDE CDEF DEFG
-    iterator = iter(iterable)
-    window = deque(islice(iterator, n - 1), maxlen=n)
-    for x in iterator:
-        window.append(x)
-        yield tuple(window)
+# Rows kept while looking for a cycle, which wide rows are unlikely to have
+MAX_CYCLE_ROWS = 4096
 
 
 def get_safe_tile_nbr(first_row: list[Tile], row_nbr: int) -> int:
-    safe_patterns = {
-        (TRAP, TRAP, SAFE),
-        (SAFE, TRAP, TRAP),
-        (TRAP, SAFE, SAFE),
-        (SAFE, SAFE, TRAP),
-    }
-    safe_tile_nbr = sum(1 for tile in first_row if tile == SAFE)
-    old_row = [SAFE] + first_row + [SAFE]
-    new_row: list[Tile] = [SAFE] * len(old_row)
-    for _ in range(row_nbr - 1):
-        for idx, (a, b, c) in enumerate(sliding_window(old_row, 3)):
-            if (a, b, c) in safe_patterns:
-                new_row[idx + 1] = TRAP
-            else:
-                new_row[idx + 1] = SAFE
-                safe_tile_nbr += 1
-
-        for i in range(len(old_row)):
-            old_row[i] = new_row[i]
+    """Rows are ints, with a set bit per trap.
+
+    A tile is a trap when exactly one of its left and right tiles is, as the
+    center tile cancels out of the four trap patterns. Narrow rows repeat
+    quickly, and the rows of the cycle are then summed instead of computed.
+    Past `MAX_CYCLE_ROWS` rows without a cycle, the rest are counted as they
+    are computed, without being kept.
+    """
+    width = len(first_row)
+    mask = (1 << width) - 1
+
+    def step(row: int) -> int:
+        return ((row << 1) ^ (row >> 1)) & mask
+
+    first = sum(1 << idx for idx, tile in enumerate(first_row) if tile == TRAP)
+    cycle, rows = find_cycle(first, step, limit=min(row_nbr, MAX_CYCLE_ROWS))
+    safe_counts = [width - row.bit_count() for row in rows]
+    if cycle is not None or len(rows) == row_nbr:
+        return sum_cycling(safe_counts, cycle, row_nbr)
+    safe_tile_nbr = sum(safe_counts)
+    row = rows[-1]
+    for _ in range(row_nbr - len(rows)):
+        row = step(row)
+        safe_tile_nbr += width - row.bit_count()
     return safe_tile_nbr
 
 
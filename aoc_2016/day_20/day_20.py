@@ -1,5 +1,10 @@
+import random
 from dataclasses import dataclass
 
+from aoc.tokens import read_ints
+
+MAX_IP = 4294967295
+
 
 @dataclass
 class Range:
@@ -45,17 +50,26 @@ def part_two(blacklist: list[Range]) -> int:
     for chunk in blacklist[1:]:
         whitelist_nbr += chunk.start - prev_chunk.end - 1
         prev_chunk = chunk
-    whitelist_nbr += 4294967295 - prev_chunk.end
+    whitelist_nbr += MAX_IP - prev_chunk.end
     return whitelist_nbr
 
 
 def parse_input(file_path: str) -> list[Range]:
-    blacklist = []
-    with open(file_path) as f:
-        for line in f:
-            start, end = map(int, line.strip().split("-"))
-            blacklist.append(Range(start=start, end=end))
-    return blacklist
+    bounds = read_ints(file_path, signed=False)
+    return [
+        Range(start, end) for start, end in zip(bounds[::2], bounds[1::2], strict=True)
+    ]
+
+
+def generate_input(size: int, rng: random.Random) -> str:
+    """Ranges blocking most of the addresses, the lowest one starting at 0."""
+    lines = []
+    for idx in range(size):
+        start = 0 if idx == 0 else rng.randrange(MAX_IP)
+        end = min(MAX_IP, start + rng.randrange(4 * MAX_IP // size))
+        lines.append(f"{start}-{end}")
+    rng.shuffle(lines)
+    return "\n".join(lines) + "\n"
 
 
 def main():
@@ -1,8 +1,9 @@
 import re
-from collections import deque
 from dataclasses import dataclass
 from itertools import chain
 
+from aoc import search
+
 
 @dataclass
 class Point:
@@ -21,9 +22,6 @@ class Node:
     used: int
     available: int
 
-    def copy(self):
-        return Node(self.x, self.y, self.size, self.used, self.available)
-
     def __hash__(self):
         return hash((self.x, self.y, self.size, self.used))
 
@@ -34,54 +32,16 @@ class Grid:
     data_location: Point
     empty_location: Point
 
-    def signature(self: "Grid") -> tuple[int, int, int, int]:
-        return (
-            self.data_location.x,
-            self.data_location.y,
-            self.empty_location.x,
-            self.empty_location.y,
-        )
-
-    def __hash__(self) -> int:
-        return hash(self.signature())
-
-    def __eq__(self, other: "Grid") -> bool:
-        return self.signature() == other.signature()
-
-    def get_new_state(self, from_point: Point, to_point: Point):
-        new_state = self.copy()
-        from_node = new_state.nodes[from_point.y][from_point.x]
-        to_node = new_state.nodes[to_point.y][to_point.x]
+    @property
+    def width(self) -> int:
+        return len(self.nodes[0])
 
-        # move data: from_node -> to_node
-        moved = from_node.used
-        # sanity
-        assert moved <= to_node.available
+    @property
+    def height(self) -> int:
+        return len(self.nodes)
 
-        # apply transfer
-        to_node.used += moved
-        to_node.available -= moved
-        from_node.used = 0
-        from_node.available = from_node.size
-
-        # data location moves with the data source
-        if self.data_location == from_point:
-            new_state.data_location = to_point
-
-        # EMPTY LOCATION: since data moved into the empty (dest == old empty),
-        # the empty relocates to the source cell.
-        if self.empty_location == to_point:
-            new_state.empty_location = from_point
-
-        return new_state
-
-    def copy(self) -> "Grid":
-        new_grid = [[node.copy() for node in line] for line in self.nodes]
-        return Grid(
-            nodes=new_grid,
-            data_location=Point(self.data_location.x, self.data_location.y),
-            empty_location=Point(self.empty_location.x, self.empty_location.y),
-        )
+    def get_index(self, point: Point) -> int:
+        return point.y * self.width + point.x
 
 
 def get_neighbors(grid: Grid, y: int, x: int):
@@ -95,39 +55,49 @@ def get_neighbors(grid: Grid, y: int, x: int):
         yield Point(y=y + 1, x=x)
 
 
-def is_valid_move(from_node: Node, to_node: Node) -> bool:
-    return 0 < from_node.used <= to_node.available
-
+def get_moves(grid: Grid) -> list[list[int]]:
+    """For each node index, the neighbours whose data fits in the empty node.
 
-def bfs(start: Grid, target: Point) -> int:
-    frontier = deque([start])
-    came_from = {start: None}
-    dist = {start: 0}
-
-    while frontier:
-        current_state: Grid = frontier.popleft()
-        if current_state.empty_location == target:
-            return dist[current_state]
-
-        ey, ex = current_state.empty_location.y, current_state.empty_location.x
-        empty_node = current_state.nodes[ey][ex]
-
-        for neighbour in get_neighbors(current_state, ey, ex):
-            neighbour_node = current_state.nodes[neighbour.y][neighbour.x]
-
-            # MOVE DATA neighbour -> empty
-            if is_valid_move(neighbour_node, empty_node):
-                new_state = current_state.get_new_state(
-                    neighbour, current_state.empty_location
-                )
+    Nodes holding more data than the empty node can hold never move, so they
+    act as walls; the data of any other node fits wherever the empty node is.
+    """
+    empty = grid.nodes[grid.empty_location.y][grid.empty_location.x]
+    moves = []
+    for line in grid.nodes:
+        for node in line:
+            moves.append(
+                [
+                    grid.get_index(n)
+                    for n in get_neighbors(grid, node.y, node.x)
+                    if 0 < grid.nodes[n.y][n.x].used <= empty.size
+                ]
+            )
+    return moves
 
-                if new_state not in came_from:
-                    frontier.append(new_state)
-                    # noinspection PyTypeChecker
-                    came_from[new_state] = current_state
-                    dist[new_state] = dist[current_state] + 1
 
-    raise ValueError(f"No path found from {start}")
+def bfs(start: Grid, target: Point) -> int:
+    """Move the empty node next to the data, states packing both locations."""
+    node_count = start.width * start.height
+    moves = get_moves(start)
+
+    def get_next_states(state: int):
+        data, empty = divmod(state, node_count)
+        for neighbour in moves[empty]:
+            # Moving the data into the empty node leaves the neighbour empty
+            new_data = empty if neighbour == data else data
+            yield new_data * node_count + neighbour
+
+    start_state = start.get_index(start.data_location) * node_count + start.get_index(
+        start.empty_location
+    )
+    goal = start.get_index(target)
+    _, steps = search.bfs(
+        start_state,
+        get_next_states,
+        lambda s: s % node_count == goal,
+        size=node_count * node_count,
+    )
+    return steps
 
 
 def part_two(grid: Grid) -> int:
@@ -1,65 +1,31 @@
-from collections import deque
-from dataclasses import dataclass
 from itertools import permutations
-from typing import TypeAlias
 
-Grid: TypeAlias = list[list[bool]]
+from aoc.grid import Grid
+from aoc.search import bfs_distances
 
+WALL = ord("#")
 
-@dataclass(frozen=True)
-class Node:
-    x: int
-    y: int
 
-
-def get_neighbours(grid: Grid, node: Node):
-    if not grid[node.y - 1][node.x]:
-        yield Node(x=node.x, y=node.y - 1)
-    if not grid[node.y + 1][node.x]:
-        yield Node(x=node.x, y=node.y + 1)
-    if not grid[node.y][node.x + 1]:
-        yield Node(x=node.x + 1, y=node.y)
-    if not grid[node.y][node.x - 1]:
-        yield Node(x=node.x - 1, y=node.y)
-
-
-def get_path_length(came_from: dict[Node, Node | None], start: Node, goal: Node) -> int:
-    length = 0
-    current = goal
-    while current != start:
-        length += 1
-        current = came_from[current]
-    return length
-
-
-def bfs(grid: Grid, start: Node, goal: Node) -> int:
-    frontier = deque()
-    frontier.append(start)
-    came_from = dict()
-    came_from[start] = None
-
-    while frontier:
-        current: Node = frontier.popleft()
-        for neighbour in get_neighbours(grid, current):
-            if neighbour not in came_from:
-                frontier.append(neighbour)
-                came_from[neighbour] = current
-                if neighbour == goal:
-                    return get_path_length(came_from, start, goal)
-    raise ValueError(f"No path found from {start} to {goal}")
+def get_neighbours(grid: Grid, position: int):
+    """Positions are cell indices; the maze border is a wall, so none wraps."""
+    for neighbour in (
+        position - grid.width,
+        position + grid.width,
+        position + 1,
+        position - 1,
+    ):
+        if grid.cells[neighbour] != WALL:
+            yield neighbour
 
 
 def get_min_path_len(
-    grid: Grid, objectives: list[Node], start: Node, part_two: bool
+    grid: Grid, objectives: list[int], start: int, part_two: bool
 ) -> int:
-    path_lengths = {o: dict() for o in objectives}
-
-    # Compute all path between objectives
-    for idx, objective_a in enumerate(objectives):
-        for objective_b in objectives[idx + 1 :]:
-            path_len = bfs(grid, objective_a, objective_b)
-            path_lengths[objective_a][objective_b] = path_len
-            path_lengths[objective_b][objective_a] = path_len
+    # One search from each objective gives its distance to all the others
+    path_lengths = {}
+    for objective in objectives:
+        distances = bfs_distances(objective, lambda p: get_neighbours(grid, p))
+        path_lengths[objective] = {o: distances[o] for o in objectives}
 
     # Find the combination with the smallest length
     min_path_length = float("inf")
@@ -75,38 +41,36 @@ def get_min_path_len(
     return min_path_length
 
 
-def parse_input(file_path: str) -> tuple[Grid, list[Node], Node]:
-    grid = list()
-    objectives = list()
-    start = None
-    with open(file_path) as f:
-        lines = f.readlines()
-    for y, line in enumerate(lines):
-        new_line = list()
-        for x, c in enumerate(line):
-            if c == "0":
-                start = Node(x=x, y=y)
-                objectives.append(Node(x=x, y=y))
-            elif c == "#":
-                new_line.append(True)
-            else:
-                new_line.append(False)
-                if c.isdigit():
-                    objectives.append(Node(x=x, y=y))
-        if new_line:
-            grid.append(new_line)
-    if start is None:
+def part_one(grid: Grid, objectives: list[int], start: int) -> int:
+    return get_min_path_len(grid, objectives, start, False)
+
+
+def part_two(grid: Grid, objectives: list[int], start: int) -> int:
+    return get_min_path_len(grid, objectives, start, True)
+
+
+def clone_input(
+    data: tuple[Grid, list[int], int],
+) -> tuple[Grid, list[int], int]:
+    return data  # The parts only read the maze
+
+
+def parse_input(file_path: str) -> tuple[Grid, list[int], int]:
+    with open(file_path, "rb") as f:
+        grid = Grid.from_bytes(f.read())
+    objectives = [idx for idx, c in enumerate(grid.cells) if chr(c).isdigit()]
+    start = grid.cells.find(b"0")
+    if start == -1:
         raise Exception("Could not find start")
     return grid, objectives, start
 
 
 def main():
     grid, objectives, start = parse_input("input_part_1.txt")
-    result_1 = get_min_path_len(grid, objectives, start, False)
+    result_1 = part_one(grid, objectives, start)
     print(f"Result part 1: {result_1}")
 
-    grid, objectives, start = parse_input("input_part_1.txt")
-    result_2 = get_min_path_len(grid, objectives, start, True)
+    result_2 = part_two(grid, objectives, start)
     print(f"Result part 2: {result_2}")
 
 
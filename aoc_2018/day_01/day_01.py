@@ -1,22 +1,47 @@
+from collections import defaultdict
+from itertools import accumulate, pairwise
+
+from aoc.tokens import read_ints
+
+
 def part_one(changes: list[int]) -> int:
     return sum(changes)
 
 
 def part_two(changes: list[int]) -> int:
-    frequency_history = {0}
-    frequency = 0
-    for _ in range(1_000_000):  # Arbitrary high number
-        for change in changes:
-            frequency += change
-            if frequency in frequency_history:
-                return frequency
-            frequency_history.add(frequency)
-    raise ValueError("No solution found for part two")
+    frequencies = list(accumulate(changes))
+    seen = {0}
+    for frequency in frequencies:
+        if frequency in seen:
+            return frequency
+        seen.add(frequency)
+    if not changes:
+        raise ValueError("No solution found for part two")
+
+    # Otherwise, the frequencies of the k-th pass are the ones of the first pass
+    # shifted by k times the drift of a pass. A frequency comes back when the
+    # closest one behind it, equal to it modulo the drift, catches up with it.
+    drift = frequencies[-1]
+    groups = defaultdict(list)
+    for frequency in sorted(seen, reverse=drift < 0):
+        groups[frequency % drift].append(frequency)
+    next_frequencies = {}
+    for group in groups.values():
+        next_frequencies.update(pairwise(group))
+
+    # First by number of passes, then by position in the pass
+    first_repeat = None
+    for idx, frequency in enumerate(frequencies):
+        if (target := next_frequencies.get(frequency)) is not None:
+            repeat = ((target - frequency) // drift, idx, target)
+            first_repeat = min(first_repeat or repeat, repeat)
+    if first_repeat is None:
+        raise ValueError("No solution found for part two")
+    return first_repeat[2]
 
 
 def parse_input(filename: str) -> list[int]:
-    with open(filename) as f:
-        return [int(n) for n in f.readlines()]
+    return read_ints(filename)
 
 
 def main():
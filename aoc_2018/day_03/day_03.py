@@ -1,6 +1,12 @@
+import random
 import re
 from dataclasses import dataclass
 
+from aoc.grid import Grid
+
+# Count claims per square inch, saturating at 2 since only overlaps matter
+ADD_CLAIM = bytes([1, 2, 2]) + bytes(253)
+
 
 @dataclass
 class Claim:
@@ -22,15 +28,10 @@ class Claim:
 def part_one(claims: list[Claim]) -> int:
     max_y = max([c.y + c.height for c in claims])
     max_x = max([c.x + c.width for c in claims])
-    grid = [[0 for _ in range(max_x)] for _ in range(max_y)]
+    grid = Grid(max_x, max_y)
     for claim in claims:
-        for y in range(claim.y, claim.y + claim.height):
-            for x in range(claim.x, claim.x + claim.width):
-                grid[y][x] += 1
-    counter = 0
-    for row in grid:
-        counter += sum(1 for c in row if c >= 2)
-    return counter
+        grid.translate(claim.x, claim.y, claim.width, claim.height, ADD_CLAIM)
+    return grid.count(2)
 
 
 def part_two(claims: list[Claim]) -> int:
@@ -58,6 +59,18 @@ def parse_input(filename: str) -> list[Claim]:
     return claims
 
 
+def generate_input(size: int, rng: random.Random) -> str:
+    """Claims on a fabric growing with `size`, plus one claim overlapping none."""
+    side = 100 + 10 * int(size**0.5)
+    lines = []
+    for claim_id in range(1, size):
+        x, y = rng.randrange(side), rng.randrange(side)
+        width, height = rng.randint(1, 30), rng.randint(1, 30)
+        lines.append(f"#{claim_id} @ {x},{y}: {width}x{height}")
+    lines.append(f"#{size} @ {side + 30},{side + 30}: 10x10")
+    return "\n".join(lines) + "\n"
+
+
 def main():
     claims = parse_input("input_part_1.txt")
     result_1 = part_one(claims)
@@ -24,7 +24,9 @@ def part_one(nodes: dict[str, Node]) -> str:
     return "".join(stack)
 
 
-def part_two(nodes: dict[str, Node], nodes_oder: str) -> int:
+def part_two(nodes: dict[str, Node], nodes_oder: str | None = None) -> int:
+    if nodes_oder is None:
+        nodes_oder = part_one(nodes)
     elapsed_time = -1
     nodes_progression = {n: ord(n) - 64 + 60 for n in nodes_oder}
     workers = {i: None for i in range(5)}
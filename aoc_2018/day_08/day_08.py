@@ -1,6 +1,8 @@
-import contextlib
 from dataclasses import dataclass, field
 
+from aoc.tokens import read_ints
+from aoc.traversal import fold_tree, post_order
+
 
 @dataclass
 class Node:
@@ -10,38 +12,31 @@ class Node:
     metadata_list: list[int] = field(default_factory=list)
 
 
-def get_next_node(tree: list[int]) -> tuple[Node, int]:
-    children_nbr = tree[0]
-    metadata_nbr = tree[1]
-    current_idx = 2
-    node = Node(children_nbr, metadata_nbr)
-
-    for _ in range(children_nbr):
-        new_node, offset = get_next_node(tree[current_idx:])
-        node.children.append(new_node)
-        current_idx += offset
-
-    for _ in range(metadata_nbr):
-        node.metadata_list.append(tree[current_idx])
-        current_idx += 1
-
-    return node, current_idx
-
-
 def get_all_nodes(tree: list[int]) -> list[Node]:
     current_idx = 0
     nodes = []
+    # Nodes whose children are still being read, innermost last
+    stack: list[Node] = []
     while current_idx < len(tree):
-        new_node, offset = get_next_node(tree[current_idx:])
-        nodes.append(new_node)
-        current_idx += offset
+        node = Node(tree[current_idx], tree[current_idx + 1])
+        current_idx += 2
+        (stack[-1].children if stack else nodes).append(node)
+        stack.append(node)
+        # The metadata of a node follows its last child
+        while stack and len(stack[-1].children) == stack[-1].children_nbr:
+            node = stack.pop()
+            end_idx = current_idx + node.metadata_nbr
+            node.metadata_list = tree[current_idx:end_idx]
+            current_idx = end_idx
     return nodes
 
 
+def get_children(node: Node) -> list[Node]:
+    return node.children
+
+
 def get_metadata_sum(node: Node) -> int:
-    metadata_sum = sum(node.metadata_list)
-    metadata_sum += sum(get_metadata_sum(child) for child in node.children)
-    return metadata_sum
+    return sum(sum(n.metadata_list) for n in post_order(node, get_children))
 
 
 def part_one(tree: list[int]) -> int:
@@ -49,14 +44,18 @@ def part_one(tree: list[int]) -> int:
     return sum(get_metadata_sum(n) for n in nodes)
 
 
-def get_metadata_sum_part_2(node: Node) -> int:
+def get_value(node: Node, children_values: list[int]) -> int:
     if node.children_nbr == 0:
         return sum(node.metadata_list)
-    metadata_sum = 0
-    for metadata in node.metadata_list:
-        with contextlib.suppress(IndexError):
-            metadata_sum += get_metadata_sum_part_2(node.children[metadata - 1])
-    return metadata_sum
+    return sum(
+        children_values[metadata - 1]
+        for metadata in node.metadata_list
+        if 0 < metadata <= node.children_nbr
+    )
+
+
+def get_metadata_sum_part_2(node: Node) -> int:
+    return fold_tree(node, get_children, get_value)
 
 
 def part_two(tree: list[int]) -> int:
@@ -65,8 +64,7 @@ def part_two(tree: list[int]) -> int:
 
 
 def parse_input(filename: str) -> list[int]:
-    with open(filename) as f:
-        return list(map(int, f.readline().split()))
+    return read_ints(filename)
 
 
 def main():
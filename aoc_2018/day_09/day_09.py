@@ -1,3 +1,4 @@
+import random
 import re
 from collections import defaultdict, deque
 
@@ -34,6 +35,10 @@ def parse_input(filename: str) -> tuple[int, int]:
         return int(result[0]), int(result[1])
 
 
+def generate_input(size: int, rng: random.Random) -> str:
+    return f"{rng.randint(9, 500)} players; last marble is worth {size} points\n"
+
+
 def main():
     players, last_marble = parse_input("input_part_1.txt")
     result_1 = part_one(players, last_marble)
@@ -60,6 +60,14 @@ def part_one_and_two(points: list[Point]) -> tuple[str, int]:
     return render([(p.x, p.y) for p in points]), found_at
 
 
+def part_one(points: list[Point]) -> str:
+    return part_one_and_two(points)[0]
+
+
+def part_two(points: list[Point]) -> int:
+    return part_one_and_two(points)[1]
+
+
 def parse_input(filename: str) -> list[Point]:
     pattern = re.compile(
         r"\s*position=<\s*(-?\d+),\s*(-?\d+)>\s+velocity=<\s*(-?\d+),\s*(-?\d+)>\s*"
@@ -1,213 +1,106 @@
-from dataclasses import dataclass
-from enum import Enum
+from operator import attrgetter
+
+from aoc.geometry import (
+    BACKSLASH,
+    DIRECTIONS,
+    SLASH,
+    STRAIGHT,
+    TURN_LEFT,
+    TURN_RIGHT,
+    get_steps,
+)
+from aoc.grid import Grid
+
+# Tables of the new direction, by track tile and current direction
+TILE_TURNS = {ord("/"): SLASH, ord("\\"): BACKSLASH}
+INTERSECTION = ord("+")
+# Turns taken at intersections, one after the other
+INTERSECTION_TURNS = (TURN_LEFT, STRAIGHT, TURN_RIGHT)
+# Track under the carts of the input
+CART_TRACKS = {"^": "|", "v": "|", "<": "-", ">": "-"}
 
 
-class Intersection(Enum):
-    LEFT = 1
-    STRAIGHT = 2
-    RIGHT = 3
-
-    def get_next_intersection(self) -> "Intersection":
-        if self == Intersection.LEFT:
-            return Intersection.STRAIGHT
-        elif self == Intersection.STRAIGHT:
-            return Intersection.RIGHT
+class Cart:
+    __slots__ = ("direction", "intersections", "position")
+
+    def __init__(self, position: int, direction: int):
+        self.position = position  # Packed as y * width + x
+        self.direction = direction
+        self.intersections = 0
+
+    def update_position(self, track: Grid, steps: tuple[int, ...]) -> None:
+        self.position += steps[self.direction]
+        tile = track.cells[self.position]
+        if tile == INTERSECTION:
+            turns = INTERSECTION_TURNS[self.intersections % 3]
+            self.direction = turns[self.direction]
+            self.intersections += 1
+        elif (turns := TILE_TURNS.get(tile)) is not None:
+            self.direction = turns[self.direction]
+
+
+def simulate_step(carts: list[Cart], track: Grid) -> tuple[list[Cart], list[int]]:
+    """Move every cart once, in reading order, and remove the ones that crash.
+
+    Return the remaining carts, and the positions of the crashes in order.
+    """
+    carts.sort(key=attrgetter("position"))  # Reading order, as positions are packed
+    steps = get_steps(track.width)
+    occupied = {cart.position: cart for cart in carts}
+    crashes = []
+    for cart in carts:
+        if occupied.get(cart.position) is not cart:
+            continue  # Crashed into before it could move
+        del occupied[cart.position]
+        cart.update_position(track, steps)
+        if cart.position in occupied:
+            del occupied[cart.position]
+            crashes.append(cart.position)
         else:
-            return Intersection.LEFT
-
-
-class Direction(Enum):
-    UP = 1
-    RIGHT = 2
-    DOWN = 3
-    LEFT = 4
-
-    def get_from_intersection(self, intersection: Intersection) -> "Direction":
-        if intersection == Intersection.STRAIGHT:
-            return self
-        elif intersection == Intersection.LEFT:
-            return Direction(((self.value - 2) % 4) + 1)
-        else:  # RIGHT
-            return Direction((self.value % 4) + 1)
-
-
-@dataclass
-class Point:
-    x: int
-    y: int
-
-    def get_from(self, direction: Direction) -> "Point":
-        if direction == Direction.UP:
-            return Point(self.x, self.y - 1)
-        elif direction == Direction.DOWN:
-            return Point(self.x, self.y + 1)
-        elif direction == Direction.LEFT:
-            return Point(self.x - 1, self.y)
-        elif direction == Direction.RIGHT:
-            return Point(self.x + 1, self.y)
-
-    def copy(self) -> "Point":
-        return Point(self.x, self.y)
-
-    def __hash__(self):
-        return hash((self.x, self.y))
+            occupied[cart.position] = cart
+    return list(occupied.values()), crashes
 
-    def __eq__(self, other):
-        return self.x == other.x and self.y == other.y
 
-    def __repr__(self):
-        return f"(x={self.x},y={self.y})"
+def format_position(position: int, track: Grid) -> str:
+    y, x = divmod(position, track.width)
+    return f"{x},{y}"
 
 
-@dataclass
-class Cart:
-    position: Point
-    direction: Direction
-    intersection: Intersection = Intersection.LEFT
-
-    def __repr__(self):
-        return f"Cart({self.position}, {self.direction.name})"
-
-    def update_position(self, lines: list[list[str]]):  # noqa: PLR0912
-        # Move first
-        self.position = self.position.get_from(self.direction)
-
-        # Then handle direction
-        tile = lines[self.position.y][self.position.x]
-        match tile:
-            case "-":
-                pass  # Continue straight on horizontal track
-
-            case "|":
-                pass  # Continue straight on vertical track
-            case "/":
-                match self.direction:
-                    case Direction.LEFT:
-                        self.direction = Direction.DOWN
-                    case Direction.RIGHT:
-                        self.direction = Direction.UP
-                    case Direction.UP:
-                        self.direction = Direction.RIGHT
-                    case Direction.DOWN:
-                        self.direction = Direction.LEFT
-            case "\\":
-                match self.direction:
-                    case Direction.LEFT:
-                        self.direction = Direction.UP
-                    case Direction.RIGHT:
-                        self.direction = Direction.DOWN
-                    case Direction.UP:
-                        self.direction = Direction.LEFT
-                    case Direction.DOWN:
-                        self.direction = Direction.RIGHT
-            case "+":
-                self.direction = self.direction.get_from_intersection(self.intersection)
-                self.intersection = self.intersection.get_next_intersection()
-
-    def copy(self) -> "Cart":
-        return Cart(self.position.copy(), self.direction, self.intersection)
-
-    def __hash__(self):
-        return hash((self.position, self.direction, self.intersection))
-
-
-def simulate_step(
-    carts: list[Cart], lines: list[list[str]]
-) -> tuple[bool, Point | None]:
-    # Sort carts by reading order (top to bottom, left to right)
-    carts.sort(key=lambda c: (c.position.y, c.position.x))
-
-    for cart_idx, cart in enumerate(carts):
-        cart.update_position(lines)
-
-        # Check collision with already-moved carts this step
-        for other_cart in carts[:cart_idx]:
-            if cart.position == other_cart.position:
-                return True, cart.position
-
-        # # Check collision with not-yet-moved carts this step
-        for other_cart in carts[cart_idx + 1 :]:
-            if cart.position == other_cart.position:
-                return True, cart.position
-    return False, None
-
-
-def part_one(carts: list[Cart], lines: list[list[str]]) -> str:
+def part_one(carts: list[Cart], track: Grid) -> str:
     max_steps = 100_000
     for _ in range(max_steps):
-        collision, point = simulate_step(carts, lines)
-        if collision:
-            return f"{point.x},{point.y}"
+        carts, crashes = simulate_step(carts, track)
+        if crashes:
+            return format_position(crashes[0], track)
     return f"No collision found after {max_steps} steps"
 
 
-def simulate_step_with_removal(carts: list[Cart], lines: list[list[str]]) -> list[Cart]:
-    # Sort carts by reading order
-    carts.sort(key=lambda c: (c.position.y, c.position.x))
-
-    crashed = set()
-
-    for cart_idx, cart in enumerate(carts):
-        if cart_idx in crashed:
-            continue
-
-        cart.update_position(lines)
-
-        # Check for collisions with all other carts
-        for other_cart_idx, other_cart in enumerate(carts):
-            if (
-                cart_idx != other_cart_idx
-                and other_cart_idx not in crashed
-                and cart.position == other_cart.position
-            ):
-                # Both carts crash
-                crashed.add(cart_idx)
-                crashed.add(other_cart_idx)
-                break
-
-    # Return non-crashed carts
-    return [cart for i, cart in enumerate(carts) if i not in crashed]
-
-
-def part_two(carts: list[Cart], lines: list[list[str]]) -> str:
+def part_two(carts: list[Cart], track: Grid) -> str:
     max_steps = 100_000
 
     for _ in range(max_steps):
-        carts = simulate_step_with_removal(carts, lines)
+        carts, _ = simulate_step(carts, track)
 
         if len(carts) == 1:
-            last_cart = carts[0]
-            return f"{last_cart.position.x},{last_cart.position.y}"
+            return format_position(carts[0].position, track)
         elif len(carts) == 0:
             return "All carts crashed!"
 
     return f"Timeout after {max_steps} steps"
 
 
-def parse_input(filename: str) -> tuple[list[Cart], list[list[str]]]:
-    carts = []
-    lines = []
+def parse_input(filename: str) -> tuple[list[Cart], Grid]:
     with open(filename) as f:
-        for y, line in enumerate(f.readlines()):
-            new_line = []
-            for x, char in enumerate(line):
-                match char:
-                    case ">":
-                        carts.append(Cart(Point(x, y), Direction.RIGHT))
-                        new_line.append("-")
-                    case "^":
-                        carts.append(Cart(Point(x, y), Direction.UP))
-                        new_line.append("|")
-                    case "v":
-                        carts.append(Cart(Point(x, y), Direction.DOWN))
-                        new_line.append("|")
-                    case "<":
-                        carts.append(Cart(Point(x, y), Direction.LEFT))
-                        new_line.append("-")
-                    case _:
-                        new_line.append(char)
-            lines.append(new_line)
-    return carts, lines
+        lines = f.read().rstrip("\n").split("\n")
+    width = max(map(len, lines))
+    carts = []
+    rows = []
+    for y, line in enumerate(lines):
+        for x, char in enumerate(line):
+            if char in CART_TRACKS:
+                carts.append(Cart(y * width + x, DIRECTIONS[char]))
+        rows.append(line.translate(str.maketrans(CART_TRACKS)).ljust(width))
+    return carts, Grid(width, len(rows), "".join(rows).encode())
 
 
 def main():
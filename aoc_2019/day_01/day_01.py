@@ -1,3 +1,8 @@
+import random
+
+from aoc.tokens import read_ints
+
+
 def part_one(masses: list[int]) -> int:
     return sum(mass // 3 - 2 for mass in masses)
 
@@ -15,8 +20,11 @@ def part_two(masses: list[int]) -> int:
 
 
 def parse_input(filename: str) -> list[int]:
-    with open(filename) as f:
-        return [int(line) for line in f.readlines()]
+    return read_ints(filename)
+
+
+def generate_input(size: int, rng: random.Random) -> str:
+    return "".join(f"{rng.randint(50_000, 150_000)}\n" for _ in range(size))
 
 
 def main():
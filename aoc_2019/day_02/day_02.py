@@ -1,54 +1,39 @@
-def process(intcode: list[int]):
-    instruction_ptr = 0
+from array import array
 
-    while True:
-        value = intcode[instruction_ptr]
-        match value:
-            case 1:
-                pos_a = intcode[instruction_ptr + 1]
-                pos_b = intcode[instruction_ptr + 2]
-                output = intcode[instruction_ptr + 3]
-                intcode[output] = intcode[pos_a] + intcode[pos_b]
-            case 2:
-                pos_a = intcode[instruction_ptr + 1]
-                pos_b = intcode[instruction_ptr + 2]
-                output = intcode[instruction_ptr + 3]
-                intcode[output] = intcode[pos_a] * intcode[pos_b]
-            case 99:
-                break
-            case _:
-                raise ValueError(f"Invalid opcode: {value}")
-        instruction_ptr += 4
+from aoc.intcode import Machine, parse_program
 
 
-def part_one(intcode: list[int]) -> int | None:
-    intcode[1] = 12
-    intcode[2] = 2
+def part_one(intcode: array) -> int | None:
+    machine = Machine(intcode)
+    machine.memory[1] = 12
+    machine.memory[2] = 2
     try:
-        process(intcode)
+        machine.run()
     except (ValueError, IndexError):
         return None
-    return intcode[0]
+    return machine.memory[0]
 
 
-def part_two(intcode: list[int]) -> int | None:
+def part_two(intcode: array) -> int | None:
+    machine = Machine(intcode)
+    initial_state = machine.snapshot()
     for noun in range(100):
         for verb in range(100):
-            intcode_cpy = intcode.copy()
-            intcode_cpy[1] = noun
-            intcode_cpy[2] = verb
+            machine.restore(initial_state)
+            machine.memory[1] = noun
+            machine.memory[2] = verb
             try:
-                process(intcode_cpy)
+                machine.run()
             except (ValueError, IndexError):
                 return None
-            if intcode_cpy[0] == 19690720:
+            if machine.memory[0] == 19690720:
                 return 100 * noun + verb
     raise ValueError("No solution found for part two")
 
 
-def parse_input(filename: str) -> list[int]:
-    with open(filename) as f:
-        return [int(c) for c in f.readline().split(",")]
+def parse_input(filename: str) -> array:
+    with open(filename, "rb") as f:
+        return parse_program(f.readline())
 
 
 def main():
@@ -1,57 +1,37 @@
-import sys
-from dataclasses import dataclass
+from aoc.geometry import DIRECTIONS, STEPS, manhattan
 
 
-@dataclass
-class Point:
-    x: int
-    y: int
+def part_one(path_a: list[complex], path_b: list[complex]) -> int:
+    intersections = (set(path_a) & set(path_b)) ^ {0}
+    return min(manhattan(p) for p in intersections)
 
-    def manhattan_distance(self, other: "Point") -> int:
-        return abs(self.x - other.x) + abs(self.y - other.y)
 
-    def __hash__(self) -> int:
-        return hash((self.x, self.y))
+def get_first_steps(path: list[complex]) -> dict[complex, int]:
+    """The number of steps to every point, the first time the path reaches it."""
+    steps = {}
+    for step, point in enumerate(path):
+        steps.setdefault(point, step)
+    return steps
 
 
-def part_one(path_a: list[Point], path_b: list[Point]) -> int:
-    origin = Point(0, 0)
-    intersections = (set(path_a) & set(path_b)) ^ {origin}
-    return min(origin.manhattan_distance(p) for p in intersections)
+def part_two(path_a: list[complex], path_b: list[complex]) -> int:
+    steps_a, steps_b = get_first_steps(path_a), get_first_steps(path_b)
+    intersections = (steps_a.keys() & steps_b.keys()) - {0}
+    return min(steps_a[point] + steps_b[point] for point in intersections)
 
 
-def part_two(path_a: list[Point], path_b: list[Point]) -> int:
-    intersections = (set(path_a) & set(path_b)) ^ {Point(0, 0)}
-    min_distance = sys.maxsize
-    for point in intersections:
-        distance = path_a.index(point) + path_b.index(point)
-        min_distance = min(min_distance, distance)
-    return min_distance
-
-
-def get_path_from_line(line: str) -> list[Point]:
-    origin = Point(0, 0)
-    last_point = origin
-    points = [origin]
-    deltas = {
-        "U": (0, -1),
-        "D": (0, 1),
-        "L": (-1, 0),
-        "R": (1, 0),
-    }
-
+def get_path_from_line(line: str) -> list[complex]:
+    position = 0j
+    points = [position]
     for move in line.split(","):
-        direction = move[0]
-        distance = int(move[1:])
-        delta_x, delta_y = deltas[direction]
-        for _ in range(distance):
-            new_point = Point(last_point.x + delta_x, last_point.y + delta_y)
-            points.append(new_point)
-            last_point = new_point
+        step = STEPS[DIRECTIONS[move[0]]]
+        for _ in range(int(move[1:])):
+            position += step
+            points.append(position)
     return points
 
 
-def parse_input(filename: str) -> tuple[list[Point], list[Point]]:
+def parse_input(filename: str) -> tuple[list[complex], list[complex]]:
     with open(filename) as f:
         lines = f.readlines()
         return get_path_from_line(lines[0]), get_path_from_line(lines[1])
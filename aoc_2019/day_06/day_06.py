@@ -1,47 +1,42 @@
-from collections import defaultdict, deque
+from collections import defaultdict
 
+from aoc.search import bidirectional_bfs
+from aoc.traversal import fold_tree
 
-def count_orbits(orbits: dict[str, list[str]], current_orbit: str, dist: int) -> int:
-    count = dist
-    for orbit in orbits.get(current_orbit, []):
-        count += count_orbits(orbits, orbit, dist + 1)
-    return count
 
+def count_orbits(orbits: dict[str, list[str]], current_orbit: str) -> int:
+    def get_children(orbit: str) -> list[str]:
+        return orbits.get(orbit, [])
 
-def part_one(orbits: dict[str, list[str]]) -> int:
-    return count_orbits(orbits, "COM", 0)
-
+    # (objects in the subtree, orbits of those objects around the subtree root)
+    def combine(orbit: str, children: list[tuple[int, int]]) -> tuple[int, int]:
+        return (
+            1 + sum(size for size, _ in children),
+            sum(size + count for size, count in children),
+        )
 
-def get_path_len(came_from: dict[str, str | None], orbit: str | None) -> int:
-    path = 0
-    while orbit:
-        path += 1
-        orbit = came_from[orbit]
-    return path - 3  # We remove the goal, end, and extra step
+    return fold_tree(current_orbit, get_children, combine)[1]
 
 
-def bfs(orbits: dict[str, list[str]], start: str, goal: str) -> int:
-    queue = deque([start])
-    came_from: dict[str, str | None] = {start: None}
-    while queue:
-        current_orbit = queue.popleft()
-        if current_orbit == goal:
-            return get_path_len(came_from, current_orbit)
-        for orbit in orbits.get(current_orbit, []):
-            if orbit not in came_from:
-                came_from[orbit] = current_orbit
-                queue.append(orbit)
-    raise ValueError("No path found")
+def part_one(orbits: dict[str, list[str]]) -> int:
+    return count_orbits(orbits, "COM")
 
 
 def part_two(orbits: dict[str, list[str]]) -> int:
-    two_way_dict = defaultdict(list)
+    # Objects are numbered, so the search hashes ints instead of names
+    ids = {}
+    neighbours: list[list[int]] = []
     for key, value in orbits.items():
         for orbit in value:
-            two_way_dict[key].append(orbit)
-            two_way_dict[orbit].append(key)
-
-    return bfs(two_way_dict, "YOU", "SAN")
+            for name in (key, orbit):
+                if name not in ids:
+                    ids[name] = len(neighbours)
+                    neighbours.append([])
+            neighbours[ids[key]].append(ids[orbit])
+            neighbours[ids[orbit]].append(ids[key])
+
+    # Transfers go between the objects YOU and SAN orbit, not YOU and SAN
+    return bidirectional_bfs(ids["YOU"], ids["SAN"], neighbours.__getitem__) - 2
 
 
 def parse_input(filename: str) -> dict[str, list[str]]:
@@ -1,3 +1,4 @@
+import random
 from typing import TypeAlias
 
 FreshIngredientRange: TypeAlias = tuple[int, int]
@@ -36,6 +37,21 @@ def parse_input(filename: str) -> tuple[list[FreshIngredientRange], list[int]]:
     return fresh_ranges, ingredients
 
 
+def parse_input_part_2(filename: str) -> list[FreshIngredientRange]:
+    fresh_ranges, _ = parse_input(filename)
+    return fresh_ranges
+
+
+def generate_input(size: int, rng: random.Random) -> str:
+    """`size` fresh ranges, which often overlap, and `size` ingredients."""
+    ranges = []
+    for _ in range(size):
+        start = rng.randrange(10**12)
+        ranges.append(f"{start}-{start + rng.randrange(10**10)}")
+    ingredients = [str(rng.randrange(10**12)) for _ in range(size)]
+    return "\n".join(ranges) + "\n\n" + "\n".join(ingredients) + "\n"
+
+
 def main():
     fresh_ranges, ingredients = parse_input("input_part_1.txt")
     result_1 = part_one(fresh_ranges, ingredients)
@@ -16,6 +16,14 @@ def solve_problems(problems_values: list[list[int]], operators: list[str]) -> in
     return total_answers
 
 
+def part_one(problems_values: list[list[int]], operators: list[str]) -> int:
+    return solve_problems(problems_values, operators)
+
+
+def part_two(problems_values: list[list[int]], operators: list[str]) -> int:
+    return solve_problems(problems_values, operators)
+
+
 def parse_input_part_1(filename: str) -> tuple[list[list[int]], list[str]]:
     problem_values = []
     with open(filename) as f:
@@ -56,11 +64,11 @@ def parse_input_part_2(filename: str) -> tuple[list[list[int]], list[str]]:
 
 def main():
     problems_values, operators = parse_input_part_1("input_part_1.txt")
-    result_1 = solve_problems(problems_values, operators)
+    result_1 = part_one(problems_values, operators)
     print(f"Result part 1: {result_1}")
 
     problems_values, operators = parse_input_part_2("input_part_2.txt")
-    result_2 = solve_problems(problems_values, operators)
+    result_2 = part_two(problems_values, operators)
     print(f"Result part 2: {result_2}")
 
 
@@ -1,7 +1,9 @@
-from functools import cache
 from typing import TypeAlias
 
+from aoc.traversal import evaluate_dag
+
 Grid: TypeAlias = tuple[tuple[bool, ...], ...]
+Point: TypeAlias = tuple[int, int]
 EMPTY_SPACE: bool = False
 SPLITTER: bool = True
 
@@ -20,19 +22,21 @@ def part_one(diagram: Grid, start: int) -> int:
     return split_count
 
 
-@cache
 def compute_path(diagram: Grid, point_y: int, point_x: int) -> int:
-    if point_y == len(diagram):
-        return 0
-    timelines = 0
-    if diagram[point_y][point_x] == SPLITTER:
-        timelines += 1
-        timelines += compute_path(diagram, point_y + 1, point_x - 1)
-        timelines += compute_path(diagram, point_y + 1, point_x + 1)
-    else:
-        timelines += compute_path(diagram, point_y + 1, point_x)
-
-    return timelines
+    def get_children(point: Point) -> tuple[Point, ...]:
+        y, x = point
+        if y == len(diagram):
+            return ()
+        if diagram[y][x] == SPLITTER:
+            return (y + 1, x - 1), (y + 1, x + 1)
+        return ((y + 1, x),)
+
+    def combine(point: Point, timelines: list[int]) -> int:
+        y, x = point
+        splits = y < len(diagram) and diagram[y][x] == SPLITTER
+        return splits + sum(timelines)
+
+    return evaluate_dag((point_y, point_x), get_children, combine)
 
 
 def part_two(diagram: Grid, start: int) -> int:
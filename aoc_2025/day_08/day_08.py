@@ -1,25 +1,16 @@
 import math
-from dataclasses import dataclass
+import random
 
-
-@dataclass
-class Point3D:
-    x: int
-    y: int
-    z: int
-
-    def __repr__(self):
-        return f"({self.x}, {self.y}, {self.z})"
-
-    def __hash__(self):
-        return hash((self.x, self.y, self.z))
+from aoc.geometry import Point3D
 
 
 def get_distance(p1: Point3D, p2: Point3D) -> float:
-    return math.sqrt((p2.x - p1.x) ** 2 + (p2.y - p1.y) ** 2 + (p2.z - p1.z) ** 2)
+    return math.dist(p1, p2)
 
 
 class Pair:
+    __slots__ = ("distance", "left", "right")
+
     def __init__(self, a: Point3D, b: Point3D):
         self.left = a
         self.right = b
@@ -106,6 +97,13 @@ def parse_input(filename: str) -> list[Point3D]:
     return points
 
 
+def generate_input(size: int, rng: random.Random) -> str:
+    return "".join(
+        f"{rng.randrange(100_000)},{rng.randrange(100_000)},{rng.randrange(100_000)}\n"
+        for _ in range(size)
+    )
+
+
 def main():
     points = parse_input("input_part_1.txt")
     result_1 = part_one(points)
@@ -1,11 +1,6 @@
 import itertools
-from dataclasses import dataclass
 
-
-@dataclass
-class Point:
-    x: int
-    y: int
+from aoc.geometry import Point
 
 
 def get_rectangle_area(point_a: Point, point_b: Point) -> int:
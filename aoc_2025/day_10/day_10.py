@@ -1,8 +1,7 @@
 import re
-from collections import deque
-from collections.abc import Generator
 from dataclasses import dataclass
-from typing import Any
+
+from aoc.search import bfs
 
 
 @dataclass
@@ -12,24 +11,19 @@ class Machine:
     jolts: list[int]
 
 
-def get_possible_states(light: int, buttons: list[int]) -> Generator[int, Any, None]:
-    for button in buttons:
-        yield light ^ button
-
-
 def get_fewer_presses(machine: Machine) -> int:
-    queue = deque([(0, 0)])
-    visited = {0}
-
-    while queue:
-        state, presses = queue.popleft()
-        if state == machine.light:
-            return presses
-        for new_state in get_possible_states(state, machine.buttons):
-            if new_state not in visited:
-                visited.add(new_state)
-                queue.append((new_state, presses + 1))
-    return -1
+    # Light states are bit masks, so they index a bytearray of visited states
+    light_count = max(b.bit_length() for b in [machine.light, *machine.buttons])
+    try:
+        _, presses = bfs(
+            0,
+            lambda light: (light ^ button for button in machine.buttons),
+            machine.light.__eq__,
+            size=1 << light_count,
+        )
+    except ValueError:
+        return -1  # The buttons cannot reach the light
+    return presses
 
 
 def part_one(machines: list[Machine]) -> int:
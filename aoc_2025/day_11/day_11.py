@@ -1,45 +1,52 @@
-from functools import cache
+from aoc.traversal import evaluate_dag
 
+Devices = dict[str, tuple[str, ...]]
+# Device, and whether the path to it, the device included, went through dac and fft
+State = tuple[str, bool, bool]
 
-def count_paths(devices: dict[str, tuple[str, ...]], start: str, goal: str) -> int:
-    if start == goal:
-        return 1
 
-    return sum(count_paths(devices, device, goal) for device in devices[start])
+def count_paths(devices: Devices, start: str, goal: str) -> int:
+    def get_children(device: str) -> tuple[str, ...]:
+        if device == goal:
+            return ()
+        return devices.get(device, ())
 
+    def combine(device: str, paths: list[int]) -> int:
+        return 1 if device == goal else sum(paths)
 
-def part_one(devices: dict[str, tuple[str, ...]]) -> int:
+    return evaluate_dag(start, get_children, combine)
+
+
+def part_one(devices: Devices) -> int:
     return count_paths(devices, "you", "out")
 
 
-def count_paths_with_dac_and_fft(
-    devices: dict[str, tuple[str, ...]], start: str, goal: str
-) -> int:
-    @cache
-    def count_paths_with_dac_and_fft_cached(
-        start: str, goal: str, saw_dac: bool = False, saw_fft: bool = False
-    ) -> int:
-        if start == "dac":
-            saw_dac = True
-        elif start == "fft":
-            saw_fft = True
-        if start == goal and saw_dac and saw_fft:
-            return 1
-        total = 0
-        for next_device in devices.get(start, []):
-            total += count_paths_with_dac_and_fft_cached(
-                next_device, goal, saw_dac, saw_fft
+def count_paths_with_dac_and_fft(devices: Devices, start: str, goal: str) -> int:
+    def get_children(state: State) -> list[State]:
+        device, saw_dac, saw_fft = state
+        return [
+            (
+                next_device,
+                saw_dac or next_device == "dac",
+                saw_fft or next_device == "fft",
             )
-        return total
+            for next_device in devices.get(device, ())
+        ]
+
+    def combine(state: State, paths: list[int]) -> int:
+        device, saw_dac, saw_fft = state
+        if device == goal and saw_dac and saw_fft:
+            return 1
+        return sum(paths)
 
-    return count_paths_with_dac_and_fft_cached(start, goal)
+    return evaluate_dag((start, start == "dac", start == "fft"), get_children, combine)
 
 
-def part_two(devices: dict[str, tuple[str, ...]]) -> int:
+def part_two(devices: Devices) -> int:
     return count_paths_with_dac_and_fft(devices, "svr", "out")
 
 
-def parse_input(filename: str) -> dict[str, tuple[str, ...]]:
+def parse_input(filename: str) -> Devices:
     devices = dict()
     with open(filename) as f:
         for line in f.readlines():
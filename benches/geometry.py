@@ -0,0 +1,172 @@
+"""Cost of the ways to represent positions and directions in a grid walk.
+
+Every variant walks the same spiral, turning right after each run, and keeps
+every position it visits, as the path-tracing days do. Run with:
+
+    python -m benches.geometry [steps]
+"""
+
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass
+from enum import Enum
+from typing import NamedTuple
+
+from aoc.geometry import DELTAS, STEPS, TURN_RIGHT, UP, get_steps
+
+WIDTH = 1 << 16
+
+
+@dataclass
+class DataclassPoint:
+    x: int
+    y: int
+
+    def __hash__(self) -> int:
+        return hash((self.x, self.y))
+
+
+@dataclass(slots=True, frozen=True)
+class SlottedPoint:
+    x: int
+    y: int
+
+
+class TuplePoint(NamedTuple):
+    x: int
+    y: int
+
+
+class Direction(Enum):
+    UP = (0, -1)
+    RIGHT = (1, 0)
+    DOWN = (0, 1)
+    LEFT = (-1, 0)
+
+    def turn_right(self) -> "Direction":
+        members = list(Direction)
+        return members[(members.index(self) + 1) % 4]
+
+
+def get_runs(steps: int) -> list[int]:
+    """Lengths of the straight runs of a spiral of `steps` steps."""
+    runs = []
+    length = 1
+    while sum(runs) < steps:
+        runs += [length, length]
+        length += 1
+    return runs
+
+
+def walk_dataclass(runs: list[int]) -> list:
+    position, direction, path = DataclassPoint(0, 0), Direction.UP, []
+    for run in runs:
+        for _ in range(run):
+            dx, dy = direction.value
+            position = DataclassPoint(position.x + dx, position.y + dy)
+            path.append(position)
+        direction = direction.turn_right()
+    return path
+
+
+def walk_slotted(runs: list[int]) -> list:
+    position, direction, path = SlottedPoint(0, 0), UP, []
+    for run in runs:
+        dx, dy = DELTAS[direction]
+        for _ in range(run):
+            position = SlottedPoint(position.x + dx, position.y + dy)
+            path.append(position)
+        direction = TURN_RIGHT[direction]
+    return path
+
+
+def walk_named_tuple(runs: list[int]) -> list:
+    position, direction, path = TuplePoint(0, 0), UP, []
+    for run in runs:
+        dx, dy = DELTAS[direction]
+        for _ in range(run):
+            position = TuplePoint(position.x + dx, position.y + dy)
+            path.append(position)
+        direction = TURN_RIGHT[direction]
+    return path
+
+
+def walk_tuple(runs: list[int]) -> list:
+    (x, y), direction, path = (0, 0), UP, []
+    for run in runs:
+        dx, dy = DELTAS[direction]
+        for _ in range(run):
+            x += dx
+            y += dy
+            path.append((x, y))
+        direction = TURN_RIGHT[direction]
+    return path
+
+
+def walk_complex(runs: list[int]) -> list:
+    position, direction, path = 0j, UP, []
+    for run in runs:
+        step = STEPS[direction]
+        for _ in range(run):
+            position += step
+            path.append(position)
+        direction = TURN_RIGHT[direction]
+    return path
+
+
+def walk_packed(runs: list[int]) -> list:
+    # Starting in the middle of the grid keeps the packed positions positive
+    position, direction, path = WIDTH // 2 * (WIDTH + 1), UP, []
+    steps = get_steps(WIDTH)
+    for run in runs:
+        step = steps[direction]
+        for _ in range(run):
+            position += step
+            path.append(position)
+        direction = TURN_RIGHT[direction]
+    return path
+
+
+WALKS: dict[str, Callable[[list[int]], list]] = {
+    "dataclass + Enum": walk_dataclass,
+    "slotted dataclass": walk_slotted,
+    "NamedTuple": walk_named_tuple,
+    "tuple": walk_tuple,
+    "complex": walk_complex,
+    "packed int": walk_packed,
+}
+
+
+def measure(
+    walk: Callable[[list[int]], list], runs: list[int]
+) -> tuple[float, float, float]:
+    """Nanoseconds per step, and memory blocks and bytes retained per visited
+    position."""
+    start = time.perf_counter()
+    path = walk(runs)
+    elapsed = time.perf_counter() - start
+    del path
+
+    tracemalloc.start()
+    path = walk(runs)
+    snapshot = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    statistics = snapshot.statistics("filename")
+    blocks = sum(stat.count for stat in statistics)
+    retained = sum(stat.size for stat in statistics)
+    return elapsed * 1e9 / len(path), blocks / len(path), retained / len(path)
+
+
+def main():
+    steps = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    runs = get_runs(steps)
+    print(f"{'Representation':<20}{'ns/step':>10}{'blocks/step':>13}{'bytes/step':>12}")
+    for name, walk in WALKS.items():
+        per_step, blocks, per_position = measure(walk, runs)
+        print(f"{name:<20}{per_step:>10.0f}{blocks:>13.2f}{per_position:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()